@@ -8,11 +8,12 @@ from app.database import get_db
 from app.models.user import User
 from app.schemas.user import UserCreate, UserLogin, UserResponse, TokenResponse
 from app.utils.auth import (
-    hash_password,
-    verify_password,
+    hash_password_async,
+    verify_and_update_password,
     create_access_token,
     create_refresh_token,
 )
+from app.utils.responses import from_orm, success_response
 
 router = APIRouter(tags=["auth"])
 
@@ -33,7 +34,7 @@ async def register(body: UserCreate, db: AsyncSession = Depends(get_db)):
     user = User(
         email=body.email,
         name=body.name,
-        password_hash=hash_password(body.password),
+        password_hash=await hash_password_async(body.password),
     )
     db.add(user)
     await db.flush()
@@ -44,15 +45,14 @@ async def register(body: UserCreate, db: AsyncSession = Depends(get_db)):
     access_token = create_access_token(token_data)
     refresh_token = create_refresh_token(token_data)
 
-    return {
-        "status": "success",
-        "data": TokenResponse(
-            user=UserResponse.model_validate(user),
+    return success_response(
+        TokenResponse.model_construct(
+            user=from_orm(UserResponse, user),
             access_token=access_token,
             refresh_token=refresh_token,
-        ).model_dump(),
-        "message": None,
-    }
+        ),
+        status_code=status.HTTP_201_CREATED,
+    )
 
 
 @router.post("/login")
@@ -62,22 +62,29 @@ async def login(body: UserLogin, db: AsyncSession = Depends(get_db)):
     result = await db.execute(select(User).where(User.email == body.email))
     user = result.scalar_one_or_none()
 
-    if user is None or not verify_password(body.password, user.password_hash):
+    valid, new_hash = False, None
+    if user is not None:
+        valid, new_hash = await verify_and_update_password(
+            body.password, user.password_hash
+        )
+    if not valid:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="이메일 또는 비밀번호가 올바르지 않습니다",
         )
 
+    # 저장된 해시의 cost가 설정과 다르면 새 해시로 교체한다
+    if new_hash is not None:
+        user.password_hash = new_hash
+
     token_data = {"sub": str(user.id)}
     access_token = create_access_token(token_data)
     refresh_token = create_refresh_token(token_data)
 
-    return {
-        "status": "success",
-        "data": TokenResponse(
-            user=UserResponse.model_validate(user),
+    return success_response(
+        TokenResponse.model_construct(
+            user=from_orm(UserResponse, user),
             access_token=access_token,
             refresh_token=refresh_token,
-        ).model_dump(),
-        "message": None,
-    }
+        )
+    )
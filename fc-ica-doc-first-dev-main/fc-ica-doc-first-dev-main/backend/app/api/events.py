@@ -0,0 +1,112 @@
+"""실시간 이벤트 API 라우터: 프로젝트 이벤트 스트림 (Server-Sent Events)"""
+
+import asyncio
+import time
+import uuid
+from collections.abc import AsyncIterator
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi.responses import StreamingResponse
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+
+from app.config import settings
+from app.database import async_read_session
+from app.events import event_broker
+from app.utils.access import check_project_access, get_project_access
+from app.utils.auth import get_user_from_token, token_expires_at
+
+router = APIRouter(tags=["events"])
+
+# EventSource는 헤더를 설정할 수 없으므로 access_token 쿼리 파라미터도 허용한다.
+# 쿼리 파라미터는 접근 로그에 남을 수 있으므로 Authorization 헤더를 보낼 수 없는 경우의 대체 수단이다
+optional_security = HTTPBearer(auto_error=False)
+
+
+async def _still_allowed(project_id: uuid.UUID, user_id: uuid.UUID) -> bool:
+    """프로젝트가 남아 있고 사용자가 아직 멤버인지 확인한다. (접근 판단 캐시를 사용한다)"""
+    async with async_read_session() as db:
+        access = await get_project_access(project_id, user_id, db)
+    return access.exists and not access.is_deleted and access.is_member
+
+
+async def _event_stream(
+    request: Request,
+    project_id: uuid.UUID,
+    user_id: uuid.UUID,
+    expires_at: float | None,
+) -> AsyncIterator[str]:
+    """구독 버퍼의 이벤트를 SSE 형식으로 내보낸다. 유휴 상태에서는 주기적으로 ping을 보낸다.
+
+    EVENT_HEARTBEAT_SECONDS마다 접근 권한을 다시 확인해, 프로젝트가 삭제됐거나 멤버가 아니게 되면
+    forbidden 이벤트 후 종료한다. 토큰이 만료되면 expired 이벤트 후 종료한다. (새 토큰으로 재연결)
+    """
+    subscription = event_broker.subscribe(project_id)
+    heartbeat = settings.EVENT_HEARTBEAT_SECONDS
+    next_check = time.monotonic() + heartbeat
+    try:
+        yield "retry: 3000\n\n"
+        while True:
+            if subscription.needs_resync:
+                # 버퍼가 넘쳤거나 이벤트가 유실됐을 수 있다: 클라이언트는 목록을 다시 조회해야 한다
+                yield "event: resync\ndata: {}\n\n"
+                return
+            if expires_at is not None and time.time() >= expires_at:
+                yield "event: expired\ndata: {}\n\n"
+                return
+            if time.monotonic() >= next_check:
+                if not await _still_allowed(project_id, user_id):
+                    yield "event: forbidden\ndata: {}\n\n"
+                    return
+                next_check = time.monotonic() + heartbeat
+
+            timeout = heartbeat
+            if expires_at is not None:
+                timeout = max(0.0, min(timeout, expires_at - time.time()))
+            try:
+                item = await asyncio.wait_for(subscription.queue.get(), timeout=timeout)
+            except asyncio.TimeoutError:
+                if await request.is_disconnected():
+                    return
+                yield ": ping\n\n"
+                continue
+            if item is None:
+                continue
+            event_type, payload = item
+            yield f"event: {event_type}\ndata: {payload}\n\n"
+    finally:
+        event_broker.unsubscribe(subscription)
+
+
+@router.get("/projects/{project_id}/events")
+async def stream_project_events(
+    project_id: uuid.UUID,
+    request: Request,
+    access_token: str | None = Query(default=None),
+    credentials: HTTPAuthorizationCredentials | None = Depends(optional_security),
+):
+    """프로젝트의 태스크/멤버 변경 이벤트를 SSE로 스트리밍한다.
+
+    토큰은 Authorization 헤더로 받는다. access_token 쿼리 파라미터는 헤더를 설정할 수 없는
+    EventSource를 위한 대체 수단이며, URL이 접근 로그에 남을 수 있다.
+    인증과 권한 확인에 사용한 DB 커넥션은 스트림을 시작하기 전에 반환한다.
+    스트림은 토큰 만료 시각까지만 유지되고, 접근 권한은 주기적으로 다시 확인한다.
+    """
+    token = credentials.credentials if credentials is not None else access_token
+    if token is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="인증이 필요합니다",
+        )
+    async with async_read_session() as db:
+        user = await get_user_from_token(token, db)
+        await check_project_access(project_id, user.id, db)
+
+    return StreamingResponse(
+        _event_stream(request, project_id, user.id, token_expires_at(token)),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            # 리버스 프록시의 응답 버퍼링을 끈다
+            "X-Accel-Buffering": "no",
+        },
+    )
@@ -2,14 +2,14 @@
 
 import uuid
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy import select, func
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from app.database import get_db
+from app.events import emit_event
 from app.models.project import Project, ProjectMember
-from app.models.task import Task
 from app.models.user import User
 from app.schemas.project import (
     MemberAdd,
@@ -23,7 +23,27 @@ from app.schemas.project import (
     ProjectUpdate,
     TaskSummary,
 )
-from app.utils.auth import get_current_user
+from app.utils.access import check_project_access, invalidate_project_access
+from app.utils.auth import get_current_read_user, get_current_user
+from app.utils.conditional import get_project_validator
+from app.utils.counters import (
+    bump_member_count,
+    get_member_projects_version,
+    init_project_counters,
+    touch_project,
+)
+from app.utils.pagination import decode_cursor, encode_cursor, keyset_condition
+from app.utils.queries import project_count_query, project_page_query
+from app.utils.read_db import get_read_db, release_read_session
+from app.utils.response_cache import (
+    cache_response,
+    get_cached_response,
+    invalidate_project_responses,
+    project_tag,
+    response_cache_key,
+    user_tag,
+)
+from app.utils.responses import from_orm, success_response
 
 router = APIRouter(prefix="/projects", tags=["projects"])
 
@@ -37,11 +57,8 @@ async def _get_project_or_404(
     project_id: uuid.UUID, db: AsyncSession
 ) -> Project:
     """프로젝트를 조회하고, 없거나 삭제됐으면 404를 반환한다."""
-    result = await db.execute(
-        select(Project).where(Project.id == project_id, Project.is_deleted == False)  # noqa: E712
-    )
-    project = result.scalar_one_or_none()
-    if project is None:
+    project = await db.get(Project, project_id)
+    if project is None or project.is_deleted:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="프로젝트를 찾을 수 없습니다",
@@ -49,38 +66,6 @@ async def _get_project_or_404(
     return project
 
 
-async def _check_membership(
-    project_id: uuid.UUID, user_id: uuid.UUID, db: AsyncSession
-) -> ProjectMember:
-    """사용자가 프로젝트 멤버인지 확인하고, 아니면 403을 반환한다."""
-    result = await db.execute(
-        select(ProjectMember).where(
-            ProjectMember.project_id == project_id,
-            ProjectMember.user_id == user_id,
-        )
-    )
-    member = result.scalar_one_or_none()
-    if member is None:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="이 프로젝트에 접근할 권한이 없습니다",
-        )
-    return member
-
-
-async def _check_owner(
-    project_id: uuid.UUID, user_id: uuid.UUID, db: AsyncSession
-) -> ProjectMember:
-    """사용자가 프로젝트 소유자인지 확인하고, 아니면 403을 반환한다."""
-    member = await _check_membership(project_id, user_id, db)
-    if member.role != "owner":
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="프로젝트 소유자만 수행할 수 있습니다",
-        )
-    return member
-
-
 # ────────────────────────────────────────────
 # 프로젝트 CRUD
 # ────────────────────────────────────────────
@@ -109,105 +94,121 @@ async def create_project(
     )
     db.add(member)
     await db.flush()
+    await init_project_counters(db, project.id, member_count=1)
     await db.refresh(project)
+    await invalidate_project_access(db, project.id)
+    await invalidate_project_responses(project.id, current_user.id)
 
-    return {
-        "status": "success",
-        "data": ProjectResponse.model_validate(project).model_dump(),
-        "message": None,
-    }
+    return success_response(
+        from_orm(ProjectResponse, project), status_code=status.HTTP_201_CREATED
+    )
 
 
 @router.get("")
 async def list_projects(
+    request: Request,
     page: int = Query(default=1, ge=1),
     size: int = Query(default=20, ge=1, le=100),
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    cursor: str | None = Query(default=None),
+    include_total: bool = Query(default=True),
+    current_user: User = Depends(get_current_read_user),
+    db: AsyncSession = Depends(get_read_db),
 ):
-    """현재 사용자가 멤버인 프로젝트 목록을 조회한다."""
-
-    # 사용자가 속한 프로젝트 ID 목록
-    member_subq = (
-        select(ProjectMember.project_id)
-        .where(ProjectMember.user_id == current_user.id)
-        .subquery()
+    """현재 사용자가 멤버인 프로젝트 목록을 조회한다.
+
+    cursor가 주어지면 page 대신 커서(keyset) 페이지네이션을 사용한다.
+    """
+    # 멤버인 프로젝트 전체의 변경 표식이 같으면 캐시된 응답을 사용한다
+    fingerprint = await get_member_projects_version(db, current_user.id)
+    cache_key = response_cache_key(
+        "projects", f"{user_tag(current_user.id)}-{fingerprint}", request
     )
-
-    # 총 개수
-    count_stmt = select(func.count()).select_from(
-        select(Project.id)
-        .where(Project.id.in_(select(member_subq.c.project_id)), Project.is_deleted == False)  # noqa: E712
-        .subquery()
-    )
-    total = (await db.execute(count_stmt)).scalar() or 0
-
-    # 프로젝트 목록
-    stmt = (
-        select(Project)
-        .where(Project.id.in_(select(member_subq.c.project_id)), Project.is_deleted == False)  # noqa: E712
-        .order_by(Project.created_at.desc())
-        .offset((page - 1) * size)
-        .limit(size)
-    )
-    result = await db.execute(stmt)
-    projects = result.scalars().all()
-
-    items: list[dict] = []
-    for p in projects:
-        # 멤버 수
-        mc_result = await db.execute(
-            select(func.count()).where(ProjectMember.project_id == p.id)
+    cached = await get_cached_response(cache_key)
+    if cached is not None:
+        await release_read_session(db)
+        return cached
+
+    # 총 개수와 목록 조회가 동일한 멤버십 조건을 공유한다 (app/utils/queries.py)
+    # 총 개수 (선택)
+    total = None
+    if include_total:
+        total = (await db.execute(project_count_query(current_user.id))).scalar() or 0
+
+    # 프로젝트 + 비정규화 카운터를 하나의 쿼리로 조회
+    # (다음 페이지 존재 여부 확인을 위해 size + 1개를 가져온다)
+    stmt = project_page_query(current_user.id, size + 1)
+    if cursor is not None:
+        value, last_id = decode_cursor(cursor, "created_at", "desc")
+        stmt = stmt.where(
+            keyset_condition(Project.created_at, Project.id, value, last_id, descending=True)
         )
-        member_count = mc_result.scalar() or 0
-
-        # 태스크 요약
-        task_counts: dict[str, int] = {"todo": 0, "in_progress": 0, "done": 0}
-        for s in ["TODO", "IN_PROGRESS", "DONE"]:
-            tc_result = await db.execute(
-                select(func.count()).where(
-                    Task.project_id == p.id,
-                    Task.status == s,
-                    Task.is_deleted == False,  # noqa: E712
-                )
-            )
-            key = s.lower()
-            task_counts[key] = tc_result.scalar() or 0
-
-        items.append(
-            ProjectListItem(
-                id=p.id,
-                name=p.name,
-                description=p.description,
-                owner_id=p.owner_id,
-                member_count=member_count,
-                task_summary=TaskSummary(**task_counts),
-                created_at=p.created_at,
-                updated_at=p.updated_at,
-            ).model_dump()
+    else:
+        stmt = stmt.offset((page - 1) * size)
+    result = await db.execute(stmt)
+    rows = result.all()
+    await release_read_session(db)
+
+    next_cursor = None
+    if len(rows) > size:
+        rows = rows[:size]
+        last = rows[-1][0]
+        next_cursor = encode_cursor("created_at", "desc", last.created_at, last.id)
+
+    items = [
+        ProjectListItem.model_construct(
+            id=p.id,
+            name=p.name,
+            description=p.description,
+            owner_id=p.owner_id,
+            member_count=c.member_count if c else 0,
+            task_summary=TaskSummary.model_construct(
+                todo=c.todo_count if c else 0,
+                in_progress=c.in_progress_count if c else 0,
+                done=c.done_count if c else 0,
+            ),
+            created_at=p.created_at,
+            updated_at=p.updated_at,
         )
+        for p, c in rows
+    ]
 
-    return {
-        "status": "success",
-        "data": ProjectListResponse(
-            items=[ProjectListItem(**i) for i in items],
+    response = success_response(
+        ProjectListResponse.model_construct(
+            items=items,
             total=total,
-            page=page,
+            page=page if cursor is None else None,
             size=size,
-        ).model_dump(),
-        "message": None,
-    }
+            next_cursor=next_cursor,
+        )
+    )
+    await cache_response(
+        cache_key,
+        response,
+        [user_tag(current_user.id), *(project_tag(p.id) for p, _ in rows)],
+    )
+    return response
 
 
 @router.get("/{project_id}")
 async def get_project(
     project_id: uuid.UUID,
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    request: Request,
+    current_user: User = Depends(get_current_read_user),
+    db: AsyncSession = Depends(get_read_db),
 ):
-    """프로젝트 상세 정보를 조회한다."""
+    """프로젝트 상세 정보를 조회한다. If-None-Match가 일치하면 304를 반환한다."""
+    await check_project_access(project_id, current_user.id, db)
+    validator = await get_project_validator(db, "project", project_id)
+    if validator is not None and validator.matches(request):
+        await release_read_session(db)
+        return validator.not_modified()
+    if validator is not None:
+        cache_key = response_cache_key("project", validator.etag, request)
+        cached = await get_cached_response(cache_key)
+        if cached is not None:
+            await release_read_session(db)
+            return cached
     project = await _get_project_or_404(project_id, db)
-    await _check_membership(project_id, current_user.id, db)
 
     # 멤버 목록 조회
     result = await db.execute(
@@ -216,9 +217,10 @@ async def get_project(
         .where(ProjectMember.project_id == project_id)
     )
     members_rows = result.scalars().all()
+    await release_read_session(db)
 
     members = [
-        MemberResponse(
+        MemberResponse.model_construct(
             id=m.user.id,
             name=m.user.name,
             email=m.user.email,
@@ -228,9 +230,8 @@ async def get_project(
         for m in members_rows
     ]
 
-    return {
-        "status": "success",
-        "data": ProjectDetailResponse(
+    response = success_response(
+        ProjectDetailResponse.model_construct(
             id=project.id,
             name=project.name,
             description=project.description,
@@ -238,9 +239,12 @@ async def get_project(
             members=members,
             created_at=project.created_at,
             updated_at=project.updated_at,
-        ).model_dump(),
-        "message": None,
-    }
+        )
+    )
+    if validator is not None:
+        validator.apply(response)
+        await cache_response(cache_key, response, [project_tag(project_id)])
+    return response
 
 
 @router.patch("/{project_id}")
@@ -251,21 +255,20 @@ async def update_project(
     db: AsyncSession = Depends(get_db),
 ):
     """프로젝트 정보를 수정한다. (소유자만)"""
+    await check_project_access(project_id, current_user.id, db, owner_only=True)
     project = await _get_project_or_404(project_id, db)
-    await _check_owner(project_id, current_user.id, db)
 
     update_data = body.model_dump(exclude_unset=True)
     for key, value in update_data.items():
         setattr(project, key, value)
 
     await db.flush()
+    await touch_project(db, project_id)
     await db.refresh(project)
+    await invalidate_project_access(db, project_id)
+    await invalidate_project_responses(project_id)
 
-    return {
-        "status": "success",
-        "data": ProjectResponse.model_validate(project).model_dump(),
-        "message": None,
-    }
+    return success_response(from_orm(ProjectResponse, project))
 
 
 @router.delete("/{project_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -275,11 +278,14 @@ async def delete_project(
     db: AsyncSession = Depends(get_db),
 ):
     """프로젝트를 소프트 삭제한다. (소유자만)"""
+    await check_project_access(project_id, current_user.id, db, owner_only=True)
     project = await _get_project_or_404(project_id, db)
-    await _check_owner(project_id, current_user.id, db)
 
     project.is_deleted = True
     await db.flush()
+    await touch_project(db, project_id)
+    await invalidate_project_access(db, project_id)
+    await invalidate_project_responses(project_id)
     return None
 
 
@@ -296,8 +302,7 @@ async def add_member(
     db: AsyncSession = Depends(get_db),
 ):
     """프로젝트에 멤버를 추가한다. (소유자만)"""
-    await _get_project_or_404(project_id, db)
-    await _check_owner(project_id, current_user.id, db)
+    await check_project_access(project_id, current_user.id, db, owner_only=True)
 
     # 이메일로 사용자 조회
     result = await db.execute(select(User).where(User.email == body.email))
@@ -328,29 +333,48 @@ async def add_member(
     )
     db.add(member)
     await db.flush()
+    await bump_member_count(db, project_id, 1)
     await db.refresh(member)
-
-    return {
-        "status": "success",
-        "data": MemberAddResponse(
-            project_id=member.project_id,
-            user_id=member.user_id,
+    await invalidate_project_access(db, project_id, target_user.id)
+    await invalidate_project_responses(project_id, target_user.id)
+    await emit_event(
+        db,
+        project_id,
+        "member.added",
+        target_user.id,
+        MemberResponse.model_construct(
+            id=target_user.id,
+            name=target_user.name,
+            email=target_user.email,
             role=member.role,
             joined_at=member.joined_at,
-        ).model_dump(),
-        "message": None,
-    }
+        ),
+    )
+
+    return success_response(
+        from_orm(MemberAddResponse, member), status_code=status.HTTP_201_CREATED
+    )
 
 
 @router.get("/{project_id}/members")
 async def list_members(
     project_id: uuid.UUID,
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    request: Request,
+    current_user: User = Depends(get_current_read_user),
+    db: AsyncSession = Depends(get_read_db),
 ):
-    """프로젝트 멤버 목록을 조회한다."""
-    await _get_project_or_404(project_id, db)
-    await _check_membership(project_id, current_user.id, db)
+    """프로젝트 멤버 목록을 조회한다. If-None-Match가 일치하면 304를 반환한다."""
+    await check_project_access(project_id, current_user.id, db)
+    validator = await get_project_validator(db, "members", project_id)
+    if validator is not None and validator.matches(request):
+        await release_read_session(db)
+        return validator.not_modified()
+    if validator is not None:
+        cache_key = response_cache_key("members", validator.etag, request)
+        cached = await get_cached_response(cache_key)
+        if cached is not None:
+            await release_read_session(db)
+            return cached
 
     result = await db.execute(
         select(ProjectMember)
@@ -358,20 +382,21 @@ async def list_members(
         .where(ProjectMember.project_id == project_id)
     )
     members_rows = result.scalars().all()
+    await release_read_session(db)
 
     members = [
-        MemberResponse(
+        MemberResponse.model_construct(
             id=m.user.id,
             name=m.user.name,
             email=m.user.email,
             role=m.role,
             joined_at=m.joined_at,
-        ).model_dump()
+        )
         for m in members_rows
     ]
 
-    return {
-        "status": "success",
-        "data": members,
-        "message": None,
-    }
+    response = success_response(members)
+    if validator is not None:
+        validator.apply(response)
+        await cache_response(cache_key, response, [project_tag(project_id)])
+    return response
@@ -1,25 +1,100 @@
 """태스크 API 라우터: CRUD, 필터링"""
 
 import uuid
-
-from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy import select, func
+from collections import defaultdict
+from collections.abc import AsyncIterator
+from datetime import datetime, timedelta, timezone
+
+from fastapi import (
+    APIRouter,
+    BackgroundTasks,
+    Depends,
+    HTTPException,
+    Query,
+    Request,
+    UploadFile,
+    status,
+)
+from fastapi.responses import StreamingResponse
+from sqlalchemy import insert, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.database import get_db
-from app.models.project import Project, ProjectMember
+from app.config import settings
+from app.database import get_db, open_read_session
+from app.events import emit_event, emit_events
+from app.instrumentation import query_budget
+from app.models.project import ProjectMember
 from app.models.task import Task
 from app.models.user import User
 from app.schemas.task import (
+    TaskBatchItemResult,
+    TaskBatchRequest,
+    TaskBatchResponse,
+    TaskBatchUpdate,
+    TaskChangesResponse,
     TaskCreate,
     TaskListResponse,
+    TaskMove,
+    TaskMoveRequest,
     TaskResponse,
+    TaskSearchHit,
+    TaskSearchResponse,
     TaskStatus,
     TaskPriority,
     TaskUpdate,
 )
 from app.schemas.user import UserBrief
-from app.utils.auth import get_current_user
+from app.utils.access import check_project_access
+from app.utils.auth import get_current_read_user, get_current_user
+from app.utils.conditional import get_project_validator
+from app.utils.consistency import READ_AFTER_HEADER
+from app.utils.counters import (
+    apply_task_count_deltas,
+    bump_task_counters,
+    lock_project_counters,
+    move_task_counters,
+    touch_project,
+)
+from app.utils.export import (
+    EXPORT_CHUNK_SIZE,
+    EXPORT_COLUMNS,
+    MEDIA_TYPES,
+    csv_header,
+    encode_csv_chunk,
+    encode_ndjson_chunk,
+)
+from app.utils.importer import import_task_file
+from app.utils.loaders import UserBriefLoader, get_read_user_loader, get_user_loader
+from app.utils.pagination import decode_cursor, encode_cursor, keyset_condition
+from app.utils.queries import (
+    TASK_SORT_COLUMNS,
+    member_exists_query,
+    task_changes_query,
+    task_count_query,
+    task_list_conditions,
+    task_page_query,
+    task_search_query,
+    visible_project_ids_query,
+)
+from app.utils.ranking import (
+    adjacent_position,
+    column_end_positions,
+    needs_rebalance,
+    next_position,
+    rank_between,
+    rebalance_column,
+    rebalance_column_in_background,
+)
+from app.utils.read_db import get_read_db, release_read_session
+from app.utils.response_cache import (
+    cache_response,
+    get_cached_response,
+    invalidate_project_responses,
+    project_tag,
+    response_cache_key,
+)
+from app.utils.responses import success_response
+from app.utils.search import build_tsquery_text, render_highlight
 
 router = APIRouter(tags=["tasks"])
 
@@ -29,67 +104,164 @@ router = APIRouter(tags=["tasks"])
 # ────────────────────────────────────────────
 
 
-async def _get_project_or_404(
-    project_id: uuid.UUID, db: AsyncSession
-) -> Project:
-    result = await db.execute(
-        select(Project).where(Project.id == project_id, Project.is_deleted == False)  # noqa: E712
+def _to_task_response(
+    task: Task, users: dict[uuid.UUID, UserBrief | None]
+) -> TaskResponse:
+    """Task 모델과 미리 조회한 사용자 정보로 TaskResponse를 만든다. (DB 값이므로 검증 생략)"""
+    return TaskResponse.model_construct(
+        id=task.id,
+        project_id=task.project_id,
+        title=task.title,
+        description=task.description,
+        status=task.status,
+        priority=task.priority,
+        position=task.position,
+        assignee=users.get(task.assignee_id) if task.assignee_id else None,
+        created_by=users.get(task.created_by),
+        created_at=task.created_at,
+        updated_at=task.updated_at,
     )
-    project = result.scalar_one_or_none()
-    if project is None:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="프로젝트를 찾을 수 없습니다",
+
+
+async def _build_task_responses(
+    tasks: list[Task], loader: UserBriefLoader
+) -> list[TaskResponse]:
+    """여러 Task를 TaskResponse 목록으로 변환한다. 사용자 정보는 한 번에 조회한다."""
+    users = await loader.load_many(
+        uid for t in tasks for uid in (t.assignee_id, t.created_by)
+    )
+    return [_to_task_response(t, users) for t in tasks]
+
+
+async def _build_task_response(task: Task, loader: UserBriefLoader) -> TaskResponse:
+    """Task 모델을 TaskResponse로 변환한다."""
+    return (await _build_task_responses([task], loader))[0]
+
+
+async def _search_tasks(
+    db: AsyncSession,
+    loader: UserBriefLoader,
+    q: str,
+    conditions: list,
+    size: int,
+    cursor: str | None,
+) -> TaskSearchResponse:
+    """조건에 맞는 태스크를 전문 검색한다. 순위(rank) 내림차순, 동순위는 id로 정렬한다."""
+    tsquery_text = build_tsquery_text(q)
+    if tsquery_text is None:
+        return TaskSearchResponse.model_construct(items=[], size=size, next_cursor=None)
+
+    after = decode_cursor(cursor, "rank", "desc") if cursor is not None else None
+    stmt = task_search_query(tsquery_text, conditions, size + 1, after)
+    rows = (await db.execute(stmt)).all()
+
+    next_cursor = None
+    if len(rows) > size:
+        rows = rows[:size]
+        next_cursor = encode_cursor("rank", "desc", rows[-1].rank, rows[-1].Task.id)
+
+    tasks = await _build_task_responses([row.Task for row in rows], loader)
+    items = [
+        TaskSearchHit.model_construct(
+            **task.__dict__,
+            rank=row.rank,
+            title_highlight=render_highlight(row.title_highlight) or task.title,
+            description_highlight=render_highlight(row.description_highlight),
         )
-    return project
+        for task, row in zip(tasks, rows)
+    ]
+    return TaskSearchResponse.model_construct(items=items, size=size, next_cursor=next_cursor)
 
 
-async def _check_membership(
-    project_id: uuid.UUID, user_id: uuid.UUID, db: AsyncSession
-) -> ProjectMember:
+async def _move_bounds(
+    project_id: uuid.UUID,
+    task_id: uuid.UUID,
+    target_status: str,
+    move: TaskMove,
+    db: AsyncSession,
+) -> tuple[float | None, float | None]:
+    """이동 위치의 앞/뒤 랭크를 구한다.
+
+    이웃이 하나만 주어지면 반대쪽은 컬럼의 실제 인접 태스크 랭크를 조회한다.
+    둘 다 주어지면 두 태스크가 (이동하는 태스크를 제외하고) 바로 인접해야 한다.
+    """
+    neighbor_ids = [i for i in (move.after_id, move.before_id) if i is not None]
     result = await db.execute(
-        select(ProjectMember).where(
-            ProjectMember.project_id == project_id,
-            ProjectMember.user_id == user_id,
+        select(Task.id, Task.position).where(
+            Task.id.in_(neighbor_ids),
+            Task.project_id == project_id,
+            Task.status == target_status,
+            Task.is_deleted == False,  # noqa: E712
         )
     )
-    member = result.scalar_one_or_none()
-    if member is None:
+    positions = {row.id: row.position for row in result.all()}
+    if len(positions) != len(neighbor_ids):
         raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="이 프로젝트에 접근할 권한이 없습니다",
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="이웃 태스크는 같은 프로젝트, 같은 상태의 태스크여야 합니다",
+        )
+    after = positions.get(move.after_id)
+    before = positions.get(move.before_id)
+    if after is not None and before is not None and after >= before:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="after_id 태스크가 before_id 태스크보다 앞에 있어야 합니다",
         )
-    return member
 
+    if after is not None:
+        successor = await adjacent_position(
+            db, project_id, target_status, after, after=True, exclude_id=task_id
+        )
+        if before is None:
+            before = successor
+        elif successor != before:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail="after_id와 before_id는 바로 인접한 태스크여야 합니다",
+            )
+    else:
+        after = await adjacent_position(
+            db, project_id, target_status, before, after=False, exclude_id=task_id
+        )
+    return after, before
 
-async def _build_task_response(task: Task, db: AsyncSession) -> dict:
-    """Task 모델을 TaskResponse dict로 변환한다."""
-    assignee_data = None
-    if task.assignee_id:
-        result = await db.execute(select(User).where(User.id == task.assignee_id))
-        assignee = result.scalar_one_or_none()
-        if assignee:
-            assignee_data = UserBrief(id=assignee.id, name=assignee.name)
 
-    creator_data = None
-    result = await db.execute(select(User).where(User.id == task.created_by))
-    creator = result.scalar_one_or_none()
-    if creator:
-        creator_data = UserBrief(id=creator.id, name=creator.name)
+async def _apply_move(
+    project_id: uuid.UUID,
+    task: Task,
+    move: TaskMove,
+    db: AsyncSession,
+    background_tasks: BackgroundTasks,
+) -> None:
+    """태스크 하나를 이웃 사이로 이동한다. 이동한 태스크 한 행만 갱신된다."""
+    target_status = move.status.value if move.status is not None else task.status
+
+    neighbor_ids = [i for i in (move.after_id, move.before_id) if i is not None]
+    if task.id in neighbor_ids:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="태스크를 자기 자신 기준으로 이동할 수 없습니다",
+        )
+    if neighbor_ids:
+        after, before = await _move_bounds(project_id, task.id, target_status, move, db)
+        new_position = rank_between(after, before)
+        if new_position is None:
+            # 실수 정밀도가 다한 경우: 즉시 재정렬 후 다시 계산한다
+            await rebalance_column(db, project_id, target_status)
+            after, before = await _move_bounds(project_id, task.id, target_status, move, db)
+            new_position = rank_between(after, before)
+        elif needs_rebalance(after, before):
+            background_tasks.add_task(
+                rebalance_column_in_background, project_id, target_status
+            )
+    else:
+        new_position = await next_position(db, project_id, target_status)
 
-    return TaskResponse(
-        id=task.id,
-        project_id=task.project_id,
-        title=task.title,
-        description=task.description,
-        status=task.status,
-        priority=task.priority,
-        position=task.position,
-        assignee=assignee_data,
-        created_by=creator_data,
-        created_at=task.created_at,
-        updated_at=task.updated_at,
-    ).model_dump()
+    if target_status != task.status:
+        await move_task_counters(db, project_id, task.status, target_status)
+        task.status = target_status
+    task.position = new_position
+    await db.flush()
 
 
 # ────────────────────────────────────────────
@@ -106,35 +278,24 @@ async def create_task(
     body: TaskCreate,
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
+    users: UserBriefLoader = Depends(get_user_loader),
 ):
     """프로젝트에 태스크를 생성한다."""
-    await _get_project_or_404(project_id, db)
-    await _check_membership(project_id, current_user.id, db)
+    await check_project_access(project_id, current_user.id, db)
 
     # 담당자가 지정된 경우 프로젝트 멤버인지 확인
     if body.assignee_id is not None:
-        result = await db.execute(
-            select(ProjectMember).where(
-                ProjectMember.project_id == project_id,
-                ProjectMember.user_id == body.assignee_id,
-            )
-        )
+        result = await db.execute(member_exists_query(project_id, body.assignee_id))
         if result.scalar_one_or_none() is None:
             raise HTTPException(
                 status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
                 detail="담당자는 프로젝트 멤버여야 합니다",
             )
 
-    # 같은 상태의 최대 position 조회
-    pos_result = await db.execute(
-        select(func.coalesce(func.max(Task.position), -1)).where(
-            Task.project_id == project_id,
-            Task.status == body.status.value,
-            Task.is_deleted == False,  # noqa: E712
-        )
-    )
-    max_position = pos_result.scalar() or 0
-    new_position = max_position + 1
+    # 카운터 행 갱신이 프로젝트 단위 행 잠금 역할을 하므로,
+    # 동시에 생성되는 태스크도 컬럼 맨 뒤 position을 중복 없이 받는다
+    await bump_task_counters(db, project_id, body.status.value, 1)
+    new_position = await next_position(db, project_id, body.status.value)
 
     task = Task(
         project_id=project_id,
@@ -149,19 +310,18 @@ async def create_task(
     db.add(task)
     await db.flush()
     await db.refresh(task)
+    await invalidate_project_responses(project_id)
 
-    task_data = await _build_task_response(task, db)
+    task_data = await _build_task_response(task, users)
+    await emit_event(db, project_id, "task.created", task.id, task_data)
 
-    return {
-        "status": "success",
-        "data": task_data,
-        "message": None,
-    }
+    return success_response(task_data, status_code=status.HTTP_201_CREATED)
 
 
 @router.get("/projects/{project_id}/tasks")
 async def list_tasks(
     project_id: uuid.UUID,
+    request: Request,
     status_filter: TaskStatus | None = Query(default=None, alias="status"),
     priority_filter: TaskPriority | None = Query(default=None, alias="priority"),
     assignee_id: uuid.UUID | None = Query(default=None),
@@ -169,77 +329,282 @@ async def list_tasks(
     order: str = Query(default="asc"),
     page: int = Query(default=1, ge=1),
     size: int = Query(default=50, ge=1, le=100),
+    cursor: str | None = Query(default=None),
+    include_total: bool = Query(default=True),
+    current_user: User = Depends(get_current_read_user),
+    db: AsyncSession = Depends(get_read_db),
+    users: UserBriefLoader = Depends(get_read_user_loader),
+):
+    """프로젝트의 태스크 목록을 조회한다. 필터/정렬/페이지네이션을 지원한다.
+
+    cursor가 주어지면 page 대신 커서(keyset) 페이지네이션을 사용한다.
+    If-None-Match가 현재 ETag와 일치하면 목록을 조회하지 않고 304를 반환한다.
+    """
+    await check_project_access(project_id, current_user.id, db)
+    validator = await get_project_validator(db, "tasks", project_id)
+    if validator is not None and validator.matches(request):
+        await release_read_session(db)
+        return validator.not_modified()
+    if validator is not None:
+        cache_key = response_cache_key("tasks", validator.etag, request)
+        cached = await get_cached_response(cache_key)
+        if cached is not None:
+            await release_read_session(db)
+            return cached
+
+    # 필터 조건 (app/utils/queries.py)
+    conditions = task_list_conditions(
+        project_id,
+        status=status_filter.value if status_filter is not None else None,
+        priority=priority_filter.value if priority_filter is not None else None,
+        assignee_id=assignee_id,
+    )
+
+    # 총 개수 (선택)
+    total = None
+    if include_total:
+        total = (await db.execute(task_count_query(conditions))).scalar() or 0
+
+    # 정렬 (id를 동순위 정렬 키로 사용)
+    sort_key = sort_by if sort_by in TASK_SORT_COLUMNS else "position"
+    order = "desc" if order == "desc" else "asc"
+    descending = order == "desc"
+
+    # 조회 (다음 페이지 존재 여부 확인을 위해 size + 1개를 가져온다)
+    stmt = task_page_query(conditions, sort_key, descending, size + 1)
+    if cursor is not None:
+        value, last_id = decode_cursor(cursor, sort_key, order)
+        stmt = stmt.where(
+            keyset_condition(TASK_SORT_COLUMNS[sort_key], Task.id, value, last_id, descending)
+        )
+    else:
+        stmt = stmt.offset((page - 1) * size)
+    result = await db.execute(stmt)
+    tasks = list(result.scalars().all())
+
+    next_cursor = None
+    if len(tasks) > size:
+        tasks = tasks[:size]
+        last = tasks[-1]
+        next_cursor = encode_cursor(sort_key, order, getattr(last, sort_key), last.id)
+
+    items = await _build_task_responses(tasks, users)
+    await release_read_session(db)
+
+    response = success_response(
+        TaskListResponse.model_construct(
+            items=items,
+            total=total,
+            page=page if cursor is None else None,
+            size=size,
+            next_cursor=next_cursor,
+        )
+    )
+    if validator is not None:
+        validator.apply(response)
+        await cache_response(cache_key, response, [project_tag(project_id)])
+    return response
+
+
+@router.get("/projects/{project_id}/tasks/search")
+async def search_project_tasks(
+    project_id: uuid.UUID,
+    q: str = Query(min_length=1, max_length=200),
+    size: int = Query(default=20, ge=1, le=100),
+    cursor: str | None = Query(default=None),
+    current_user: User = Depends(get_current_read_user),
+    db: AsyncSession = Depends(get_read_db),
+    users: UserBriefLoader = Depends(get_read_user_loader),
+):
+    """프로젝트의 태스크를 제목/설명으로 검색한다."""
+    await check_project_access(project_id, current_user.id, db)
+    data = await _search_tasks(
+        db, users, q, [Task.project_id == project_id], size, cursor
+    )
+    await release_read_session(db)
+    return success_response(data)
+
+
+@router.get("/tasks/search")
+async def search_tasks(
+    q: str = Query(min_length=1, max_length=200),
+    size: int = Query(default=20, ge=1, le=100),
+    cursor: str | None = Query(default=None),
+    current_user: User = Depends(get_current_read_user),
+    db: AsyncSession = Depends(get_read_db),
+    users: UserBriefLoader = Depends(get_read_user_loader),
+):
+    """현재 사용자가 멤버인 모든 프로젝트의 태스크를 제목/설명으로 검색한다."""
+    visible_projects = visible_project_ids_query(current_user.id)
+    data = await _search_tasks(
+        db, users, q, [Task.project_id.in_(visible_projects)], size, cursor
+    )
+    await release_read_session(db)
+    return success_response(data)
+
+
+async def _export_stream(
+    project_id: uuid.UUID, user_id: uuid.UUID, fmt: str, write_marker: str | None
+) -> AsyncIterator[bytes]:
+    """서버 측 커서로 태스크를 청크 단위로 읽어 인코딩한다. 메모리 사용량은 프로젝트 크기와 무관하다.
+
+    응답이 끝날 때까지 커서를 유지해야 하므로 요청 의존성과 별개의 읽기 전용 세션을 사용한다.
+    사용자 이름은 청크마다 아직 조회하지 않은 ID만 한 번에 조회한다.
+    """
+    session = await open_read_session(user_id, write_marker)
+    try:
+        loader = UserBriefLoader(session)
+        encode = encode_csv_chunk if fmt == "csv" else encode_ndjson_chunk
+        if fmt == "csv":
+            yield csv_header()
+        result = await session.stream(
+            select(*EXPORT_COLUMNS)
+            .where(
+                Task.project_id == project_id,
+                Task.is_deleted == False,  # noqa: E712
+            )
+            .order_by(Task.created_at, Task.id)
+            .execution_options(yield_per=EXPORT_CHUNK_SIZE)
+        )
+        async for rows in result.partitions():
+            users = await loader.load_many(
+                uid for r in rows for uid in (r.assignee_id, r.created_by)
+            )
+            yield encode(rows, users)
+    finally:
+        await session.close()
+
+
+@router.get("/projects/{project_id}/tasks/export")
+async def export_tasks(
+    project_id: uuid.UUID,
+    request: Request,
+    fmt: str = Query(default="ndjson", alias="format", pattern="^(ndjson|csv)$"),
+    current_user: User = Depends(get_current_read_user),
+    db: AsyncSession = Depends(get_read_db),
+):
+    """프로젝트의 (삭제되지 않은) 태스크 전체를 NDJSON 또는 CSV로 스트리밍한다."""
+    await check_project_access(project_id, current_user.id, db)
+    await release_read_session(db)
+
+    return StreamingResponse(
+        _export_stream(
+            project_id, current_user.id, fmt, request.headers.get(READ_AFTER_HEADER)
+        ),
+        media_type=MEDIA_TYPES[fmt],
+        headers={
+            "Content-Disposition": f'attachment; filename="tasks-{project_id}.{fmt}"',
+        },
+    )
+
+
+@router.get("/projects/{project_id}/tasks/changes")
+async def list_task_changes(
+    project_id: uuid.UUID,
+    since: str | None = Query(default=None),
+    size: int = Query(default=500, ge=1, le=1000),
+    current_user: User = Depends(get_current_read_user),
+    db: AsyncSession = Depends(get_read_db),
+    users: UserBriefLoader = Depends(get_read_user_loader),
+):
+    """since 워터마크 이후 생성/수정/삭제된 태스크만 반환한다. (변경분 동기화)
+
+    since가 없으면 삭제되지 않은 전체 태스크를 반환한다.
+    최근 SYNC_SAFETY_LAG_SECONDS 이내의 변경은 늦게 커밋되는 트랜잭션을 놓치지 않도록
+    워터마크를 넘기지 않으므로 다음 동기화에서 다시 전달될 수 있다. (클라이언트는 id 기준으로 덮어쓴다)
+    has_more가 true이면 next_since로 바로 다음 요청을 보낸다.
+    """
+    await check_project_access(project_id, current_user.id, db)
+
+    watermark = decode_cursor(since, "updated_at", "asc") if since is not None else None
+    result = await db.execute(task_changes_query(project_id, watermark, size + 1))
+    tasks = list(result.scalars().all())
+
+    full_page = len(tasks) > size
+    tasks = tasks[:size]
+
+    # 안전 구간 이전의 변경까지만 워터마크를 전진시킨다
+    horizon = datetime.now(timezone.utc) - timedelta(seconds=settings.SYNC_SAFETY_LAG_SECONDS)
+    settled = [t for t in tasks if t.updated_at <= horizon]
+    if settled:
+        watermark = (settled[-1].updated_at, settled[-1].id)
+    elif watermark is None:
+        watermark = (horizon, uuid.UUID(int=0))
+    has_more = full_page and len(settled) == len(tasks)
+
+    changed = [t for t in tasks if not t.is_deleted]
+    items = await _build_task_responses(changed, users)
+    await release_read_session(db)
+
+    return success_response(
+        TaskChangesResponse.model_construct(
+            items=items,
+            deleted_ids=[t.id for t in tasks if t.is_deleted],
+            next_since=encode_cursor("updated_at", "asc", *watermark),
+            has_more=has_more,
+        )
+    )
+
+
+@router.post("/projects/{project_id}/tasks:move")
+# 이동은 앞선 이동 결과에 의존하므로 이동마다 이웃 조회/갱신 문장이 실행된다 (최대 100건)
+@query_budget(max_queries=None, max_repeats=None)
+async def move_tasks(
+    project_id: uuid.UUID,
+    body: TaskMoveRequest,
+    background_tasks: BackgroundTasks,
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
+    users: UserBriefLoader = Depends(get_user_loader),
 ):
-    """프로젝트의 태스크 목록을 조회한다. 필터/정렬/페이지네이션을 지원한다."""
-    await _get_project_or_404(project_id, db)
-    await _check_membership(project_id, current_user.id, db)
-
-    # 기본 조건
-    conditions = [
-        Task.project_id == project_id,
-        Task.is_deleted == False,  # noqa: E712
-    ]
-    if status_filter is not None:
-        conditions.append(Task.status == status_filter.value)
-    if priority_filter is not None:
-        conditions.append(Task.priority == priority_filter.value)
-    if assignee_id is not None:
-        conditions.append(Task.assignee_id == assignee_id)
-
-    # 총 개수
-    count_stmt = select(func.count()).select_from(
-        select(Task.id).where(*conditions).subquery()
-    )
-    total = (await db.execute(count_stmt)).scalar() or 0
+    """여러 태스크를 순서대로 이동한다. 모든 이동은 하나의 트랜잭션으로 적용된다."""
+    await check_project_access(project_id, current_user.id, db)
 
-    # 정렬
-    sort_column_map = {
-        "position": Task.position,
-        "created_at": Task.created_at,
-        "priority": Task.priority,
-    }
-    sort_col = sort_column_map.get(sort_by, Task.position)
-    order_clause = sort_col.desc() if order == "desc" else sort_col.asc()
+    # 이웃 랭크 조회부터 커밋까지 같은 프로젝트의 생성/이동/재정렬과 직렬화한다
+    await lock_project_counters(db, project_id)
 
-    # 조회
-    stmt = (
+    # 동시 수정이 같은 이전 상태로 카운터를 옮기지 않도록 행을 잠근다
+    task_ids = {m.task_id for m in body.moves}
+    result = await db.execute(
         select(Task)
-        .where(*conditions)
-        .order_by(order_clause)
-        .offset((page - 1) * size)
-        .limit(size)
+        .where(
+            Task.id.in_(task_ids),
+            Task.project_id == project_id,
+            Task.is_deleted == False,  # noqa: E712
+        )
+        .with_for_update()
     )
-    result = await db.execute(stmt)
-    tasks = result.scalars().all()
+    tasks = {t.id: t for t in result.scalars().all()}
+    if len(tasks) != len(task_ids):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="태스크를 찾을 수 없습니다",
+        )
 
-    items = []
-    for t in tasks:
-        items.append(await _build_task_response(t, db))
+    for move in body.moves:
+        await _apply_move(project_id, tasks[move.task_id], move, db, background_tasks)
+    await touch_project(db, project_id)
+    await invalidate_project_responses(project_id)
 
-    return {
-        "status": "success",
-        "data": TaskListResponse(
-            items=[TaskResponse(**i) for i in items],
-            total=total,
-            page=page,
-            size=size,
-        ).model_dump(),
-        "message": None,
-    }
+    moved = [tasks[i] for i in dict.fromkeys(m.task_id for m in body.moves)]
+    for t in moved:
+        await db.refresh(t)
+    items = await _build_task_responses(moved, users)
+    await emit_events(db, project_id, [("task.updated", i.id, i) for i in items])
+
+    return success_response(items)
 
 
 @router.get("/projects/{project_id}/tasks/{task_id}")
 async def get_task(
     project_id: uuid.UUID,
     task_id: uuid.UUID,
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_read_user),
+    db: AsyncSession = Depends(get_read_db),
+    users: UserBriefLoader = Depends(get_read_user_loader),
 ):
     """태스크 상세 정보를 조회한다."""
-    await _get_project_or_404(project_id, db)
-    await _check_membership(project_id, current_user.id, db)
+    await check_project_access(project_id, current_user.id, db)
 
     result = await db.execute(
         select(Task).where(
@@ -255,13 +620,10 @@ async def get_task(
             detail="태스크를 찾을 수 없습니다",
         )
 
-    task_data = await _build_task_response(task, db)
+    task_data = await _build_task_response(task, users)
+    await release_read_session(db)
 
-    return {
-        "status": "success",
-        "data": task_data,
-        "message": None,
-    }
+    return success_response(task_data)
 
 
 @router.patch("/projects/{project_id}/tasks/{task_id}")
@@ -271,17 +633,23 @@ async def update_task(
     body: TaskUpdate,
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
+    users: UserBriefLoader = Depends(get_user_loader),
 ):
     """태스크를 수정한다. 부분 수정(PATCH)을 지원한다."""
-    await _get_project_or_404(project_id, db)
-    await _check_membership(project_id, current_user.id, db)
+    await check_project_access(project_id, current_user.id, db)
+
+    # 잠금 순서(카운터 행 → 태스크 행)를 이동/일괄 처리와 맞춰 교착 상태를 막는다
+    await lock_project_counters(db, project_id)
 
+    # 동시 수정이 같은 이전 상태로 카운터를 옮기지 않도록 행을 잠근다
     result = await db.execute(
-        select(Task).where(
+        select(Task)
+        .where(
             Task.id == task_id,
             Task.project_id == project_id,
             Task.is_deleted == False,  # noqa: E712
         )
+        .with_for_update()
     )
     task = result.scalar_one_or_none()
     if task is None:
@@ -295,10 +663,7 @@ async def update_task(
     # 담당자 변경 시 프로젝트 멤버인지 확인
     if "assignee_id" in update_data and update_data["assignee_id"] is not None:
         mem_result = await db.execute(
-            select(ProjectMember).where(
-                ProjectMember.project_id == project_id,
-                ProjectMember.user_id == update_data["assignee_id"],
-            )
+            member_exists_query(project_id, update_data["assignee_id"])
         )
         if mem_result.scalar_one_or_none() is None:
             raise HTTPException(
@@ -312,19 +677,22 @@ async def update_task(
     if "priority" in update_data and update_data["priority"] is not None:
         update_data["priority"] = update_data["priority"].value
 
+    old_status = task.status
     for key, value in update_data.items():
         setattr(task, key, value)
 
     await db.flush()
+    if task.status != old_status:
+        await move_task_counters(db, project_id, old_status, task.status)
+    else:
+        await touch_project(db, project_id)
     await db.refresh(task)
+    await invalidate_project_responses(project_id)
 
-    task_data = await _build_task_response(task, db)
+    task_data = await _build_task_response(task, users)
+    await emit_event(db, project_id, "task.updated", task.id, task_data)
 
-    return {
-        "status": "success",
-        "data": task_data,
-        "message": None,
-    }
+    return success_response(task_data)
 
 
 @router.delete(
@@ -338,23 +706,291 @@ async def delete_task(
     db: AsyncSession = Depends(get_db),
 ):
     """태스크를 소프트 삭제한다."""
-    await _get_project_or_404(project_id, db)
-    await _check_membership(project_id, current_user.id, db)
+    await check_project_access(project_id, current_user.id, db)
+
+    # 잠금 순서(카운터 행 → 태스크 행)를 이동/일괄 처리와 맞춰 교착 상태를 막는다
+    await lock_project_counters(db, project_id)
 
+    # 조건부 UPDATE: 동시 삭제 중 실제로 행을 바꾼 요청만 카운터를 줄인다
     result = await db.execute(
-        select(Task).where(
+        update(Task)
+        .where(
             Task.id == task_id,
             Task.project_id == project_id,
             Task.is_deleted == False,  # noqa: E712
         )
+        .values(is_deleted=True)
+        .returning(Task.status)
+        .execution_options(synchronize_session=False)
     )
-    task = result.scalar_one_or_none()
-    if task is None:
+    deleted_status = result.scalar_one_or_none()
+    if deleted_status is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="태스크를 찾을 수 없습니다",
         )
 
-    task.is_deleted = True
-    await db.flush()
+    await bump_task_counters(db, project_id, deleted_status, -1)
+    await invalidate_project_responses(project_id)
+    await emit_event(db, project_id, "task.deleted", task_id)
     return None
+
+
+# ────────────────────────────────────────────
+# 태스크 일괄 처리
+# ────────────────────────────────────────────
+
+# 일괄 수정에서 null을 무시하는 (NOT NULL) 필드
+_NON_NULLABLE_FIELDS = {"title", "status", "priority", "position"}
+
+
+def _batch_error(
+    index: int, message: str, task_id: uuid.UUID | None = None
+) -> TaskBatchItemResult:
+    return TaskBatchItemResult(index=index, status="error", id=task_id, message=message)
+
+
+async def _batch_create(
+    project_id: uuid.UUID,
+    items: list[TaskCreate],
+    member_ids: set[uuid.UUID],
+    creator_id: uuid.UUID,
+    db: AsyncSession,
+    deltas: dict[str, int],
+) -> tuple[list[TaskBatchItemResult], list[Task]]:
+    """유효한 생성 항목을 하나의 다중 행 INSERT ... RETURNING으로 저장한다."""
+    results: list[TaskBatchItemResult] = []
+    rows: list[dict] = []
+    positions = await column_end_positions(db, project_id)
+
+    for i, item in enumerate(items):
+        if item.assignee_id is not None and item.assignee_id not in member_ids:
+            results.append(_batch_error(i, "담당자는 프로젝트 멤버여야 합니다"))
+            continue
+        status_value = item.status.value
+        positions[status_value] = rank_between(positions.get(status_value), None)
+        row = {
+            "id": uuid.uuid4(),
+            "project_id": project_id,
+            "title": item.title,
+            "description": item.description,
+            "status": status_value,
+            "priority": item.priority.value,
+            "position": positions[status_value],
+            "assignee_id": item.assignee_id,
+            "created_by": creator_id,
+        }
+        rows.append(row)
+        deltas[status_value] += 1
+        results.append(TaskBatchItemResult(index=i, status="success", id=row["id"]))
+
+    created: list[Task] = []
+    if rows:
+        created = list(
+            (
+                await db.scalars(
+                    insert(Task).returning(Task, sort_by_parameter_order=True),
+                    rows,
+                )
+            ).all()
+        )
+    return results, created
+
+
+async def _batch_update(
+    project_id: uuid.UUID,
+    items: list[TaskBatchUpdate],
+    member_ids: set[uuid.UUID],
+    db: AsyncSession,
+    deltas: dict[str, int],
+) -> tuple[list[TaskBatchItemResult], list[Task]]:
+    """수정 대상을 한 번의 SELECT ... FOR UPDATE로 읽고, 변경 사항을 한 번의 flush로 저장한다."""
+    results: list[TaskBatchItemResult] = []
+    if not items:
+        return results, []
+
+    result = await db.execute(
+        select(Task)
+        .where(
+            Task.id.in_({item.id for item in items}),
+            Task.project_id == project_id,
+            Task.is_deleted == False,  # noqa: E712
+        )
+        .with_for_update()
+    )
+    tasks = {t.id: t for t in result.scalars().all()}
+    updated: dict[uuid.UUID, Task] = {}
+
+    for i, item in enumerate(items):
+        task = tasks.get(item.id)
+        if task is None:
+            results.append(_batch_error(i, "태스크를 찾을 수 없습니다", item.id))
+            continue
+
+        update_data = item.model_dump(exclude_unset=True, exclude={"id"})
+        update_data = {
+            k: v
+            for k, v in update_data.items()
+            if v is not None or k not in _NON_NULLABLE_FIELDS
+        }
+        assignee_id = update_data.get("assignee_id")
+        if assignee_id is not None and assignee_id not in member_ids:
+            results.append(_batch_error(i, "담당자는 프로젝트 멤버여야 합니다", item.id))
+            continue
+        if "status" in update_data:
+            update_data["status"] = update_data["status"].value
+        if "priority" in update_data:
+            update_data["priority"] = update_data["priority"].value
+
+        old_status = task.status
+        for key, value in update_data.items():
+            setattr(task, key, value)
+        if task.status != old_status:
+            deltas[old_status] -= 1
+            deltas[task.status] += 1
+
+        updated[task.id] = task
+        results.append(TaskBatchItemResult(index=i, status="success", id=task.id))
+
+    await db.flush()
+    return results, list(updated.values())
+
+
+async def _batch_delete(
+    project_id: uuid.UUID,
+    task_ids: list[uuid.UUID],
+    db: AsyncSession,
+    deltas: dict[str, int],
+) -> list[TaskBatchItemResult]:
+    """삭제 대상을 하나의 UPDATE ... RETURNING으로 소프트 삭제한다."""
+    if not task_ids:
+        return []
+
+    result = await db.execute(
+        update(Task)
+        .where(
+            Task.id.in_(set(task_ids)),
+            Task.project_id == project_id,
+            Task.is_deleted == False,  # noqa: E712
+        )
+        .values(is_deleted=True)
+        .returning(Task.id, Task.status)
+        .execution_options(synchronize_session=False)
+    )
+    deleted = {row.id: row.status for row in result.all()}
+    for status_value in deleted.values():
+        deltas[status_value] -= 1
+
+    return [
+        TaskBatchItemResult(index=i, status="success", id=task_id)
+        if task_id in deleted
+        else _batch_error(i, "태스크를 찾을 수 없습니다", task_id)
+        for i, task_id in enumerate(task_ids)
+    ]
+
+
+@router.post("/projects/{project_id}/tasks:batch")
+async def batch_tasks(
+    project_id: uuid.UUID,
+    body: TaskBatchRequest,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+    users: UserBriefLoader = Depends(get_user_loader),
+):
+    """태스크를 일괄 생성/수정/삭제한다.
+
+    유효한 항목은 생성 → 수정 → 삭제 순서로 하나의 트랜잭션에서 적용되고,
+    유효하지 않은 항목은 건너뛰며 항목별 결과로 오류를 알려준다.
+    """
+    await check_project_access(project_id, current_user.id, db)
+
+    # 담당자 검증 (한 번의 멤버십 쿼리)
+    assignee_ids = {c.assignee_id for c in body.create if c.assignee_id is not None}
+    assignee_ids |= {u.assignee_id for u in body.update if u.assignee_id is not None}
+    member_ids: set[uuid.UUID] = set()
+    if assignee_ids:
+        result = await db.execute(
+            select(ProjectMember.user_id).where(
+                ProjectMember.project_id == project_id,
+                ProjectMember.user_id.in_(assignee_ids),
+            )
+        )
+        member_ids = set(result.scalars().all())
+
+    # 같은 프로젝트의 동시 생성과 position이 겹치지 않도록 카운터 행을 먼저 잠근다
+    await lock_project_counters(db, project_id)
+
+    deltas: dict[str, int] = defaultdict(int)
+    created_results, created = await _batch_create(
+        project_id, body.create, member_ids, current_user.id, db, deltas
+    )
+    updated_results, updated = await _batch_update(
+        project_id, body.update, member_ids, db, deltas
+    )
+    deleted_results = await _batch_delete(project_id, body.delete, db, deltas)
+    await apply_task_count_deltas(db, project_id, deltas)
+    await invalidate_project_responses(project_id)
+
+    # 성공한 생성/수정 항목의 응답 데이터 (사용자 정보는 한 번에 조회)
+    task_map = {t.id: t for t in [*created, *updated]}
+    responses = {
+        data.id: data
+        for data in await _build_task_responses(list(task_map.values()), users)
+    }
+    for r in [*created_results, *updated_results]:
+        if r.status == "success":
+            r.data = responses[r.id]
+
+    await emit_events(
+        db,
+        project_id,
+        [
+            *(("task.created", r.id, r.data) for r in created_results if r.status == "success"),
+            *(("task.updated", r.id, r.data) for r in updated_results if r.status == "success"),
+            *(("task.deleted", r.id, None) for r in deleted_results if r.status == "success"),
+        ],
+    )
+
+    return success_response(
+        TaskBatchResponse.model_construct(
+            created=created_results,
+            updated=updated_results,
+            deleted=deleted_results,
+        )
+    )
+
+
+@router.post("/projects/{project_id}/tasks:import")
+# 배치마다 담당자 조회 문장이 실행된다 (파일 크기에 비례)
+@query_budget(max_queries=None, max_repeats=None)
+async def import_tasks(
+    project_id: uuid.UUID,
+    file: UploadFile,
+    fmt: str | None = Query(default=None, alias="format", pattern="^(ndjson|csv)$"),
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+):
+    """CSV 또는 NDJSON 파일의 태스크를 한 번에 가져온다.
+
+    유효한 행은 하나의 트랜잭션에서 COPY로 적재되고, 유효하지 않은 행은 건너뛰며
+    줄 번호와 함께 오류로 알려준다. format이 없으면 파일 확장자로 판단한다.
+    """
+    await check_project_access(project_id, current_user.id, db)
+    if fmt is None:
+        fmt = "csv" if (file.filename or "").lower().endswith(".csv") else "ndjson"
+
+    # 같은 프로젝트의 동시 생성과 position이 겹치지 않도록 카운터 행을 먼저 잠근다
+    await lock_project_counters(db, project_id)
+    result, deltas = await import_task_file(
+        db, project_id, current_user.id, file.file, fmt
+    )
+    await apply_task_count_deltas(db, project_id, deltas)
+    await invalidate_project_responses(project_id)
+
+    if result.created:
+        # 태스크별 이벤트 대신 하나만 발행한다: 구독자는 목록을 다시 조회한다
+        await emit_event(
+            db, project_id, "tasks.imported", project_id, {"created": result.created}
+        )
+
+    return success_response(result)
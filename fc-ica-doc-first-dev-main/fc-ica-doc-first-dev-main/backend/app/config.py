@@ -9,11 +9,74 @@ class Settings(BaseSettings):
     # 데이터베이스
     DATABASE_URL: str = "postgresql+asyncpg://taskflow:taskflow1234@db:5432/taskflow"
 
+    # 읽기 전용 복제본 (JSON 배열, 예: '["postgresql+asyncpg://...@replica1/taskflow"]')
+    DATABASE_REPLICA_URLS: list[str] = []
+    # 장애가 난 복제본을 라우팅에서 제외하는 시간
+    REPLICA_EJECT_SECONDS: float = 30.0
+    # 쓰기 직후 해당 사용자의 읽기를 primary로 보내는 시간 (read-your-writes)
+    READ_YOUR_WRITES_SECONDS: float = 5.0
+
+    # 커넥션 풀
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: float = 30.0
+    DB_POOL_RECYCLE: int = 1800
+    DB_POOL_PRE_PING: bool = True
+    # 시작 시 미리 열어 둘 커넥션 수 (DB_POOL_SIZE를 넘지 않는다)
+    DB_WARMUP_CONNECTIONS: int = 5
+
+    # asyncpg prepared statement 캐시 (커넥션당 문장 수)
+    DB_STATEMENT_CACHE_SIZE: int = 100
+    # PgBouncer 트랜잭션 풀링 호환 모드: statement 캐시를 끄고 prepared statement 이름을 고유하게 만든다
+    DB_PGBOUNCER_MODE: bool = False
+
     # JWT 인증
     JWT_SECRET: str = "your-super-secret-key-change-in-production"
     JWT_ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
 
+    # 비밀번호 해싱 (bcrypt)
+    PASSWORD_HASH_ROUNDS: int = 12
+    PASSWORD_HASH_WORKERS: int = 4
+    PASSWORD_HASH_MAX_PENDING: int = 64
+
+    # 인증 사용자 캐시 (get_current_user)
+    AUTH_CACHE_SIZE: int = 10000
+    AUTH_CACHE_TTL_SECONDS: float = 60.0
+
+    # 프로젝트 접근 판단 캐시 (존재/삭제 여부, 멤버 역할)
+    # 다른 워커의 무효화는 NOTIFY로 전달되며, EVENTS_ENABLED=False이면 TTL이 최대 지연 시간이 된다
+    ACCESS_CACHE_SIZE: int = 50000
+    ACCESS_CACHE_TTL_SECONDS: float = 30.0
+
+    # GET 응답 캐시 (태스크 목록, 프로젝트 상세/목록, 멤버 목록)
+    RESPONSE_CACHE_ENABLED: bool = True
+    RESPONSE_CACHE_SIZE: int = 5000
+    RESPONSE_CACHE_TTL_SECONDS: float = 60.0
+
+    # 변경분 동기화: 이 시간 이내의 변경은 다음 동기화에서 다시 전달한다
+    # (늦게 커밋되는 트랜잭션, 워커 간 시계 차이, 복제 지연보다 길어야 한다)
+    SYNC_SAFETY_LAG_SECONDS: float = 10.0
+
+    # 실시간 프로젝트 이벤트 (SSE, PostgreSQL LISTEN/NOTIFY)
+    EVENTS_ENABLED: bool = True
+    EVENT_BUFFER_SIZE: int = 256
+    EVENT_HEARTBEAT_SECONDS: float = 15.0
+
+    # 태스크 가져오기 (CSV/NDJSON 업로드) 파일당 최대 행 수
+    IMPORT_MAX_ROWS: int = 500000
+
+    # 요청별 SQL 계측 (Server-Timing 헤더, 요청 로그)
+    SQL_INSTRUMENTATION_ENABLED: bool = True
+    # 요청당 SQL 문 수 예산과 같은 형태 문장의 반복 한도 (@query_budget으로 엔드포인트별 지정)
+    SQL_QUERY_BUDGET: int = 30
+    SQL_REPEAT_LIMIT: int = 5
+    # 예산 초과 시 경고 로그 대신 예외를 발생시킨다 (테스트/개발용)
+    SQL_QUERY_GUARD: bool = False
+
+    # /metrics 접근 토큰 (Authorization: Bearer <토큰>). 비어 있으면 루프백 주소에서만 허용한다
+    METRICS_TOKEN: str = ""
+
     # CORS
     FRONTEND_URL: str = "http://localhost:3000"
 
@@ -1,18 +1,53 @@
 """데이터베이스 연결 및 세션 관리 모듈"""
 
+import time
+import uuid
 from collections.abc import AsyncGenerator
 
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from fastapi import Request
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 from sqlalchemy.orm import DeclarativeBase
 
 from app.config import settings
+from app.utils.cache import TTLCache
+from app.utils.consistency import has_fresh_write_marker, record_write
+
+
+def _connect_args() -> dict:
+    """asyncpg 연결 옵션: prepared statement 캐시 / PgBouncer 호환 설정"""
+    if settings.DB_PGBOUNCER_MODE:
+        # 트랜잭션 풀링에서는 서버 커넥션이 바뀌므로 이름 있는 statement를 재사용할 수 없다
+        return {
+            "statement_cache_size": 0,
+            "prepared_statement_cache_size": 0,
+            "prepared_statement_name_func": lambda: f"__asyncpg_{uuid.uuid4()}__",
+        }
+    return {
+        "statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+        "prepared_statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+    }
 
-# 비동기 엔진 생성
-engine = create_async_engine(
-    settings.DATABASE_URL,
-    echo=False,
-    pool_pre_ping=True,
-)
+
+def _create_engine(url: str) -> AsyncEngine:
+    return create_async_engine(
+        url,
+        echo=False,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+        pool_pre_ping=settings.DB_POOL_PRE_PING,
+        connect_args=_connect_args(),
+    )
+
+
+# 비동기 엔진 생성 (primary)
+engine = _create_engine(settings.DATABASE_URL)
 
 # 비동기 세션 팩토리
 async_session = async_sessionmaker(
@@ -22,19 +57,132 @@ async_session = async_sessionmaker(
 )
 
 
+def _read_sessionmaker(target: AsyncEngine, **info) -> async_sessionmaker[AsyncSession]:
+    """READ ONLY 트랜잭션(BEGIN READ ONLY)으로 시작하는 읽기 전용 세션 팩토리"""
+    return async_sessionmaker(
+        target.execution_options(postgresql_readonly=True),
+        class_=AsyncSession,
+        expire_on_commit=False,
+        info={"read_only": True, **info},
+    )
+
+
+# primary 읽기 전용 세션 팩토리 (복제본이 없거나 사용할 수 없을 때)
+async_read_session = _read_sessionmaker(engine)
+
+
 class Base(DeclarativeBase):
     """SQLAlchemy 선언적 베이스 클래스"""
     pass
 
 
-async def get_db() -> AsyncGenerator[AsyncSession, None]:
-    """FastAPI 의존성: 비동기 DB 세션을 제공한다."""
+class ReplicaSet:
+    """읽기 복제본 라우팅: 라운드 로빈, 장애 복제본은 일정 시간 제외"""
+
+    def __init__(self, urls: list[str]):
+        self.engines = [_create_engine(url) for url in urls]
+        self.sessionmakers = [_read_sessionmaker(e, replica=True) for e in self.engines]
+        self._next = 0
+        self._ejected_until = [0.0] * len(self.engines)
+
+    def candidates(self) -> list[int]:
+        """라운드 로빈 순서로 현재 사용 가능한 복제본 인덱스를 반환한다."""
+        n = len(self.engines)
+        if n == 0:
+            return []
+        start = self._next
+        self._next = (self._next + 1) % n
+        now = time.monotonic()
+        order = [(start + i) % n for i in range(n)]
+        return [i for i in order if self._ejected_until[i] <= now]
+
+    def eject(self, index: int) -> None:
+        """연결에 실패한 복제본을 REPLICA_EJECT_SECONDS 동안 제외한다."""
+        self._ejected_until[index] = time.monotonic() + settings.REPLICA_EJECT_SECONDS
+
+    async def dispose(self) -> None:
+        for e in self.engines:
+            await e.dispose()
+
+    def stats(self) -> list[dict]:
+        now = time.monotonic()
+        return [
+            {
+                "index": i,
+                "ejected": self._ejected_until[i] > now,
+                "pool": _pool_stats(e),
+            }
+            for i, e in enumerate(self.engines)
+        ]
+
+
+replicas = ReplicaSet(settings.DATABASE_REPLICA_URLS)
+
+# 최근에 쓰기를 한 사용자: 이 기간 동안 읽기도 primary로 보낸다
+recent_writers = TTLCache(maxsize=100000, ttl=settings.READ_YOUR_WRITES_SECONDS)
+
+
+def _pool_stats(e: AsyncEngine) -> dict[str, int]:
+    pool = e.pool
+    return {
+        "size": pool.size(),
+        "checked_in": pool.checkedin(),
+        "checked_out": pool.checkedout(),
+        "overflow": pool.overflow(),
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+    }
+
+
+def pool_stats() -> dict:
+    """모니터링용 커넥션 풀 통계를 반환한다."""
+    return {"primary": _pool_stats(engine), "replicas": replicas.stats()}
+
+
+async def get_db(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    """FastAPI 의존성: 비동기 DB 세션을 제공한다.
+
+    쓰기 요청이 커밋되면 요청한 사용자를 recent_writers에 기록하고 응답에 X-Read-After 표식을 붙여
+    이후 잠시 동안 읽기 요청도 primary에서 처리되도록 한다. (다른 워커는 표식으로 판단한다)
+    (user_id는 get_current_user가 session.info에 기록한다)
+    """
     async with async_session() as session:
         try:
             yield session
             await session.commit()
+            user_id = session.info.get("user_id")
+            if user_id is not None and request.method not in ("GET", "HEAD"):
+                recent_writers.set(user_id, True)
+                record_write(request.scope.setdefault("state", {}), user_id)
         except Exception:
             await session.rollback()
             raise
         finally:
             await session.close()
+
+
+def _recently_wrote(user_id: uuid.UUID, write_marker: str | None) -> bool:
+    """이 워커에서 쓰기를 했거나, 클라이언트가 유효한 X-Read-After 표식을 보냈는지 확인한다."""
+    return recent_writers.get(user_id, None) is not None or has_fresh_write_marker(
+        write_marker, user_id
+    )
+
+
+async def open_read_session(
+    user_id: uuid.UUID | None, write_marker: str | None = None
+) -> AsyncSession:
+    """읽기 전용 세션을 연다.
+
+    복제본이 없거나, 사용자가 최근에 쓰기를 했거나(write_marker: 요청의 X-Read-After 헤더),
+    모든 복제본 연결에 실패하면 primary를 사용한다.
+    primary 세션은 커넥션을 첫 쿼리 시점에 가져온다.
+    """
+    if user_id is None or not _recently_wrote(user_id, write_marker):
+        for index in replicas.candidates():
+            session = replicas.sessionmakers[index]()
+            try:
+                await session.connection()
+                return session
+            except Exception:
+                await session.close()
+                replicas.eject(index)
+    return async_read_session()
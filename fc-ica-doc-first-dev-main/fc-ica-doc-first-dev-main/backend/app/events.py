@@ -0,0 +1,230 @@
+"""실시간 프로젝트 이벤트: PostgreSQL NOTIFY로 발행하고, 워커별로 구독 중인 연결에 전달한다.
+
+이벤트는 쓰기 트랜잭션 안에서 pg_notify로 발행된다. 따라서 커밋된 변경만 전달되고
+롤백된 변경은 전달되지 않는다. 각 워커는 전용 커넥션 하나로 LISTEN하며,
+받은 이벤트를 같은 프로젝트를 구독 중인 연결의 버퍼(크기 제한)에 넣는다.
+버퍼가 가득 찬 느린 연결에는 resync 이벤트를 보내고 스트림을 종료한다.
+
+같은 LISTEN 커넥션으로 register_channel()에 등록된 채널(워커 간 캐시 무효화 등)도 구독한다.
+"""
+
+import asyncio
+import json
+import logging
+import uuid
+from collections import defaultdict
+from collections.abc import Callable, Iterable
+from contextlib import suppress
+from typing import Any
+
+import asyncpg
+from pydantic_core import to_json
+from sqlalchemy import text
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+EVENT_CHANNEL = "taskflow_project_events"
+
+# NOTIFY payload 최대 크기(8000바이트)보다 작게 유지한다. 넘으면 data 없이 보낸다
+MAX_PAYLOAD_BYTES = 7000
+
+# 전용 LISTEN 커넥션 상태 확인 주기 (초)
+LISTENER_PING_SECONDS = 30.0
+
+_notify_stmt = text(
+    "SELECT pg_notify(:channel, payload) FROM unnest(CAST(:payloads AS TEXT[])) AS payload"
+)
+
+_channel_notify_stmt = text("SELECT pg_notify(:channel, :payload)")
+
+# 이벤트 채널과 함께 LISTEN할 채널: 채널 이름 → (payload 처리 함수, 재연결 시 호출할 함수)
+_channel_handlers: dict[str, tuple[Callable[[str], None], Callable[[], None]]] = {}
+
+
+def _encode_event(
+    project_id: uuid.UUID, event_type: str, entity_id: uuid.UUID, data: Any
+) -> str:
+    event = {"project_id": project_id, "type": event_type, "id": entity_id, "data": data}
+    payload = to_json(event)
+    if len(payload) > MAX_PAYLOAD_BYTES:
+        # 클라이언트는 data가 없으면 단건 조회로 최신 상태를 가져온다
+        payload = to_json({**event, "data": None})
+    return payload.decode()
+
+
+async def emit_events(
+    db: AsyncSession,
+    project_id: uuid.UUID,
+    events: Iterable[tuple[str, uuid.UUID, Any]],
+) -> None:
+    """(이벤트 종류, 대상 id, 데이터) 목록을 현재 트랜잭션에서 한 번의 쿼리로 발행한다.
+
+    실제 전달은 트랜잭션이 커밋될 때 이루어진다.
+    """
+    if not settings.EVENTS_ENABLED:
+        return
+    payloads = [_encode_event(project_id, t, i, d) for t, i, d in events]
+    if payloads:
+        await db.execute(_notify_stmt, {"channel": EVENT_CHANNEL, "payloads": payloads})
+
+
+async def emit_event(
+    db: AsyncSession,
+    project_id: uuid.UUID,
+    event_type: str,
+    entity_id: uuid.UUID,
+    data: Any = None,
+) -> None:
+    """이벤트 하나를 발행한다."""
+    await emit_events(db, project_id, [(event_type, entity_id, data)])
+
+
+def register_channel(
+    channel: str, handler: Callable[[str], None], on_reconnect: Callable[[], None]
+) -> None:
+    """LISTEN 커넥션에서 함께 구독할 채널을 등록한다. (모듈 임포트 시 호출)
+
+    on_reconnect는 LISTEN 커넥션이 (다시) 연결될 때마다 호출된다. 끊긴 동안의 알림은 유실됐을 수 있다.
+    """
+    _channel_handlers[channel] = (handler, on_reconnect)
+
+
+async def notify_channel(db: AsyncSession, channel: str, payload: str) -> None:
+    """현재 트랜잭션에서 채널에 알림을 보낸다. 커밋될 때 모든 워커에 전달된다."""
+    if settings.EVENTS_ENABLED:
+        await db.execute(_channel_notify_stmt, {"channel": channel, "payload": payload})
+
+
+class Subscription:
+    """이벤트 스트림 연결 하나의 구독 (크기 제한 버퍼)"""
+
+    def __init__(self, project_id: uuid.UUID, maxsize: int):
+        self.project_id = project_id
+        # (이벤트 종류, JSON payload). None은 resync 신호
+        self.queue: asyncio.Queue[tuple[str, str] | None] = asyncio.Queue(maxsize)
+        self.needs_resync = False
+
+    def push(self, item: tuple[str, str]) -> bool:
+        """이벤트를 버퍼에 넣는다. 버퍼가 가득 차면 resync 상태로 바꾸고 False를 반환한다."""
+        if self.needs_resync:
+            return False
+        try:
+            self.queue.put_nowait(item)
+        except asyncio.QueueFull:
+            self.needs_resync = True
+            return False
+        return True
+
+    def request_resync(self) -> None:
+        """이벤트 유실 가능성이 있을 때 클라이언트에게 전체 재조회를 요청한다."""
+        self.needs_resync = True
+        with suppress(asyncio.QueueFull):
+            self.queue.put_nowait(None)
+
+
+class EventBroker:
+    """워커 내 프로젝트별 구독 관리 및 이벤트 분배"""
+
+    def __init__(self):
+        self._subscriptions: dict[uuid.UUID, set[Subscription]] = defaultdict(set)
+        self.listening = False
+        self.delivered = 0
+        self.overflows = 0
+
+    def subscribe(self, project_id: uuid.UUID) -> Subscription:
+        subscription = Subscription(project_id, settings.EVENT_BUFFER_SIZE)
+        self._subscriptions[project_id].add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        subscribers = self._subscriptions.get(subscription.project_id)
+        if subscribers is not None:
+            subscribers.discard(subscription)
+            if not subscribers:
+                del self._subscriptions[subscription.project_id]
+
+    def dispatch(self, payload: str) -> None:
+        """NOTIFY로 받은 payload를 해당 프로젝트의 구독자 버퍼에 넣는다."""
+        event = json.loads(payload)
+        subscribers = self._subscriptions.get(uuid.UUID(event["project_id"]))
+        if not subscribers:
+            return
+        item = (event["type"], payload)
+        for subscription in subscribers:
+            if subscription.push(item):
+                self.delivered += 1
+            else:
+                self.overflows += 1
+
+    def resync_all(self) -> None:
+        """LISTEN 커넥션이 끊겼던 경우 모든 구독자에게 재조회를 요청한다."""
+        for subscribers in self._subscriptions.values():
+            for subscription in subscribers:
+                subscription.request_resync()
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "listening": self.listening,
+            "projects": len(self._subscriptions),
+            "connections": sum(len(s) for s in self._subscriptions.values()),
+            "delivered": self.delivered,
+            "overflows": self.overflows,
+        }
+
+
+event_broker = EventBroker()
+
+
+def _listen_dsn() -> str:
+    """SQLAlchemy URL을 asyncpg DSN으로 변환한다.
+
+    LISTEN은 세션 단위로 동작하므로 PgBouncer 트랜잭션 풀링을 거치지 않는 주소여야 한다.
+    """
+    url = make_url(settings.DATABASE_URL).set(drivername="postgresql")
+    return url.render_as_string(hide_password=False)
+
+
+async def run_event_listener(broker: EventBroker = event_broker) -> None:
+    """전용 커넥션으로 이벤트 채널을 LISTEN한다. 연결이 끊기면 재연결한다."""
+    delay = 1.0
+    while True:
+        try:
+            conn = await asyncpg.connect(_listen_dsn())
+        except Exception:
+            logger.warning("이벤트 LISTEN 연결 실패, %.0f초 후 재시도", delay, exc_info=True)
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, 30.0)
+            continue
+        delay = 1.0
+        lost = asyncio.Event()
+        conn.add_termination_listener(lambda _conn: lost.set())
+        try:
+            await conn.add_listener(
+                EVENT_CHANNEL, lambda _conn, _pid, _channel, payload: broker.dispatch(payload)
+            )
+            for channel, (handler, on_reconnect) in _channel_handlers.items():
+                await conn.add_listener(
+                    channel,
+                    lambda _conn, _pid, _channel, payload, handler=handler: handler(payload),
+                )
+                on_reconnect()
+            broker.listening = True
+            while not lost.is_set():
+                with suppress(asyncio.TimeoutError):
+                    await asyncio.wait_for(lost.wait(), timeout=LISTENER_PING_SECONDS)
+                if not lost.is_set():
+                    await conn.execute("SELECT 1")
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            logger.warning("이벤트 LISTEN 연결 끊김", exc_info=True)
+        finally:
+            broker.listening = False
+            with suppress(Exception):
+                await conn.close(timeout=5)
+        # 끊긴 동안의 이벤트는 유실됐을 수 있다
+        broker.resync_all()
@@ -0,0 +1,207 @@
+"""요청별 SQL 계측: 요청마다 실행된 SQL 문 수, DB 시간, 같은 형태 문장의 반복 횟수를 집계한다.
+
+SQLAlchemy 엔진 이벤트(before/after_cursor_execute)가 현재 요청의 RequestQueryStats에 기록하고,
+QueryInstrumentationMiddleware가 응답에 Server-Timing 헤더를 붙이며 요청마다 구조화된 로그 한 줄(JSON)을 남긴다.
+
+쿼리 예산: 요청의 SQL 문 수가 SQL_QUERY_BUDGET을 넘거나, 파라미터만 다른 같은 형태의 문장이
+SQL_REPEAT_LIMIT번 이상 실행되면(N+1 의심) 예산 초과로 본다. 엔드포인트별 예산은 @query_budget으로 선언한다.
+운영에서는 경고 로그만 남기고, 테스트/개발에서 SQL_QUERY_GUARD를 켜면 QueryBudgetExceeded가 발생한다.
+"""
+
+import json
+import logging
+import re
+import time
+from collections import Counter
+from collections.abc import Callable
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+# 바인드 파라미터 목록($1, $2, ...)을 하나로 접어 IN 목록 길이가 달라도 같은 형태로 본다
+_PARAMS_RE = re.compile(r"\$\d+(?:\s*,\s*\$\d+)*")
+
+_current_stats: ContextVar["RequestQueryStats | None"] = ContextVar(
+    "request_query_stats", default=None
+)
+
+
+def statement_shape(statement: str) -> str:
+    """SQL 문에서 파라미터 자리를 정규화한 형태 (N+1 탐지용)"""
+    return _PARAMS_RE.sub("?", statement)
+
+
+class RequestQueryStats:
+    """요청 하나의 SQL 실행 통계"""
+
+    def __init__(self):
+        self.count = 0
+        self.db_time = 0.0
+        self.shapes: Counter[str] = Counter()
+
+    def record(self, statement: str, elapsed: float) -> None:
+        self.count += 1
+        self.db_time += elapsed
+        self.shapes[statement_shape(statement)] += 1
+
+    def most_repeated(self) -> tuple[str, int] | None:
+        """가장 많이 반복된 문장 형태와 횟수"""
+        top = self.shapes.most_common(1)
+        return top[0] if top else None
+
+    def server_timing(self, total: float) -> str:
+        """Server-Timing 헤더 값 (db: DB 시간과 SQL 문 수, app: 응답 시작까지의 전체 시간)"""
+        return (
+            f'db;dur={self.db_time * 1000:.2f};desc="{self.count} queries", '
+            f"app;dur={total * 1000:.2f}"
+        )
+
+
+def current_query_stats() -> RequestQueryStats | None:
+    """현재 요청의 SQL 통계 (요청 밖이면 None)"""
+    return _current_stats.get()
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    if context is not None and _current_stats.get() is not None:
+        context._query_started = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    stats = _current_stats.get()
+    started = getattr(context, "_query_started", None)
+    if stats is not None and started is not None:
+        stats.record(statement, time.perf_counter() - started)
+
+
+def instrument_engine(target: AsyncEngine) -> None:
+    """엔진에 SQL 계측 이벤트를 등록한다. (execution_options로 만든 파생 엔진에도 적용된다)"""
+    event.listen(target.sync_engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(target.sync_engine, "after_cursor_execute", _after_cursor_execute)
+
+
+@dataclass(frozen=True)
+class QueryBudget:
+    """엔드포인트의 쿼리 예산 (None이면 해당 항목을 검사하지 않는다)"""
+
+    max_queries: int | None
+    max_repeats: int | None
+
+
+def query_budget(
+    max_queries: int | None, max_repeats: int | None
+) -> Callable[[Callable], Callable]:
+    """엔드포인트의 쿼리 예산을 선언한다. 선언이 없으면 SQL_QUERY_BUDGET / SQL_REPEAT_LIMIT을 쓴다.
+
+    라우터 데코레이터 아래에 붙인다:
+        @router.post(...)
+        @query_budget(max_queries=None, max_repeats=None)
+        async def handler(...): ...
+    """
+
+    def decorator(func: Callable) -> Callable:
+        func.__query_budget__ = QueryBudget(max_queries, max_repeats)
+        return func
+
+    return decorator
+
+
+class QueryBudgetExceeded(RuntimeError):
+    """SQL_QUERY_GUARD 모드에서 요청이 쿼리 예산을 넘었을 때 발생한다."""
+
+
+def _budget_for(scope: Scope) -> QueryBudget:
+    endpoint = scope.get("endpoint")
+    declared = getattr(endpoint, "__query_budget__", None)
+    if declared is not None:
+        return declared
+    return QueryBudget(settings.SQL_QUERY_BUDGET, settings.SQL_REPEAT_LIMIT)
+
+
+def budget_violations(stats: RequestQueryStats, budget: QueryBudget) -> list[str]:
+    """예산을 넘은 항목의 설명 목록 (넘지 않았으면 빈 목록)"""
+    violations = []
+    if budget.max_queries is not None and stats.count > budget.max_queries:
+        violations.append(f"SQL 문 {stats.count}개 (예산 {budget.max_queries}개)")
+    repeated = stats.most_repeated()
+    if budget.max_repeats is not None and repeated is not None and repeated[1] >= budget.max_repeats:
+        shape, times = repeated
+        violations.append(f"같은 형태의 문장 {times}회 반복 (N+1 의심): {shape[:200]}")
+    return violations
+
+
+class QueryInstrumentationMiddleware:
+    """요청마다 SQL 통계를 모아 Server-Timing 헤더와 로그로 내보내는 ASGI 미들웨어"""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = RequestQueryStats()
+        token = _current_stats.set(stats)
+        started = time.perf_counter()
+        status_code = 500
+
+        async def send_with_timing(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                MutableHeaders(scope=message).append(
+                    "Server-Timing", stats.server_timing(time.perf_counter() - started)
+                )
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            _current_stats.reset(token)
+            violations = budget_violations(stats, _budget_for(scope))
+            self._log(scope, status_code, stats, time.perf_counter() - started, violations)
+
+        if violations and settings.SQL_QUERY_GUARD:
+            raise QueryBudgetExceeded(
+                f"{scope['method']} {self._route(scope)}: " + "; ".join(violations)
+            )
+
+    @staticmethod
+    def _route(scope: Scope) -> str:
+        """로그에 쓸 경로 (가능하면 id가 들어가지 않는 라우트 템플릿)"""
+        route = scope.get("route")
+        return getattr(route, "path", None) or scope["path"]
+
+    def _log(
+        self,
+        scope: Scope,
+        status_code: int,
+        stats: RequestQueryStats,
+        elapsed: float,
+        violations: list[str],
+    ) -> None:
+        record: dict[str, Any] = {
+            "event": "request_sql",
+            "method": scope["method"],
+            "route": self._route(scope),
+            "status": status_code,
+            "duration_ms": round(elapsed * 1000, 2),
+            "db_ms": round(stats.db_time * 1000, 2),
+            "queries": stats.count,
+            "max_repeats": (stats.most_repeated() or ("", 0))[1],
+        }
+        if violations:
+            record["budget_exceeded"] = violations
+            logger.warning(json.dumps(record, ensure_ascii=False))
+        else:
+            logger.info(json.dumps(record, ensure_ascii=False))
@@ -1,24 +1,46 @@
 """TaskFlow 백엔드 애플리케이션 진입점"""
 
-from contextlib import asynccontextmanager
+import asyncio
+import hmac
+from contextlib import asynccontextmanager, suppress
 
-from fastapi import FastAPI
+from fastapi import Depends, FastAPI, HTTPException, Request, Response, status
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.config import settings
-from app.database import Base, engine
+from app.database import engine, pool_stats, replicas
+from app.utils.access import access_cache
+from app.utils.auth import principal_cache
+from app.utils.consistency import READ_AFTER_HEADER, WriteMarkerMiddleware
+from app.utils.response_cache import response_cache_stats
+from app.events import event_broker, run_event_listener
+from app.instrumentation import QueryInstrumentationMiddleware, instrument_engine
+from app.warmup import run_warmup
 from app.api.auth import router as auth_router
+from app.api.events import router as events_router
 from app.api.projects import router as projects_router
 from app.api.tasks import router as tasks_router
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    """애플리케이션 시작 시 DB 테이블을 생성한다."""
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
+    """애플리케이션 시작 시 DB 커넥션 풀을 예열한다.
+
+    스키마는 Alembic 마이그레이션(alembic upgrade head)으로 관리하며 여기서 생성하지 않는다.
+    워밍업은 백그라운드에서 진행되고, 완료되면 /ready가 200을 반환한다.
+    실시간 이벤트를 위한 LISTEN 커넥션도 백그라운드에서 유지한다.
+    """
+    app.state.ready = False
+    background = [asyncio.create_task(run_warmup(app.state))]
+    if settings.EVENTS_ENABLED:
+        background.append(asyncio.create_task(run_event_listener()))
     yield
+    for task in background:
+        task.cancel()
+        with suppress(asyncio.CancelledError):
+            await task
     await engine.dispose()
+    await replicas.dispose()
 
 
 app = FastAPI(
@@ -34,13 +56,71 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["ETag", "Last-Modified", "Server-Timing", READ_AFTER_HEADER],
 )
+app.add_middleware(WriteMarkerMiddleware)
+
+if settings.SQL_INSTRUMENTATION_ENABLED:
+    for target in (engine, *replicas.engines):
+        instrument_engine(target)
+    app.add_middleware(QueryInstrumentationMiddleware)
 
 app.include_router(auth_router, prefix="/api/v1/auth", tags=["Auth"])
 app.include_router(projects_router, prefix="/api/v1", tags=["Projects"])
 app.include_router(tasks_router, prefix="/api/v1", tags=["Tasks"])
+app.include_router(events_router, prefix="/api/v1", tags=["Events"])
 
 
 @app.get("/health")
 async def health_check():
     return {"status": "ok"}
+
+
+@app.get("/ready")
+async def readiness_check(response: Response):
+    """워밍업이 끝난 워커만 트래픽을 받도록 준비 상태를 반환한다."""
+    if not app.state.ready:
+        response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+        return {"status": "warming_up"}
+    return {"status": "ok"}
+
+
+# METRICS_TOKEN이 없을 때 /metrics를 허용하는 클라이언트 주소 (같은 호스트의 수집기)
+_LOOPBACK_HOSTS = frozenset({"127.0.0.1", "::1", "localhost"})
+
+
+def require_metrics_access(request: Request) -> None:
+    """/metrics 접근 제한: METRICS_TOKEN이 설정되면 Bearer 토큰을, 아니면 루프백 주소를 요구한다.
+
+    리버스 프록시가 같은 호스트에 있으면 외부 요청도 루프백 주소로 보이므로,
+    /metrics는 외부로 라우팅하지 않거나 METRICS_TOKEN을 설정해야 한다.
+    """
+    if settings.METRICS_TOKEN:
+        scheme, _, token = request.headers.get("Authorization", "").partition(" ")
+        allowed = scheme.lower() == "bearer" and hmac.compare_digest(
+            token.encode(), settings.METRICS_TOKEN.encode()
+        )
+    else:
+        allowed = request.client is not None and request.client.host in _LOOPBACK_HOSTS
+    if not allowed:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="메트릭을 조회할 권한이 없습니다",
+        )
+
+
+@app.get("/metrics", dependencies=[Depends(require_metrics_access)])
+async def metrics():
+    """모니터링용 런타임 통계 (커넥션 풀, 프로세스 내 캐시, 응답 캐시, 이벤트 스트림)
+
+    내부 전용 엔드포인트다. (require_metrics_access 참고)
+    """
+    return {
+        "db_pool": pool_stats(),
+        "caches": {
+            "principal": principal_cache.stats(),
+            "project_access": access_cache.stats(),
+            "responses": response_cache_stats(),
+        },
+        "events": event_broker.stats(),
+    }
@@ -1,7 +1,7 @@
 """SQLAlchemy 모델 패키지 — 모든 모델을 임포트하여 Base.metadata에 등록한다."""
 
 from app.models.user import User
-from app.models.project import Project, ProjectMember
+from app.models.project import Project, ProjectCounter, ProjectMember
 from app.models.task import Task
 
-__all__ = ["User", "Project", "ProjectMember", "Task"]
+__all__ = ["User", "Project", "ProjectMember", "ProjectCounter", "Task"]
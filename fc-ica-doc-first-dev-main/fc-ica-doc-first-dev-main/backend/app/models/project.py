@@ -1,9 +1,9 @@
-"""프로젝트(Project) 및 프로젝트 멤버(ProjectMember) 모델"""
+"""프로젝트(Project), 프로젝트 멤버(ProjectMember), 프로젝트 카운터(ProjectCounter) 모델"""
 
 import uuid
 from datetime import datetime, timezone
 
-from sqlalchemy import String, Boolean, DateTime, ForeignKey, UniqueConstraint
+from sqlalchemy import BigInteger, String, Boolean, DateTime, ForeignKey, Index, Integer, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.database import Base
@@ -48,17 +48,25 @@ class ProjectMember(Base):
 
     __tablename__ = "project_members"
     __table_args__ = (
-        UniqueConstraint("project_id", "user_id", name="uq_pm_project_user"),
+        # 중복 가입 방지 + 접근 권한 확인(역할 포함) 커버링 인덱스
+        Index(
+            "uq_pm_project_user",
+            "project_id", "user_id",
+            unique=True,
+            postgresql_include=["role"],
+        ),
+        # 사용자가 속한 프로젝트 조회 (프로젝트 목록)
+        Index("ix_pm_user_project", "user_id", "project_id"),
     )
 
     id: Mapped[uuid.UUID] = mapped_column(
         primary_key=True, default=uuid.uuid4
     )
     project_id: Mapped[uuid.UUID] = mapped_column(
-        ForeignKey("projects.id", ondelete="CASCADE"), nullable=False, index=True
+        ForeignKey("projects.id", ondelete="CASCADE"), nullable=False
     )
     user_id: Mapped[uuid.UUID] = mapped_column(
-        ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True
+        ForeignKey("users.id", ondelete="CASCADE"), nullable=False
     )
     role: Mapped[str] = mapped_column(
         String(20), default="member", nullable=False
@@ -72,3 +80,27 @@ class ProjectMember(Base):
     # 관계
     project = relationship("Project", back_populates="members")
     user = relationship("User", back_populates="memberships")
+
+
+class ProjectCounter(Base):
+    """프로젝트별 집계 카운터 테이블 (비정규화)
+
+    태스크/멤버 변경과 같은 트랜잭션에서 증감되며,
+    scripts/rebuild_counters.py로 원본 테이블에서 재계산할 수 있다.
+    version/changed_at은 프로젝트 변경 표식으로, 조건부 GET(ETag)에 사용된다.
+    """
+
+    __tablename__ = "project_counters"
+
+    project_id: Mapped[uuid.UUID] = mapped_column(
+        ForeignKey("projects.id", ondelete="CASCADE"), primary_key=True
+    )
+    todo_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    in_progress_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    done_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    total_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    member_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    version: Mapped[int] = mapped_column(BigInteger, default=0, nullable=False)
+    changed_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
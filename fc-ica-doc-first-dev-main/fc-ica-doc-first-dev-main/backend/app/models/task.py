@@ -3,16 +3,61 @@
 import uuid
 from datetime import datetime, timezone
 
-from sqlalchemy import String, Text, Integer, Boolean, DateTime, ForeignKey
+from sqlalchemy import String, Text, Float, Boolean, Computed, DateTime, ForeignKey, Index, text
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.database import Base
 
 
+# 전문 검색 설정: 한국어 형태소 분석기가 없으므로 공백/구두점 단위로 나누는 simple을 사용한다
+SEARCH_CONFIG = "simple"
+
+# 제목(A)이 설명(B)보다 높은 가중치를 갖는 검색 벡터 (생성 컬럼, DB가 유지한다)
+SEARCH_VECTOR_EXPR = (
+    f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(title, '')), 'A') || "
+    f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(description, '')), 'B')"
+)
+
+
 class Task(Base):
     """태스크 테이블"""
 
     __tablename__ = "tasks"
+    __table_args__ = (
+        # 칸반 컬럼 조회/정렬, 컬럼 맨 뒤 position 조회, 커서 페이지네이션
+        Index(
+            "ix_tasks_board",
+            "project_id", "status", "position", "id",
+            postgresql_where=text("is_deleted = false"),
+        ),
+        # 상태 필터 없는 목록 (position / created_at 정렬)
+        Index(
+            "ix_tasks_project_position",
+            "project_id", "position", "id",
+            postgresql_where=text("is_deleted = false"),
+        ),
+        Index(
+            "ix_tasks_project_created_at",
+            "project_id", "created_at", "id",
+            postgresql_where=text("is_deleted = false"),
+        ),
+        # 담당자 필터
+        Index(
+            "ix_tasks_project_assignee",
+            "project_id", "assignee_id",
+            postgresql_where=text("is_deleted = false"),
+        ),
+        # 변경분 동기화 (삭제된 태스크 포함)
+        Index("ix_tasks_project_updated_at", "project_id", "updated_at", "id"),
+        # 제목/설명 전문 검색
+        Index(
+            "ix_tasks_search",
+            "search_vector",
+            postgresql_using="gin",
+            postgresql_where=text("is_deleted = false"),
+        ),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(
         primary_key=True, default=uuid.uuid4
@@ -23,12 +68,13 @@ class Task(Base):
     title: Mapped[str] = mapped_column(String(200), nullable=False)
     description: Mapped[str | None] = mapped_column(Text, nullable=True)
     status: Mapped[str] = mapped_column(
-        String(20), default="TODO", nullable=False, index=True
+        String(20), default="TODO", nullable=False
     )
     priority: Mapped[str] = mapped_column(
         String(20), default="MEDIUM", nullable=False
     )
-    position: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    # 컬럼 내 순서 (분수 랭크, app/utils/ranking.py 참고)
+    position: Mapped[float] = mapped_column(Float, default=0, nullable=False)
     assignee_id: Mapped[uuid.UUID | None] = mapped_column(
         ForeignKey("users.id", ondelete="SET NULL"), nullable=True, index=True
     )
@@ -49,6 +95,10 @@ class Task(Base):
         onupdate=lambda: datetime.now(timezone.utc),
         nullable=False,
     )
+    # 검색 전용 컬럼: 일반 조회에서는 읽지 않는다
+    search_vector: Mapped[str | None] = mapped_column(
+        TSVECTOR, Computed(SEARCH_VECTOR_EXPR, persisted=True), deferred=True
+    )
 
     # 관계
     project = relationship("Project", back_populates="tasks")
@@ -74,9 +74,10 @@ class ProjectListItem(BaseModel):
 class ProjectListResponse(BaseModel):
     """프로젝트 목록 응답 (페이지네이션)"""
     items: list[ProjectListItem]
-    total: int
-    page: int
+    total: int | None = None
+    page: int | None = None
     size: int
+    next_cursor: str | None = None
 
 
 class MemberAdd(BaseModel):
@@ -4,7 +4,7 @@ import uuid
 from datetime import datetime
 from enum import Enum
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, EmailStr, Field
 
 from app.schemas.user import UserBrief
 
@@ -40,7 +40,23 @@ class TaskUpdate(BaseModel):
     status: TaskStatus | None = None
     priority: TaskPriority | None = None
     assignee_id: uuid.UUID | None = None
-    position: int | None = Field(default=None, ge=0)
+    position: float | None = Field(default=None, ge=0)
+
+
+class TaskMove(BaseModel):
+    """태스크 이동 (after_id 뒤, before_id 앞으로 이동)
+
+    after_id/before_id가 모두 없으면 대상 컬럼의 맨 뒤로 이동한다.
+    """
+    task_id: uuid.UUID
+    status: TaskStatus | None = None
+    after_id: uuid.UUID | None = None
+    before_id: uuid.UUID | None = None
+
+
+class TaskMoveRequest(BaseModel):
+    """태스크 일괄 이동 요청 (순서대로 하나의 트랜잭션에서 적용)"""
+    moves: list[TaskMove] = Field(min_length=1, max_length=100)
 
 
 class TaskResponse(BaseModel):
@@ -51,7 +67,7 @@ class TaskResponse(BaseModel):
     description: str | None
     status: str
     priority: str
-    position: int
+    position: float
     assignee: UserBrief | None = None
     created_by: UserBrief | None = None
     created_at: datetime
@@ -61,6 +77,80 @@ class TaskResponse(BaseModel):
 class TaskListResponse(BaseModel):
     """태스크 목록 응답 (페이지네이션)"""
     items: list[TaskResponse]
-    total: int
-    page: int
+    total: int | None = None
+    page: int | None = None
     size: int
+    next_cursor: str | None = None
+
+
+class TaskSearchHit(TaskResponse):
+    """태스크 검색 결과 항목 (순위, <mark>로 감싼 하이라이트 포함)"""
+    rank: float
+    title_highlight: str
+    description_highlight: str | None = None
+
+
+class TaskSearchResponse(BaseModel):
+    """태스크 검색 응답 (커서 페이지네이션)"""
+    items: list[TaskSearchHit]
+    size: int
+    next_cursor: str | None = None
+
+
+class TaskChangesResponse(BaseModel):
+    """태스크 변경분 응답 (since 이후 생성/수정/삭제된 태스크)"""
+    items: list[TaskResponse]
+    deleted_ids: list[uuid.UUID]
+    next_since: str
+    has_more: bool
+
+
+class TaskBatchUpdate(TaskUpdate):
+    """일괄 수정 항목 (수정할 태스크 id 포함)"""
+    id: uuid.UUID
+
+
+class TaskBatchRequest(BaseModel):
+    """태스크 일괄 생성/수정/삭제 요청"""
+    create: list[TaskCreate] = Field(default_factory=list, max_length=500)
+    update: list[TaskBatchUpdate] = Field(default_factory=list, max_length=500)
+    delete: list[uuid.UUID] = Field(default_factory=list, max_length=500)
+
+
+class TaskBatchItemResult(BaseModel):
+    """일괄 처리 항목별 결과"""
+    index: int
+    status: str
+    id: uuid.UUID | None = None
+    data: TaskResponse | None = None
+    message: str | None = None
+
+
+class TaskBatchResponse(BaseModel):
+    """태스크 일괄 처리 응답"""
+    created: list[TaskBatchItemResult]
+    updated: list[TaskBatchItemResult]
+    deleted: list[TaskBatchItemResult]
+
+
+class TaskImportRow(BaseModel):
+    """태스크 가져오기 파일의 행 (담당자는 이메일로 지정)"""
+    title: str = Field(min_length=1, max_length=200)
+    description: str | None = Field(default=None, max_length=2000)
+    status: TaskStatus = TaskStatus.TODO
+    priority: TaskPriority = TaskPriority.MEDIUM
+    assignee_email: EmailStr | None = None
+
+
+class TaskImportError(BaseModel):
+    """가져오기 실패 행 (파일의 줄 번호)"""
+    line: int
+    message: str
+
+
+class TaskImportResponse(BaseModel):
+    """태스크 가져오기 응답"""
+    created: int
+    failed: int
+    errors: list[TaskImportError]
+    errors_truncated: bool
@@ -0,0 +1,155 @@
+"""프로젝트 접근 권한 유틸리티: 존재/삭제 여부와 멤버 역할 확인, 결과 캐시
+
+캐시는 primary에서 읽은 결과만 저장한다. 프로젝트/멤버십이 바뀌면 쓰기 트랜잭션이 커밋된 뒤
+이 워커의 항목을 제거하고, 같은 트랜잭션에서 보낸 NOTIFY로 다른 워커의 항목도 제거한다.
+EVENTS_ENABLED=False이거나 LISTEN 커넥션이 끊긴 동안에는 다른 워커의 항목이
+최대 ACCESS_CACHE_TTL_SECONDS 동안 이전 판단을 유지할 수 있다. (재연결 시 캐시 전체를 비운다)
+"""
+
+import uuid
+from dataclasses import dataclass
+
+from fastapi import HTTPException, status
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.events import notify_channel, register_channel
+from app.utils.cache import MISSING, TTLCache
+from app.utils.queries import project_access_query
+
+# 워커 간 접근 판단 캐시 무효화 채널 (payload: "<project_id hex>:<user_id hex 또는 빈 문자열>")
+ACCESS_CHANNEL = "taskflow_access_invalidations"
+
+# 커밋 후 적용할 무효화 목록을 담는 session.info 키
+_PENDING_KEY = "access_invalidations"
+
+
+@dataclass(frozen=True)
+class ProjectAccess:
+    """(project_id, user_id)에 대한 접근 판단 결과"""
+
+    exists: bool
+    is_deleted: bool
+    role: str | None
+
+    @property
+    def is_member(self) -> bool:
+        return self.role is not None
+
+    @property
+    def is_owner(self) -> bool:
+        return self.role == "owner"
+
+
+# 접근 판단 캐시: (project_id, user_id) → ProjectAccess
+access_cache = TTLCache(
+    maxsize=settings.ACCESS_CACHE_SIZE,
+    ttl=settings.ACCESS_CACHE_TTL_SECONDS,
+)
+
+# 무효화가 일어날 때마다 증가한다. 조회 중에 무효화된 결과를 캐시하지 않기 위해 사용한다
+_generation = 0
+
+
+async def get_project_access(
+    project_id: uuid.UUID, user_id: uuid.UUID, db: AsyncSession
+) -> ProjectAccess:
+    """프로젝트 존재/삭제 여부와 사용자 역할을 한 번의 쿼리로 조회한다. 결과는 캐시된다."""
+    key = (project_id, user_id)
+    access = access_cache.get(key)
+    if access is not MISSING:
+        return access
+
+    generation = _generation
+    result = await db.execute(project_access_query(project_id, user_id))
+    row = result.one_or_none()
+    if row is None:
+        access = ProjectAccess(exists=False, is_deleted=False, role=None)
+    else:
+        access = ProjectAccess(exists=True, is_deleted=row.is_deleted, role=row.role)
+
+    # 복제본은 복제 지연이 있을 수 있으므로 복제본에서 읽은 결과는 캐시하지 않는다
+    if not db.info.get("replica") and generation == _generation:
+        access_cache.set(key, access)
+    return access
+
+
+async def check_project_access(
+    project_id: uuid.UUID,
+    user_id: uuid.UUID,
+    db: AsyncSession,
+    owner_only: bool = False,
+) -> ProjectAccess:
+    """프로젝트가 없거나 삭제됐으면 404, 멤버(또는 소유자)가 아니면 403을 반환한다."""
+    access = await get_project_access(project_id, user_id, db)
+    if not access.exists or access.is_deleted:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="프로젝트를 찾을 수 없습니다",
+        )
+    if not access.is_member:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="이 프로젝트에 접근할 권한이 없습니다",
+        )
+    if owner_only and not access.is_owner:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="프로젝트 소유자만 수행할 수 있습니다",
+        )
+    return access
+
+
+def _drop_project_access(project_id: uuid.UUID, user_id: uuid.UUID | None) -> None:
+    """이 워커의 접근 판단 캐시 항목을 제거한다. user_id가 없으면 프로젝트의 모든 항목을 제거한다."""
+    global _generation
+    _generation += 1
+    if user_id is not None:
+        access_cache.invalidate((project_id, user_id))
+    else:
+        access_cache.invalidate_where(lambda key: key[0] == project_id)
+
+
+async def invalidate_project_access(
+    db: AsyncSession, project_id: uuid.UUID, user_id: uuid.UUID | None = None
+) -> None:
+    """접근 판단 캐시 무효화를 현재 트랜잭션에 예약한다.
+
+    커밋 전에 제거하면 동시 요청이 이전 값을 다시 캐시할 수 있으므로, 이 워커의 항목은
+    커밋 후에 제거하고 다른 워커에는 NOTIFY(커밋 시 전달)로 알린다. 롤백되면 아무것도 제거하지 않는다.
+    """
+    db.info.setdefault(_PENDING_KEY, []).append((project_id, user_id))
+    await notify_channel(
+        db, ACCESS_CHANNEL, f"{project_id.hex}:{user_id.hex if user_id else ''}"
+    )
+
+
+@event.listens_for(Session, "after_commit")
+def _apply_pending_invalidations(session: Session) -> None:
+    for project_id, user_id in session.info.pop(_PENDING_KEY, ()):
+        _drop_project_access(project_id, user_id)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_pending_invalidations(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
+
+
+def _on_access_notification(payload: str) -> None:
+    """다른 워커(또는 이 워커)에서 커밋된 무효화를 적용한다."""
+    project_hex, _, user_hex = payload.partition(":")
+    _drop_project_access(
+        uuid.UUID(project_hex), uuid.UUID(user_hex) if user_hex else None
+    )
+
+
+def _on_listener_reconnect() -> None:
+    """LISTEN 커넥션이 끊긴 동안의 무효화는 유실됐을 수 있으므로 캐시를 비운다."""
+    global _generation
+    _generation += 1
+    access_cache.clear()
+
+
+register_channel(ACCESS_CHANNEL, _on_access_notification, _on_listener_reconnect)
@@ -1,24 +1,48 @@
 """인증 유틸리티: 비밀번호 해싱, JWT 토큰, 현재 사용자 의존성"""
 
+import asyncio
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from jose import JWTError, jwt
 from passlib.context import CryptContext
-from sqlalchemy import select
+from sqlalchemy import event, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import make_transient_to_detached
 
 from app.config import settings
-from app.database import get_db
+from app.database import async_read_session, get_db
 from app.models.user import User
-
-# 비밀번호 해싱 컨텍스트
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+from app.utils.cache import MISSING, TTLCache
+
+# 비밀번호 해싱 컨텍스트 (설정된 cost와 다른 해시는 needs_update 대상이 된다)
+pwd_context = CryptContext(
+    schemes=["bcrypt"],
+    deprecated="auto",
+    bcrypt__rounds=settings.PASSWORD_HASH_ROUNDS,
+)
+
+# bcrypt 전용 스레드 풀: 이벤트 루프를 막지 않도록 해싱/검증을 위임한다
+_hash_executor = ThreadPoolExecutor(
+    max_workers=settings.PASSWORD_HASH_WORKERS,
+    thread_name_prefix="password-hash",
+)
+_hash_pending = 0
 
 # Bearer 토큰 스키마
 security = HTTPBearer()
 
+# 인증된 사용자 캐시: user_id → User 컬럼 값 스냅샷
+principal_cache = TTLCache(
+    maxsize=settings.AUTH_CACHE_SIZE,
+    ttl=settings.AUTH_CACHE_TTL_SECONDS,
+)
+
+_USER_COLUMNS = [attr.key for attr in User.__mapper__.column_attrs]
+
 
 def hash_password(password: str) -> str:
     """비밀번호를 bcrypt로 해싱한다."""
@@ -30,6 +54,39 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
 
 
+async def _run_in_hash_pool(func, *args):
+    """bcrypt 작업을 전용 스레드 풀에서 실행한다. 대기열이 가득 차면 503을 반환한다."""
+    global _hash_pending
+    if _hash_pending >= settings.PASSWORD_HASH_MAX_PENDING:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="요청이 많아 처리할 수 없습니다. 잠시 후 다시 시도해 주세요",
+        )
+    _hash_pending += 1
+    try:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_hash_executor, func, *args)
+    finally:
+        _hash_pending -= 1
+
+
+async def hash_password_async(password: str) -> str:
+    """비밀번호를 스레드 풀에서 bcrypt로 해싱한다."""
+    return await _run_in_hash_pool(pwd_context.hash, password)
+
+
+async def verify_and_update_password(
+    plain_password: str, hashed_password: str
+) -> tuple[bool, str | None]:
+    """비밀번호를 스레드 풀에서 검증한다.
+
+    검증에 성공했고 저장된 해시의 cost가 설정과 다르면 새 해시를 함께 반환한다.
+    """
+    return await _run_in_hash_pool(
+        pwd_context.verify_and_update, plain_password, hashed_password
+    )
+
+
 def create_access_token(
     data: dict,
     expires_delta: timedelta | None = None,
@@ -51,12 +108,11 @@ def create_refresh_token(data: dict) -> str:
     return jwt.encode(to_encode, settings.JWT_SECRET, algorithm=settings.JWT_ALGORITHM)
 
 
-async def get_current_user(
-    credentials: HTTPAuthorizationCredentials = Depends(security),
-    db: AsyncSession = Depends(get_db),
-) -> User:
-    """Authorization 헤더의 JWT를 검증하고 현재 사용자를 반환한다."""
-    token = credentials.credentials
+async def get_user_from_token(token: str, db: AsyncSession) -> User:
+    """JWT를 검증하고 토큰의 사용자를 반환한다.
+
+    헤더를 설정할 수 없는 이벤트 스트림(EventSource)처럼 쿼리 파라미터로 토큰을 받는 경로에서도 사용한다.
+    """
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="인증이 필요합니다",
@@ -68,11 +124,75 @@ async def get_current_user(
         user_id: str | None = payload.get("sub")
         if user_id is None:
             raise credentials_exception
-    except JWTError:
+        user_uuid = uuid.UUID(user_id)
+    except (JWTError, ValueError):
         raise credentials_exception
 
-    result = await db.execute(select(User).where(User.id == user_id))
+    snapshot = principal_cache.get(user_uuid)
+    if snapshot is not MISSING:
+        return _user_from_snapshot(snapshot)
+
+    result = await db.execute(select(User).where(User.id == user_uuid))
     user = result.scalar_one_or_none()
     if user is None:
         raise credentials_exception
+    principal_cache.set(
+        user_uuid, {key: getattr(user, key) for key in _USER_COLUMNS}
+    )
+    return user
+
+
+def token_expires_at(token: str) -> float | None:
+    """토큰의 만료 시각(exp, epoch 초)을 반환한다. get_user_from_token으로 검증한 토큰에만 사용한다."""
+    try:
+        exp = jwt.get_unverified_claims(token).get("exp")
+    except JWTError:
+        return None
+    return float(exp) if exp is not None else None
+
+
+async def get_current_user(
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    db: AsyncSession = Depends(get_db),
+) -> User:
+    """Authorization 헤더의 JWT를 검증하고 현재 사용자를 반환한다. (쓰기 엔드포인트용)
+
+    읽기 전용 엔드포인트는 get_current_read_user를 사용한다.
+    """
+    user = await get_user_from_token(credentials.credentials, db)
+    # 쓰기 요청 커밋 후 read-your-writes 기록에 사용된다 (app.database.get_db)
+    db.info["user_id"] = user.id
     return user
+
+
+async def get_current_read_user(
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+) -> User:
+    """읽기 전용 엔드포인트용 현재 사용자 의존성
+
+    primary 쓰기 세션(get_db)을 열지 않는다. 인증 캐시에 없을 때만 짧은 읽기 전용 세션으로
+    사용자를 조회하고 커넥션을 바로 반환한다.
+    """
+    async with async_read_session() as db:
+        return await get_user_from_token(credentials.credentials, db)
+
+
+def _user_from_snapshot(snapshot: dict) -> User:
+    """캐시된 컬럼 값으로 분리(detached) 상태의 User 인스턴스를 만든다.
+
+    요청마다 새 인스턴스를 만들어 세션 간에 ORM 객체를 공유하지 않는다.
+    """
+    user = User(**snapshot)
+    make_transient_to_detached(user)
+    return user
+
+
+def invalidate_principal(user_id: uuid.UUID) -> None:
+    """사용자 행이 변경/삭제됐을 때 캐시된 인증 정보를 제거한다."""
+    principal_cache.invalidate(user_id)
+
+
+@event.listens_for(User, "after_update")
+@event.listens_for(User, "after_delete")
+def _invalidate_on_user_change(mapper, connection, target: User) -> None:
+    invalidate_principal(target.id)
@@ -0,0 +1,100 @@
+"""프로세스 내 캐시 유틸리티: 크기 제한(LRU) + 만료 시간(TTL) 캐시"""
+
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from typing import Any
+
+# 캐시 미스를 None 값과 구분하기 위한 센티널
+MISSING = object()
+
+
+class TTLCache:
+    """크기 제한과 TTL을 가진 LRU 캐시
+
+    asyncio 이벤트 루프 한 스레드에서만 사용한다고 가정하므로 잠금을 사용하지 않는다.
+    hits/misses/evictions 카운터는 모니터링용으로 노출된다.
+    on_remove는 항목이 빠질 때(만료, LRU 제거, 덮어쓰기, 무효화) (키, 값)으로 호출된다.
+    """
+
+    def __init__(
+        self,
+        maxsize: int,
+        ttl: float,
+        timer: Callable[[], float] = time.monotonic,
+        on_remove: Callable[[Hashable, Any], None] | None = None,
+    ):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._timer = timer
+        self._on_remove = on_remove
+        self._data: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable, default: Any = MISSING) -> Any:
+        """키에 해당하는 값을 반환한다. 없거나 만료됐으면 default를 반환한다."""
+        entry = self._data.get(key)
+        if entry is not None:
+            expires_at, value = entry
+            if expires_at > self._timer():
+                self._data.move_to_end(key)
+                self.hits += 1
+                return value
+            del self._data[key]
+            self._removed(key, value)
+        self.misses += 1
+        return default
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """값을 저장한다. 크기를 넘으면 가장 오래 사용되지 않은 항목을 제거한다."""
+        if self.maxsize <= 0:
+            return
+        previous = self._data.get(key)
+        self._data[key] = (self._timer() + self.ttl, value)
+        self._data.move_to_end(key)
+        if previous is not None:
+            self._removed(key, previous[1])
+        while len(self._data) > self.maxsize:
+            evicted_key, (_, evicted) = self._data.popitem(last=False)
+            self.evictions += 1
+            self._removed(evicted_key, evicted)
+
+    def invalidate(self, key: Hashable) -> None:
+        """특정 키를 제거한다."""
+        entry = self._data.pop(key, None)
+        if entry is not None:
+            self._removed(key, entry[1])
+
+    def invalidate_where(self, predicate: Callable[[Hashable], bool]) -> None:
+        """조건을 만족하는 키를 모두 제거한다."""
+        for key in [k for k in self._data if predicate(k)]:
+            self.invalidate(key)
+
+    def items(self) -> list[tuple[Hashable, Any]]:
+        """저장된 (키, 값) 목록을 반환한다. 만료 여부는 확인하지 않으며 통계에 반영되지 않는다."""
+        return [(key, value) for key, (_, value) in self._data.items()]
+
+    def clear(self) -> None:
+        """모든 항목을 제거한다."""
+        data, self._data = self._data, OrderedDict()
+        for key, (_, value) in data.items():
+            self._removed(key, value)
+
+    def _removed(self, key: Hashable, value: Any) -> None:
+        if self._on_remove is not None:
+            self._on_remove(key, value)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def stats(self) -> dict[str, int]:
+        """모니터링용 통계를 반환한다."""
+        return {
+            "size": len(self._data),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
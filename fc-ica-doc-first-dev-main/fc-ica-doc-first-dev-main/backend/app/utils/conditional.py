@@ -0,0 +1,62 @@
+"""조건부 GET 유틸리티: 프로젝트 변경 표식 기반 약한 ETag / Last-Modified / 304 응답"""
+
+import uuid
+from datetime import datetime, timezone
+from email.utils import format_datetime
+
+from fastapi import Request, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.utils.counters import get_project_version
+
+
+class ProjectValidator:
+    """프로젝트 단위 응답의 검증자(ETag, Last-Modified)
+
+    같은 프로젝트의 태스크/멤버/프로젝트 정보가 바뀌면 version이 올라가므로,
+    (리소스 종류, 프로젝트, version)이 같으면 응답 본문도 같다고 본다.
+    """
+
+    def __init__(self, scope: str, project_id: uuid.UUID, version: int, changed_at: datetime):
+        self.etag = f'W/"{scope}-{project_id.hex}-{version}"'
+        self.last_modified = format_datetime(
+            changed_at.astimezone(timezone.utc), usegmt=True
+        )
+
+    def matches(self, request: Request) -> bool:
+        """If-None-Match가 현재 ETag와 일치하는지 확인한다. (약한 비교)"""
+        header = request.headers.get("if-none-match")
+        if not header:
+            return False
+        if header.strip() == "*":
+            return True
+        current = self.etag.removeprefix("W/")
+        return any(
+            tag.strip().removeprefix("W/") == current for tag in header.split(",")
+        )
+
+    def apply(self, response: Response) -> Response:
+        """응답에 ETag / Last-Modified / Cache-Control 헤더를 설정한다."""
+        response.headers["ETag"] = self.etag
+        response.headers["Last-Modified"] = self.last_modified
+        # 클라이언트는 캐시된 응답을 쓰기 전에 항상 재검증한다
+        response.headers["Cache-Control"] = "private, no-cache"
+        return response
+
+    def not_modified(self) -> Response:
+        """304 Not Modified 응답을 만든다."""
+        return self.apply(Response(status_code=status.HTTP_304_NOT_MODIFIED))
+
+
+async def get_project_validator(
+    db: AsyncSession, scope: str, project_id: uuid.UUID
+) -> ProjectValidator | None:
+    """프로젝트의 현재 검증자를 조회한다. 카운터 행이 없으면 None (조건부 처리 생략)
+
+    본문 조회보다 먼저 호출해야 한다. 그래야 본문이 표식보다 오래된 상태로
+    캐시되는 일이 없다. (표식보다 새로운 본문은 다음 요청에서 다시 받게 된다)
+    """
+    marker = await get_project_version(db, project_id)
+    if marker is None:
+        return None
+    return ProjectValidator(scope, project_id, *marker)
@@ -0,0 +1,74 @@
+"""read-your-writes 표식: 쓰기 직후의 읽기를 다른 워커에서도 primary로 보내기 위한 서명된 토큰
+
+쓰기 요청이 커밋되면 응답에 X-Read-After 헤더(사용자 id, 만료 시각, HMAC 서명)를 붙인다.
+클라이언트가 이후 요청에 같은 헤더를 보내면, 어느 워커가 요청을 받더라도 만료 전까지
+해당 사용자의 읽기를 primary에서 처리한다. (워커 내 recent_writers는 헤더를 보내지 않는 클라이언트용)
+"""
+
+import hashlib
+import hmac
+import time
+import uuid
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.config import settings
+
+READ_AFTER_HEADER = "X-Read-After"
+
+# 커밋된 쓰기의 표식을 응답 헤더로 넘기기 위한 request.state 키
+_STATE_KEY = "write_marker"
+
+
+def _sign(payload: str) -> str:
+    return hmac.new(
+        settings.JWT_SECRET.encode(), payload.encode(), hashlib.sha256
+    ).hexdigest()[:32]
+
+
+def issue_write_marker(user_id: uuid.UUID) -> str:
+    """READ_YOUR_WRITES_SECONDS 동안 유효한 표식을 만든다."""
+    expires = int((time.time() + settings.READ_YOUR_WRITES_SECONDS) * 1000)
+    payload = f"{user_id.hex}.{expires}"
+    return f"{payload}.{_sign(payload)}"
+
+
+def has_fresh_write_marker(marker: str | None, user_id: uuid.UUID) -> bool:
+    """표식이 이 사용자의 것이고 서명이 맞으며 아직 만료되지 않았는지 확인한다."""
+    if not marker:
+        return False
+    try:
+        user_hex, expires, signature = marker.split(".")
+        expires_ms = int(expires)
+    except ValueError:
+        return False
+    if user_hex != user_id.hex or expires_ms < time.time() * 1000:
+        return False
+    return hmac.compare_digest(signature, _sign(f"{user_hex}.{expires}"))
+
+
+def record_write(scope_state: dict, user_id: uuid.UUID) -> None:
+    """커밋된 쓰기를 기록한다. 응답 시작 시 WriteMarkerMiddleware가 헤더로 내보낸다."""
+    scope_state[_STATE_KEY] = issue_write_marker(user_id)
+
+
+class WriteMarkerMiddleware:
+    """쓰기 요청의 응답에 X-Read-After 헤더를 붙이는 ASGI 미들웨어"""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_marker(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                marker = scope.get("state", {}).get(_STATE_KEY)
+                if marker is not None:
+                    MutableHeaders(scope=message).append(READ_AFTER_HEADER, marker)
+            await send(message)
+
+        await self.app(scope, receive, send_with_marker)
@@ -0,0 +1,240 @@
+"""프로젝트 카운터 유틸리티: 태스크/멤버 집계 증감, 변경 표식(version), 재계산, 검증"""
+
+import uuid
+from datetime import datetime
+
+from sqlalchemy import func, or_, select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.project import Project, ProjectCounter, ProjectMember
+from app.models.task import Task
+
+# 태스크 상태 → 카운터 컬럼 매핑
+STATUS_COLUMNS = {
+    "TODO": "todo_count",
+    "IN_PROGRESS": "in_progress_count",
+    "DONE": "done_count",
+}
+
+
+async def init_project_counters(
+    db: AsyncSession, project_id: uuid.UUID, member_count: int = 1
+) -> None:
+    """새 프로젝트의 카운터 행을 생성한다."""
+    await db.execute(
+        insert(ProjectCounter).values(
+            project_id=project_id,
+            todo_count=0,
+            in_progress_count=0,
+            done_count=0,
+            total_count=0,
+            member_count=member_count,
+        )
+    )
+
+
+async def lock_project_counters(db: AsyncSession, project_id: uuid.UUID) -> None:
+    """프로젝트 카운터 행을 잠근다. 같은 프로젝트의 position 계산을 직렬화하는 데 사용한다."""
+    await db.execute(
+        select(ProjectCounter.project_id)
+        .where(ProjectCounter.project_id == project_id)
+        .with_for_update()
+    )
+
+
+def _touch_values() -> dict:
+    """프로젝트 변경 표식을 갱신하는 UPDATE 값"""
+    return {
+        "version": ProjectCounter.version + 1,
+        "changed_at": func.now(),
+    }
+
+
+async def touch_project(db: AsyncSession, project_id: uuid.UUID) -> None:
+    """카운터 변화 없이 프로젝트 내용이 바뀐 경우 변경 표식(version)만 올린다."""
+    await db.execute(
+        update(ProjectCounter)
+        .where(ProjectCounter.project_id == project_id)
+        .values(_touch_values())
+    )
+
+
+async def get_project_version(
+    db: AsyncSession, project_id: uuid.UUID
+) -> tuple[int, datetime] | None:
+    """프로젝트 변경 표식 (version, changed_at)을 반환한다. 카운터 행이 없으면 None"""
+    result = await db.execute(
+        select(ProjectCounter.version, ProjectCounter.changed_at).where(
+            ProjectCounter.project_id == project_id
+        )
+    )
+    row = result.first()
+    return (row.version, row.changed_at) if row is not None else None
+
+
+async def get_member_projects_version(db: AsyncSession, user_id: uuid.UUID) -> str:
+    """사용자가 멤버인 프로젝트 전체의 변경 표식을 반환한다. (프로젝트 수, version 합계)
+
+    멤버십이 바뀌거나 어느 한 프로젝트라도 변경되면 값이 달라진다.
+    """
+    result = await db.execute(
+        select(func.count(), func.coalesce(func.sum(ProjectCounter.version), 0))
+        .select_from(ProjectMember)
+        .join(ProjectCounter, ProjectCounter.project_id == ProjectMember.project_id)
+        .where(ProjectMember.user_id == user_id)
+    )
+    count, version_sum = result.one()
+    return f"{count}-{version_sum}"
+
+
+async def apply_task_count_deltas(
+    db: AsyncSession, project_id: uuid.UUID, deltas: dict[str, int]
+) -> None:
+    """상태별 증감량을 한 번의 UPDATE로 반영하고 변경 표식을 올린다.
+
+    전체 카운트는 증감량 합계만큼 바뀐다. 증감량이 없어도 변경 표식은 올린다.
+    """
+    deltas = {s: d for s, d in deltas.items() if d}
+    values = _touch_values()
+    values |= {
+        STATUS_COLUMNS[s]: getattr(ProjectCounter, STATUS_COLUMNS[s]) + d
+        for s, d in deltas.items()
+    }
+    total_delta = sum(deltas.values())
+    if total_delta:
+        values["total_count"] = ProjectCounter.total_count + total_delta
+    await db.execute(
+        update(ProjectCounter)
+        .where(ProjectCounter.project_id == project_id)
+        .values(values)
+    )
+
+
+async def bump_task_counters(
+    db: AsyncSession, project_id: uuid.UUID, status: str, delta: int
+) -> None:
+    """태스크 생성/삭제 시 상태별 카운트와 전체 카운트를 증감한다."""
+    await apply_task_count_deltas(db, project_id, {status: delta})
+
+
+async def move_task_counters(
+    db: AsyncSession, project_id: uuid.UUID, old_status: str, new_status: str
+) -> None:
+    """태스크 상태 변경 시 이전 상태에서 새 상태로 카운트를 옮긴다."""
+    if old_status == new_status:
+        return
+    await apply_task_count_deltas(db, project_id, {old_status: -1, new_status: 1})
+
+
+async def bump_member_count(
+    db: AsyncSession, project_id: uuid.UUID, delta: int
+) -> None:
+    """멤버 추가/제거 시 멤버 수를 증감하고 변경 표식을 올린다."""
+    await db.execute(
+        update(ProjectCounter)
+        .where(ProjectCounter.project_id == project_id)
+        .values(member_count=ProjectCounter.member_count + delta, **_touch_values())
+    )
+
+
+def _computed_counters_stmt(project_id: uuid.UUID | None = None):
+    """원본 테이블(tasks, project_members)에서 카운터 값을 계산하는 SELECT를 만든다."""
+    task_counts = (
+        select(
+            Task.project_id,
+            func.count().filter(Task.status == "TODO").label("todo_count"),
+            func.count().filter(Task.status == "IN_PROGRESS").label("in_progress_count"),
+            func.count().filter(Task.status == "DONE").label("done_count"),
+            func.count().label("total_count"),
+        )
+        .where(Task.is_deleted == False)  # noqa: E712
+        .group_by(Task.project_id)
+        .subquery()
+    )
+    member_counts = (
+        select(
+            ProjectMember.project_id,
+            func.count().label("member_count"),
+        )
+        .group_by(ProjectMember.project_id)
+        .subquery()
+    )
+    stmt = (
+        select(
+            Project.id.label("project_id"),
+            func.coalesce(task_counts.c.todo_count, 0).label("todo_count"),
+            func.coalesce(task_counts.c.in_progress_count, 0).label("in_progress_count"),
+            func.coalesce(task_counts.c.done_count, 0).label("done_count"),
+            func.coalesce(task_counts.c.total_count, 0).label("total_count"),
+            func.coalesce(member_counts.c.member_count, 0).label("member_count"),
+        )
+        .outerjoin(task_counts, task_counts.c.project_id == Project.id)
+        .outerjoin(member_counts, member_counts.c.project_id == Project.id)
+    )
+    if project_id is not None:
+        stmt = stmt.where(Project.id == project_id)
+    return stmt
+
+
+async def rebuild_project_counters(
+    db: AsyncSession, project_id: uuid.UUID | None = None
+) -> int:
+    """카운터를 원본 테이블에서 재계산해 덮어쓴다. 생성되거나 값이 바뀐 행 수를 반환한다.
+
+    값이 바뀐 행은 변경 표식(version, changed_at)도 올려, 잘못된 카운터를 담은
+    ETag/응답 캐시 항목이 더 이상 사용되지 않게 한다.
+    """
+    columns = (
+        "todo_count",
+        "in_progress_count",
+        "done_count",
+        "total_count",
+        "member_count",
+    )
+    computed = _computed_counters_stmt(project_id).subquery()
+    stmt = insert(ProjectCounter).from_select(["project_id", *columns], select(computed))
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[ProjectCounter.project_id],
+        set_={
+            **{column: stmt.excluded[column] for column in columns},
+            **_touch_values(),
+        },
+        where=or_(
+            *(getattr(ProjectCounter, column) != stmt.excluded[column] for column in columns)
+        ),
+    )
+    result = await db.execute(stmt)
+    return result.rowcount
+
+
+async def verify_project_counters(db: AsyncSession) -> list[dict]:
+    """저장된 카운터와 재계산 값을 비교해 불일치 목록을 반환한다."""
+    computed = _computed_counters_stmt().subquery()
+    stmt = select(computed, ProjectCounter).outerjoin(
+        ProjectCounter, ProjectCounter.project_id == computed.c.project_id
+    )
+    result = await db.execute(stmt)
+
+    mismatches: list[dict] = []
+    for row in result.all():
+        stored: ProjectCounter | None = row.ProjectCounter
+        for column in (
+            "todo_count",
+            "in_progress_count",
+            "done_count",
+            "total_count",
+            "member_count",
+        ):
+            expected = getattr(row, column)
+            actual = getattr(stored, column) if stored is not None else None
+            if expected != actual:
+                mismatches.append(
+                    {
+                        "project_id": row.project_id,
+                        "column": column,
+                        "expected": expected,
+                        "actual": actual,
+                    }
+                )
+    return mismatches
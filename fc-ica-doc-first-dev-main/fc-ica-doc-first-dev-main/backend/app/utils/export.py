@@ -0,0 +1,100 @@
+"""태스크 내보내기 유틸리티: 조회 컬럼, NDJSON/CSV 청크 인코딩"""
+
+import csv
+import io
+import uuid
+from collections.abc import Sequence
+
+from pydantic_core import to_json
+from sqlalchemy import Row
+
+from app.models.task import Task
+from app.schemas.user import UserBrief
+
+# 한 번에 가져와 인코딩하는 행 수 (서버 측 커서 fetch 크기)
+EXPORT_CHUNK_SIZE = 1000
+
+# 내보내기 컬럼 순서 (CSV 헤더)
+EXPORT_FIELDS = [
+    "id",
+    "title",
+    "description",
+    "status",
+    "priority",
+    "position",
+    "assignee_id",
+    "assignee_name",
+    "created_by",
+    "created_by_name",
+    "created_at",
+    "updated_at",
+]
+
+# 조회 컬럼: ORM 객체를 만들지 않아 세션 identity map에 쌓이지 않는다
+EXPORT_COLUMNS = (
+    Task.id,
+    Task.title,
+    Task.description,
+    Task.status,
+    Task.priority,
+    Task.position,
+    Task.assignee_id,
+    Task.created_by,
+    Task.created_at,
+    Task.updated_at,
+)
+
+MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv; charset=utf-8",
+}
+
+
+def _export_record(row: Row, users: dict[uuid.UUID, UserBrief | None]) -> dict:
+    assignee = users.get(row.assignee_id) if row.assignee_id else None
+    creator = users.get(row.created_by)
+    return {
+        "id": row.id,
+        "title": row.title,
+        "description": row.description,
+        "status": row.status,
+        "priority": row.priority,
+        "position": row.position,
+        "assignee_id": row.assignee_id,
+        "assignee_name": assignee.name if assignee else None,
+        "created_by": row.created_by,
+        "created_by_name": creator.name if creator else None,
+        "created_at": row.created_at,
+        "updated_at": row.updated_at,
+    }
+
+
+def encode_ndjson_chunk(
+    rows: Sequence[Row], users: dict[uuid.UUID, UserBrief | None]
+) -> bytes:
+    """행 묶음을 NDJSON(한 줄에 JSON 객체 하나)으로 인코딩한다."""
+    return b"".join(to_json(_export_record(r, users)) + b"\n" for r in rows)
+
+
+def csv_header() -> bytes:
+    """CSV 헤더 행. Excel에서 한글이 깨지지 않도록 UTF-8 BOM을 붙인다."""
+    buffer = io.StringIO()
+    csv.writer(buffer).writerow(EXPORT_FIELDS)
+    return ("\ufeff" + buffer.getvalue()).encode()
+
+
+def encode_csv_chunk(
+    rows: Sequence[Row], users: dict[uuid.UUID, UserBrief | None]
+) -> bytes:
+    """행 묶음을 CSV로 인코딩한다. (None은 빈 칸, 시각은 ISO 8601)"""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    for r in rows:
+        record = _export_record(r, users)
+        writer.writerow(
+            [
+                "" if v is None else v.isoformat() if hasattr(v, "isoformat") else v
+                for v in (record[f] for f in EXPORT_FIELDS)
+            ]
+        )
+    return buffer.getvalue().encode()
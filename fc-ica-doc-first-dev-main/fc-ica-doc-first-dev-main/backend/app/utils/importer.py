@@ -0,0 +1,236 @@
+"""태스크 가져오기 유틸리티: CSV/NDJSON 스트리밍 파싱, 행 검증, 담당자 이메일 해석, COPY 적재
+
+업로드 파일은 IMPORT_BATCH_SIZE 행씩 읽어 검증하고, 배치마다 담당자 이메일을 한 번의 쿼리로
+사용자 id로 바꾼 뒤 asyncpg COPY로 tasks 테이블에 적재한다. 모든 배치는 요청의
+트랜잭션 하나에서 실행되므로, 파일 수준 오류(인코딩, 최대 행 수 초과)가 나면 전체가 롤백된다.
+행 수준 오류는 해당 행만 건너뛰고 줄 번호와 함께 보고한다.
+"""
+
+import csv
+import io
+import json
+import uuid
+from collections import defaultdict
+from collections.abc import Iterator
+from datetime import datetime, timezone
+from itertools import islice
+from typing import Any, BinaryIO
+
+from fastapi import HTTPException, status
+from fastapi.concurrency import run_in_threadpool
+from pydantic import ValidationError
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.models.project import ProjectMember
+from app.models.user import User
+from app.schemas.task import TaskImportError, TaskImportResponse, TaskImportRow
+from app.utils.ranking import column_end_positions, rank_between
+
+# 한 번에 검증하고 COPY하는 행 수
+IMPORT_BATCH_SIZE = 5000
+
+# 응답에 담는 최대 오류 행 수 (나머지는 failed 개수에만 포함된다)
+IMPORT_MAX_ERRORS = 1000
+
+# 가져오기 파일에서 읽는 필드 (그 외 컬럼은 무시한다)
+IMPORT_FIELDS = frozenset(TaskImportRow.model_fields)
+
+# COPY 대상 컬럼 (search_vector는 생성 컬럼이므로 DB가 채운다)
+COPY_COLUMNS = (
+    "id",
+    "project_id",
+    "title",
+    "description",
+    "status",
+    "priority",
+    "position",
+    "assignee_id",
+    "created_by",
+    "is_deleted",
+    "created_at",
+    "updated_at",
+)
+
+# (파일의 줄 번호, 레코드 또는 파싱 오류 메시지)
+ImportRecord = tuple[int, dict[str, Any] | str]
+
+
+def _bad_file(detail: str) -> HTTPException:
+    return HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=detail)
+
+
+def _iter_csv(text: io.TextIOWrapper) -> Iterator[ImportRecord]:
+    reader = csv.DictReader(text)
+    if reader.fieldnames is None:
+        return
+    if "title" not in reader.fieldnames:
+        raise _bad_file("CSV 헤더에 title 컬럼이 필요합니다")
+    for record in reader:
+        # 빈 칸은 값이 없는 것으로 본다 (기본값 적용)
+        yield reader.line_num, {
+            k: v for k, v in record.items() if k in IMPORT_FIELDS and v != ""
+        }
+
+
+def _iter_ndjson(text: io.TextIOWrapper) -> Iterator[ImportRecord]:
+    for line_no, line in enumerate(text, start=1):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError:
+            yield line_no, "JSON 형식이 올바르지 않습니다"
+            continue
+        if not isinstance(record, dict):
+            yield line_no, "각 줄은 JSON 객체여야 합니다"
+            continue
+        yield line_no, {k: v for k, v in record.items() if k in IMPORT_FIELDS}
+
+
+def iter_import_records(file: BinaryIO, fmt: str) -> Iterator[ImportRecord]:
+    """업로드 파일에서 레코드를 한 행씩 읽는다. (UTF-8, BOM 허용)"""
+    text = io.TextIOWrapper(file, encoding="utf-8-sig", newline="")
+    return _iter_csv(text) if fmt == "csv" else _iter_ndjson(text)
+
+
+def _validation_message(exc: ValidationError) -> str:
+    error = exc.errors()[0]
+    field = ".".join(str(part) for part in error["loc"])
+    return f"{field}: {error['msg']}" if field else error["msg"]
+
+
+def _read_batch(
+    records: Iterator[ImportRecord], size: int
+) -> list[tuple[int, TaskImportRow | str]]:
+    """다음 배치를 읽고 검증한다. 파싱/검증은 CPU 작업이므로 스레드풀에서 호출한다."""
+    batch: list[tuple[int, TaskImportRow | str]] = []
+    for line_no, record in islice(records, size):
+        if isinstance(record, str):
+            batch.append((line_no, record))
+            continue
+        try:
+            batch.append((line_no, TaskImportRow.model_validate(record)))
+        except ValidationError as exc:
+            batch.append((line_no, _validation_message(exc)))
+    return batch
+
+
+async def _resolve_assignees(
+    db: AsyncSession,
+    project_id: uuid.UUID,
+    emails: set[str],
+    assignees: dict[str, uuid.UUID | None],
+) -> None:
+    """새로 나온 담당자 이메일을 한 번의 쿼리로 프로젝트 멤버 id로 바꾼다. (멤버가 아니면 None)"""
+    emails = emails - assignees.keys()
+    if not emails:
+        return
+    result = await db.execute(
+        select(User.email, User.id)
+        .join(ProjectMember, ProjectMember.user_id == User.id)
+        .where(
+            ProjectMember.project_id == project_id,
+            User.email.in_(emails),
+        )
+    )
+    found = dict(result.all())
+    for email in emails:
+        assignees[email] = found.get(email)
+
+
+async def import_task_file(
+    db: AsyncSession,
+    project_id: uuid.UUID,
+    creator_id: uuid.UUID,
+    file: BinaryIO,
+    fmt: str,
+) -> tuple[TaskImportResponse, dict[str, int]]:
+    """업로드 파일의 유효한 행을 현재 트랜잭션에서 COPY로 적재한다.
+
+    호출 전에 프로젝트 카운터 행을 잠가야 한다. (position 계산 직렬화)
+    (응답, 상태별 생성 수)를 반환한다. 카운터 반영은 호출자가 한다.
+    """
+    records = iter_import_records(file, fmt)
+    positions = await column_end_positions(db, project_id)
+    assignees: dict[str, uuid.UUID | None] = {}
+    deltas: dict[str, int] = defaultdict(int)
+    errors: list[TaskImportError] = []
+    failed = 0
+    total = 0
+
+    # 세션과 같은 커넥션(같은 트랜잭션)에서 COPY를 실행한다
+    connection = await db.connection()
+    driver = (await connection.get_raw_connection()).driver_connection
+    now = datetime.now(timezone.utc)
+
+    while True:
+        try:
+            batch = await run_in_threadpool(_read_batch, records, IMPORT_BATCH_SIZE)
+        except UnicodeDecodeError:
+            raise _bad_file("UTF-8로 인코딩된 파일이어야 합니다")
+        except csv.Error as exc:
+            raise _bad_file(f"CSV 형식이 올바르지 않습니다: {exc}")
+        if not batch:
+            break
+        total += len(batch)
+        if total > settings.IMPORT_MAX_ROWS:
+            raise _bad_file(f"한 번에 가져올 수 있는 행은 최대 {settings.IMPORT_MAX_ROWS}개입니다")
+
+        await _resolve_assignees(
+            db,
+            project_id,
+            {
+                row.assignee_email
+                for _, row in batch
+                if isinstance(row, TaskImportRow) and row.assignee_email is not None
+            },
+            assignees,
+        )
+
+        rows: list[tuple] = []
+        for line_no, row in batch:
+            message = row if isinstance(row, str) else None
+            assignee_id = None
+            if message is None and row.assignee_email is not None:
+                assignee_id = assignees[row.assignee_email]
+                if assignee_id is None:
+                    message = "담당자는 프로젝트 멤버여야 합니다"
+            if message is not None:
+                failed += 1
+                if len(errors) < IMPORT_MAX_ERRORS:
+                    errors.append(TaskImportError(line=line_no, message=message))
+                continue
+            status_value = row.status.value
+            positions[status_value] = rank_between(positions.get(status_value), None)
+            rows.append(
+                (
+                    uuid.uuid4(),
+                    project_id,
+                    row.title,
+                    row.description,
+                    status_value,
+                    row.priority.value,
+                    positions[status_value],
+                    assignee_id,
+                    creator_id,
+                    False,
+                    now,
+                    now,
+                )
+            )
+            deltas[status_value] += 1
+
+        if rows:
+            await driver.copy_records_to_table("tasks", records=rows, columns=COPY_COLUMNS)
+
+    return (
+        TaskImportResponse(
+            created=sum(deltas.values()),
+            failed=failed,
+            errors=errors,
+            errors_truncated=failed > len(errors),
+        ),
+        deltas,
+    )
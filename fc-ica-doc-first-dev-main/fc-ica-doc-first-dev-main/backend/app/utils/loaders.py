@@ -0,0 +1,59 @@
+"""요청 단위 배치 로더: 여러 ID를 한 번의 IN 쿼리로 조회하고 요청 내에서 재사용한다."""
+
+import uuid
+from collections.abc import Iterable
+
+from fastapi import Depends
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database import get_db
+from app.models.user import User
+from app.schemas.user import UserBrief
+from app.utils.read_db import get_read_db
+
+
+class UserBriefLoader:
+    """사용자 간략 정보(UserBrief) 배치 로더
+
+    조회한 결과는 요청이 끝날 때까지 메모이즈되며,
+    존재하지 않는 ID도 None으로 기억해 다시 조회하지 않는다.
+    """
+
+    def __init__(self, db: AsyncSession):
+        self._db = db
+        self._cache: dict[uuid.UUID, UserBrief | None] = {}
+
+    async def load_many(
+        self, user_ids: Iterable[uuid.UUID | None]
+    ) -> dict[uuid.UUID, UserBrief | None]:
+        """주어진 ID들의 UserBrief를 반환한다. 캐시에 없는 ID만 한 번에 조회한다."""
+        wanted = {uid for uid in user_ids if uid is not None}
+        missing = wanted - self._cache.keys()
+        if missing:
+            result = await self._db.execute(
+                select(User.id, User.name).where(User.id.in_(missing))
+            )
+            for row in result.all():
+                self._cache[row.id] = UserBrief.model_construct(id=row.id, name=row.name)
+            for uid in missing:
+                self._cache.setdefault(uid, None)
+        return {uid: self._cache[uid] for uid in wanted}
+
+    async def load(self, user_id: uuid.UUID | None) -> UserBrief | None:
+        """단일 ID의 UserBrief를 반환한다."""
+        if user_id is None:
+            return None
+        return (await self.load_many([user_id]))[user_id]
+
+
+async def get_user_loader(db: AsyncSession = Depends(get_db)) -> UserBriefLoader:
+    """FastAPI 의존성: 요청 단위 UserBriefLoader를 제공한다."""
+    return UserBriefLoader(db)
+
+
+async def get_read_user_loader(
+    db: AsyncSession = Depends(get_read_db),
+) -> UserBriefLoader:
+    """FastAPI 의존성: 읽기용 세션을 사용하는 요청 단위 UserBriefLoader를 제공한다."""
+    return UserBriefLoader(db)
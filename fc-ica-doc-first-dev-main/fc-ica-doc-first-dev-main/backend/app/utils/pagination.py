@@ -0,0 +1,58 @@
+"""커서(keyset) 페이지네이션 유틸리티: 불투명 커서 인코딩/디코딩, 정렬 조건 생성"""
+
+import base64
+import binascii
+import json
+import uuid
+from datetime import datetime
+from typing import Any
+
+from fastapi import HTTPException, status
+from sqlalchemy import tuple_
+from sqlalchemy.sql.elements import ColumnElement
+
+
+def _invalid_cursor() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail="잘못된 커서입니다",
+    )
+
+
+def encode_cursor(sort_key: str, order: str, value: Any, row_id: uuid.UUID) -> str:
+    """마지막 행의 정렬 키 값과 id로 불투명 커서 문자열을 만든다."""
+    if isinstance(value, datetime):
+        value = value.isoformat()
+    payload = {"k": sort_key, "o": order, "v": value, "id": str(row_id)}
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(
+    cursor: str, sort_key: str, order: str
+) -> tuple[Any, uuid.UUID]:
+    """커서를 (정렬 키 값, id)로 복원한다. 현재 정렬 조건과 다르면 400을 반환한다."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded))
+        if payload["k"] != sort_key or payload["o"] != order:
+            raise _invalid_cursor()
+        value = payload["v"]
+        if sort_key in ("created_at", "updated_at"):
+            value = datetime.fromisoformat(value)
+        return value, uuid.UUID(payload["id"])
+    except (binascii.Error, ValueError, KeyError, TypeError):
+        raise _invalid_cursor()
+
+
+def keyset_condition(
+    sort_col: ColumnElement,
+    id_col: ColumnElement,
+    value: Any,
+    row_id: uuid.UUID,
+    descending: bool,
+) -> ColumnElement[bool]:
+    """(정렬 키, id) 튜플 비교로 커서 이후의 행을 고르는 조건을 만든다."""
+    if descending:
+        return tuple_(sort_col, id_col) < tuple_(value, row_id)
+    return tuple_(sort_col, id_col) > tuple_(value, row_id)
@@ -0,0 +1,188 @@
+"""요청 경로 핵심 쿼리 빌더
+
+핸들러, 워밍업(app/warmup.py), 실행 계획 검사(scripts/check_query_plans.py)가 같은 빌더를 사용하므로
+인덱스 검사와 prepared statement 준비가 실제 요청과 같은 형태의 SQL을 대상으로 한다.
+목록의 커서/offset 조건은 호출자가 덧붙이고, 변경분/검색 쿼리는 커서 값을 인자로 받는다.
+"""
+
+import uuid
+from datetime import datetime
+
+from sqlalchemy import ColumnElement, Select, and_, func, select
+
+from app.models.project import Project, ProjectCounter, ProjectMember
+from app.models.task import Task
+from app.utils.pagination import keyset_condition
+from app.utils.search import (
+    description_headline,
+    search_match,
+    search_query,
+    search_rank,
+    title_headline,
+)
+
+# 태스크 목록 정렬 기준 (동순위는 id로 정렬한다)
+TASK_SORT_COLUMNS = {
+    "position": Task.position,
+    "created_at": Task.created_at,
+    "priority": Task.priority,
+}
+
+
+def project_access_query(project_id: uuid.UUID, user_id: uuid.UUID) -> Select:
+    """프로젝트 존재/삭제 여부와 사용자 역할 (check_project_access)"""
+    return (
+        select(Project.is_deleted, ProjectMember.role)
+        .outerjoin(
+            ProjectMember,
+            and_(
+                ProjectMember.project_id == Project.id,
+                ProjectMember.user_id == user_id,
+            ),
+        )
+        .where(Project.id == project_id)
+    )
+
+
+def visible_project_conditions(user_id: uuid.UUID) -> list[ColumnElement[bool]]:
+    """사용자가 멤버이고 삭제되지 않은 프로젝트를 고르는 WHERE 조건을 반환한다."""
+    return [
+        Project.id.in_(
+            select(ProjectMember.project_id).where(ProjectMember.user_id == user_id)
+        ),
+        Project.is_deleted == False,  # noqa: E712
+    ]
+
+
+def project_count_query(user_id: uuid.UUID) -> Select:
+    """사용자가 멤버인 프로젝트 수 (list_projects)"""
+    return select(func.count(Project.id)).where(*visible_project_conditions(user_id))
+
+
+def project_page_query(user_id: uuid.UUID, limit: int) -> Select:
+    """사용자가 멤버인 프로젝트 + 비정규화 카운터, 최신순 (list_projects)"""
+    return (
+        select(Project, ProjectCounter)
+        .outerjoin(ProjectCounter, ProjectCounter.project_id == Project.id)
+        .where(*visible_project_conditions(user_id))
+        .order_by(Project.created_at.desc(), Project.id.desc())
+        .limit(limit)
+    )
+
+
+def task_list_conditions(
+    project_id: uuid.UUID,
+    status: str | None = None,
+    priority: str | None = None,
+    assignee_id: uuid.UUID | None = None,
+) -> list[ColumnElement[bool]]:
+    """태스크 목록 필터 조건 (list_tasks)"""
+    conditions = [
+        Task.project_id == project_id,
+        Task.is_deleted == False,  # noqa: E712
+    ]
+    if status is not None:
+        conditions.append(Task.status == status)
+    if priority is not None:
+        conditions.append(Task.priority == priority)
+    if assignee_id is not None:
+        conditions.append(Task.assignee_id == assignee_id)
+    return conditions
+
+
+def task_count_query(conditions: list[ColumnElement[bool]]) -> Select:
+    """조건에 맞는 태스크 수 (list_tasks)"""
+    return select(func.count(Task.id)).where(*conditions)
+
+
+def task_page_query(
+    conditions: list[ColumnElement[bool]], sort_key: str, descending: bool, limit: int
+) -> Select:
+    """조건에 맞는 태스크를 sort_key(TASK_SORT_COLUMNS), id 순으로 조회한다. (list_tasks)"""
+    sort_col = TASK_SORT_COLUMNS[sort_key]
+    if descending:
+        order_clauses = (sort_col.desc(), Task.id.desc())
+    else:
+        order_clauses = (sort_col.asc(), Task.id.asc())
+    return select(Task).where(*conditions).order_by(*order_clauses).limit(limit)
+
+
+def task_changes_query(
+    project_id: uuid.UUID,
+    since: tuple[datetime, uuid.UUID] | None,
+    limit: int,
+) -> Select:
+    """since(updated_at, id) 이후 변경된 태스크(삭제 포함)를 변경 순으로 조회한다. (list_task_changes)
+
+    since가 없으면 삭제되지 않은 전체 태스크를 조회한다.
+    """
+    stmt = (
+        select(Task)
+        .where(Task.project_id == project_id)
+        .order_by(Task.updated_at, Task.id)
+        .limit(limit)
+    )
+    if since is not None:
+        return stmt.where(keyset_condition(Task.updated_at, Task.id, *since, False))
+    return stmt.where(Task.is_deleted == False)  # noqa: E712
+
+
+def visible_project_ids_query(user_id: uuid.UUID) -> Select:
+    """사용자가 멤버이고 삭제되지 않은 프로젝트 id (전체 태스크 검색 범위)"""
+    return (
+        select(Project.id)
+        .join(ProjectMember, ProjectMember.project_id == Project.id)
+        .where(
+            ProjectMember.user_id == user_id,
+            Project.is_deleted == False,  # noqa: E712
+        )
+    )
+
+
+def task_search_query(
+    tsquery_text: str,
+    conditions: list[ColumnElement[bool]],
+    limit: int,
+    after: tuple[float, uuid.UUID] | None = None,
+) -> Select:
+    """조건에 맞는 태스크를 전문 검색한다. 순위(rank) 내림차순, 동순위는 id로 정렬한다.
+
+    결과 행은 (Task, rank, title_highlight, description_highlight)이다. after는 (rank, id) 커서 값이다.
+    """
+    query = search_query(tsquery_text)
+    rank = search_rank(query)
+    stmt = (
+        select(
+            Task,
+            rank.label("rank"),
+            title_headline(query).label("title_highlight"),
+            description_headline(query).label("description_highlight"),
+        )
+        .where(
+            *conditions,
+            Task.is_deleted == False,  # noqa: E712
+            search_match(query),
+        )
+        .order_by(rank.desc(), Task.id.desc())
+        .limit(limit)
+    )
+    if after is not None:
+        stmt = stmt.where(keyset_condition(rank, Task.id, *after, descending=True))
+    return stmt
+
+
+def column_max_position_query(project_id: uuid.UUID, status: str) -> Select:
+    """컬럼(프로젝트 + 상태)의 가장 큰 랭크 (태스크 생성/이동 시 맨 뒤 position)"""
+    return select(func.max(Task.position)).where(
+        Task.project_id == project_id,
+        Task.status == status,
+        Task.is_deleted == False,  # noqa: E712
+    )
+
+
+def member_exists_query(project_id: uuid.UUID, user_id: uuid.UUID) -> Select:
+    """사용자가 프로젝트 멤버인지 확인한다. (담당자 지정)"""
+    return select(ProjectMember.user_id).where(
+        ProjectMember.project_id == project_id,
+        ProjectMember.user_id == user_id,
+    )
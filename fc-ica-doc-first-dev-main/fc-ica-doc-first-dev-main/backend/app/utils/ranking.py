@@ -0,0 +1,135 @@
+"""태스크 순서(position) 유틸리티: 분수 랭크 계산, 컬럼 재정렬(rebalance)
+
+position은 실수 랭크다. 새 태스크는 컬럼 끝에 RANK_STEP 간격으로 추가되고,
+이동 시에는 두 이웃 사이의 중간값을 사용하므로 이동한 태스크 한 행만 갱신된다.
+간격이 너무 좁아지면 컬럼 전체를 RANK_STEP 간격으로 다시 매긴다.
+"""
+
+import uuid
+
+from sqlalchemy import func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database import async_session
+from app.models.task import Task
+from app.utils.counters import lock_project_counters, touch_project
+from app.utils.queries import column_max_position_query
+
+# 새 랭크 사이의 기본 간격
+RANK_STEP = 1024.0
+
+# 이웃 간격이 이 값보다 좁아지면 백그라운드 재정렬을 예약한다
+REBALANCE_MIN_GAP = 1e-4
+
+
+def rank_between(after: float | None, before: float | None) -> float | None:
+    """after와 before 사이의 랭크를 반환한다. 사이에 값을 넣을 수 없으면 None을 반환한다.
+
+    after가 없으면 컬럼 맨 앞, before가 없으면 컬럼 맨 뒤를 의미한다.
+    """
+    if after is None and before is None:
+        return RANK_STEP
+    if after is None:
+        rank = before / 2 if before > 0 else before - RANK_STEP
+        return rank if rank < before else None
+    if before is None:
+        return after + RANK_STEP
+    rank = (after + before) / 2
+    return rank if after < rank < before else None
+
+
+def needs_rebalance(after: float | None, before: float | None) -> bool:
+    """두 이웃 사이 간격이 재정렬이 필요할 만큼 좁은지 확인한다."""
+    if after is None:
+        after = 0.0
+    if before is None:
+        return False
+    return before - after < REBALANCE_MIN_GAP
+
+
+async def next_position(
+    db: AsyncSession, project_id: uuid.UUID, status: str
+) -> float:
+    """컬럼(프로젝트 + 상태)의 맨 뒤 랭크를 반환한다."""
+    result = await db.execute(column_max_position_query(project_id, status))
+    max_position = result.scalar()
+    return rank_between(max_position, None)
+
+
+async def adjacent_position(
+    db: AsyncSession,
+    project_id: uuid.UUID,
+    status: str,
+    position: float,
+    *,
+    after: bool,
+    exclude_id: uuid.UUID,
+) -> float | None:
+    """컬럼에서 position 바로 뒤(after=True) 또는 바로 앞의 랭크를 반환한다. 없으면 None
+
+    exclude_id(이동 중인 태스크)는 이웃으로 보지 않는다.
+    """
+    conditions = [
+        Task.project_id == project_id,
+        Task.status == status,
+        Task.is_deleted == False,  # noqa: E712
+        Task.id != exclude_id,
+    ]
+    if after:
+        stmt = select(func.min(Task.position)).where(*conditions, Task.position > position)
+    else:
+        stmt = select(func.max(Task.position)).where(*conditions, Task.position < position)
+    return (await db.execute(stmt)).scalar()
+
+
+async def column_end_positions(
+    db: AsyncSession, project_id: uuid.UUID
+) -> dict[str, float]:
+    """프로젝트의 상태별 최대 랭크를 한 번의 쿼리로 조회한다."""
+    result = await db.execute(
+        select(Task.status, func.max(Task.position))
+        .where(
+            Task.project_id == project_id,
+            Task.is_deleted == False,  # noqa: E712
+        )
+        .group_by(Task.status)
+    )
+    return {row[0]: row[1] for row in result.all()}
+
+
+async def rebalance_column(
+    db: AsyncSession, project_id: uuid.UUID, status: str
+) -> None:
+    """컬럼의 태스크 랭크를 현재 순서대로 RANK_STEP 간격으로 다시 매긴다. (변경 표식도 올린다)
+
+    프로젝트 카운터 행을 먼저 잠가, 순서를 읽은 뒤 커밋된 이동을 이전 랭크로 덮어쓰지 않게 한다.
+    """
+    await lock_project_counters(db, project_id)
+    ordered = (
+        select(
+            Task.id,
+            (func.row_number().over(order_by=(Task.position, Task.id)) * RANK_STEP).label(
+                "new_position"
+            ),
+        )
+        .where(
+            Task.project_id == project_id,
+            Task.status == status,
+            Task.is_deleted == False,  # noqa: E712
+        )
+        .subquery()
+    )
+    await db.execute(
+        update(Task)
+        .where(Task.id == ordered.c.id)
+        .values(position=ordered.c.new_position)
+        .execution_options(synchronize_session=False)
+    )
+    await touch_project(db, project_id)
+
+
+async def rebalance_column_in_background(project_id: uuid.UUID, status: str) -> None:
+    """별도 세션/트랜잭션에서 컬럼을 재정렬한다. (BackgroundTasks용)"""
+    async with async_session() as session:
+        await rebalance_column(session, project_id, status)
+        await session.commit()
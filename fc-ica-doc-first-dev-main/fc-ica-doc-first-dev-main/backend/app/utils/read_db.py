@@ -0,0 +1,38 @@
+"""읽기 전용 DB 세션 의존성: GET 엔드포인트를 읽기 복제본으로 라우팅한다."""
+
+from collections.abc import AsyncGenerator
+
+from fastapi import Depends, Request
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database import open_read_session
+from app.models.user import User
+from app.utils.auth import get_current_read_user
+from app.utils.consistency import READ_AFTER_HEADER
+
+
+async def get_read_db(
+    request: Request,
+    current_user: User = Depends(get_current_read_user),
+) -> AsyncGenerator[AsyncSession, None]:
+    """FastAPI 의존성: 읽기 전용 세션(복제본 우선)을 제공한다.
+
+    세션은 READ ONLY 트랜잭션으로 실행되며 커밋하지 않는다.
+    최근에 쓰기를 한 사용자(X-Read-After 헤더 포함)는 read-your-writes를 위해 primary 세션을 받는다.
+    """
+    session = await open_read_session(
+        current_user.id, request.headers.get(READ_AFTER_HEADER)
+    )
+    try:
+        yield session
+    finally:
+        await session.close()
+
+
+async def release_read_session(session: AsyncSession) -> None:
+    """조회 결과를 모두 가져온 뒤 커넥션을 즉시 풀에 반환한다.
+
+    응답 직렬화가 끝날 때까지 커넥션을 붙잡지 않도록 읽기 핸들러에서 호출한다.
+    이미 로드된 객체의 속성은 그대로 사용할 수 있다. (지연 로딩은 사용할 수 없다)
+    """
+    await session.close()
@@ -0,0 +1,185 @@
+"""GET 응답 캐시: 직렬화된 응답 본문을 변경 표식(version) 기반 키로 저장한다.
+
+캐시 키에는 라우트, 접근 범위(프로젝트 또는 사용자), 변경 표식, 쿼리 파라미터가 들어간다.
+변경 표식은 모든 쓰기에서 올라가므로, 다른 워커에서 일어난 쓰기 이후에는
+이전 항목이 더 이상 조회되지 않는다. 쓰기 엔드포인트는 태그로 이 워커의 항목을 즉시 제거한다.
+
+기본 백엔드는 프로세스 내 LRU(TTLCache)이며, ResponseCacheBackend를 구현한
+다른 저장소(로컬 키-값 저장소 등)로 configure_response_cache()로 교체할 수 있다.
+"""
+
+import uuid
+from collections import defaultdict
+from collections.abc import Iterable
+from dataclasses import dataclass
+from typing import Protocol
+from urllib.parse import urlencode
+
+from fastapi import Request, Response
+
+from app.config import settings
+from app.utils.cache import MISSING, TTLCache
+
+
+@dataclass(frozen=True, slots=True)
+class CachedResponse:
+    """캐시된 응답: 직렬화된 본문, 헤더, 무효화 태그"""
+
+    body: bytes
+    status_code: int
+    media_type: str
+    headers: tuple[tuple[str, str], ...]
+    tags: frozenset[str]
+
+    def to_response(self) -> Response:
+        return Response(
+            content=self.body,
+            status_code=self.status_code,
+            media_type=self.media_type,
+            headers=dict(self.headers),
+        )
+
+
+class ResponseCacheBackend(Protocol):
+    """응답 캐시 저장소 인터페이스"""
+
+    async def get(self, key: str) -> CachedResponse | None: ...
+
+    async def set(self, key: str, value: CachedResponse) -> None: ...
+
+    async def invalidate_tags(self, tags: Iterable[str]) -> None: ...
+
+    def stats(self) -> dict[str, int]: ...
+
+
+class InProcessResponseCache:
+    """프로세스 내 LRU + TTL 응답 캐시 (기본 백엔드)
+
+    태그 → 키 색인과 본문 크기 합계를 저장/제거(만료, LRU 제거 포함) 시점에 갱신하므로
+    태그 무효화는 해당 태그의 항목 수에만 비례하고, 통계는 전체 항목을 순회하지 않는다.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self._cache = TTLCache(maxsize=maxsize, ttl=ttl, on_remove=self._unindex)
+        self._keys_by_tag: dict[str, set[str]] = defaultdict(set)
+        self._bytes = 0
+
+    def _unindex(self, key: str, value: CachedResponse) -> None:
+        self._bytes -= len(value.body)
+        for tag in value.tags:
+            keys = self._keys_by_tag.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._keys_by_tag[tag]
+
+    async def get(self, key: str) -> CachedResponse | None:
+        value = self._cache.get(key)
+        return None if value is MISSING else value
+
+    async def set(self, key: str, value: CachedResponse) -> None:
+        if self._cache.maxsize <= 0:
+            return
+        self._cache.set(key, value)
+        self._bytes += len(value.body)
+        for tag in value.tags:
+            self._keys_by_tag[tag].add(key)
+
+    async def invalidate_tags(self, tags: Iterable[str]) -> None:
+        keys = set().union(*(self._keys_by_tag.get(tag, ()) for tag in tags))
+        for key in keys:
+            self._cache.invalidate(key)
+
+    def stats(self) -> dict[str, int]:
+        stats = self._cache.stats()
+        stats["bytes"] = self._bytes
+        stats["tags"] = len(self._keys_by_tag)
+        return stats
+
+
+class _DisabledResponseCache:
+    """RESPONSE_CACHE_ENABLED=False일 때 사용하는 빈 백엔드"""
+
+    async def get(self, key: str) -> CachedResponse | None:
+        return None
+
+    async def set(self, key: str, value: CachedResponse) -> None:
+        pass
+
+    async def invalidate_tags(self, tags: Iterable[str]) -> None:
+        pass
+
+    def stats(self) -> dict[str, int]:
+        return {}
+
+
+response_cache: ResponseCacheBackend = (
+    InProcessResponseCache(
+        maxsize=settings.RESPONSE_CACHE_SIZE,
+        ttl=settings.RESPONSE_CACHE_TTL_SECONDS,
+    )
+    if settings.RESPONSE_CACHE_ENABLED
+    else _DisabledResponseCache()
+)
+
+
+def configure_response_cache(backend: ResponseCacheBackend) -> None:
+    """응답 캐시 백엔드를 교체한다. (앱 시작 시 호출)"""
+    global response_cache
+    response_cache = backend
+
+
+def project_tag(project_id: uuid.UUID) -> str:
+    return f"project:{project_id.hex}"
+
+
+def user_tag(user_id: uuid.UUID) -> str:
+    return f"user:{user_id.hex}"
+
+
+def response_cache_key(route: str, fingerprint: str, request: Request) -> str:
+    """라우트, 변경 표식(접근 범위 포함), 정렬된 쿼리 파라미터로 캐시 키를 만든다."""
+    query = urlencode(sorted(request.query_params.multi_items()))
+    return f"{route}|{fingerprint}|{query}"
+
+
+async def get_cached_response(key: str) -> Response | None:
+    """캐시된 응답이 있으면 새 Response로 만들어 반환한다."""
+    cached = await response_cache.get(key)
+    return cached.to_response() if cached is not None else None
+
+
+async def cache_response(key: str, response: Response, tags: Iterable[str]) -> None:
+    """성공 응답을 태그와 함께 캐시에 저장한다."""
+    if response.status_code != 200:
+        return
+    await response_cache.set(
+        key,
+        CachedResponse(
+            body=bytes(response.body),
+            status_code=response.status_code,
+            media_type=response.media_type,
+            headers=tuple(
+                (name, value)
+                for name, value in response.headers.items()
+                if name not in ("content-length", "content-type")
+            ),
+            tags=frozenset(tags),
+        ),
+    )
+
+
+async def invalidate_project_responses(
+    project_id: uuid.UUID, *user_ids: uuid.UUID
+) -> None:
+    """프로젝트 관련 캐시 항목(상세, 멤버, 태스크 목록, 이를 포함한 프로젝트 목록)을 제거한다.
+
+    멤버십이 바뀐 사용자는 user_ids로 넘겨 프로젝트 목록 항목도 제거한다.
+    """
+    await response_cache.invalidate_tags(
+        [project_tag(project_id), *(user_tag(u) for u in user_ids)]
+    )
+
+
+def response_cache_stats() -> dict[str, int]:
+    return response_cache.stats()
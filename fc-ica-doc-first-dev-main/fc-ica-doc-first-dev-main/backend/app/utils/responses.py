@@ -0,0 +1,48 @@
+"""API 응답 envelope 직렬화: 검증된 모델을 JSON 바이트로 한 번만 직렬화한다."""
+
+from typing import Any, TypeVar
+
+from fastapi import Response
+from pydantic import BaseModel, TypeAdapter
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+# data에 담긴 Pydantic 모델은 각 모델의 serializer로 직접 직렬화된다
+_envelope_adapter = TypeAdapter(dict[str, Any])
+
+
+class EnvelopeResponse(Response):
+    """이미 직렬화된 {"status", "data", "message"} envelope JSON 응답
+
+    핸들러가 dict를 반환하면 FastAPI가 jsonable_encoder로 한 번 더 변환하므로,
+    envelope를 바이트로 만들어 그대로 반환한다.
+    """
+
+    media_type = "application/json"
+
+
+def success_response(
+    data: Any = None,
+    message: str | None = None,
+    status_code: int = 200,
+) -> EnvelopeResponse:
+    """성공 envelope 응답을 만든다.
+
+    Response를 직접 반환하므로 라우트 데코레이터의 status_code는 적용되지 않는다.
+    201 등은 status_code로 넘겨야 한다.
+    """
+    body = _envelope_adapter.dump_json(
+        {"status": "success", "data": data, "message": message}
+    )
+    return EnvelopeResponse(content=body, status_code=status_code)
+
+
+def from_orm(model: type[ModelT], obj: Any) -> ModelT:
+    """ORM 객체에서 검증 없이 응답 모델을 만든다.
+
+    DB에서 읽은 값은 이미 컬럼 타입을 만족하므로 재검증하지 않는다.
+    (요청 입력 등 신뢰할 수 없는 데이터에는 사용하지 않는다)
+    """
+    return model.model_construct(
+        **{name: getattr(obj, name) for name in model.model_fields}
+    )
@@ -0,0 +1,72 @@
+"""태스크 전문 검색 유틸리티: 검색어 → tsquery 변환, 순위, 하이라이트"""
+
+import html
+import re
+
+from sqlalchemy import cast, func, literal
+from sqlalchemy.dialects.postgresql import REGCONFIG
+from sqlalchemy.sql.elements import ColumnElement
+
+from app.models.task import SEARCH_CONFIG, Task
+
+# 검색어에서 사용할 최대 단어 수
+MAX_TERMS = 8
+
+# ts_headline 하이라이트 구분자: 사용자 텍스트에 나오지 않는 사설 영역 문자를 쓰고,
+# HTML 이스케이프 후 <mark>로 바꾼다 (사용자 입력이 HTML로 해석되지 않도록)
+_START = "\ue000"
+_STOP = "\ue001"
+
+_WORD_RE = re.compile(r"\w+")
+
+
+def _config() -> ColumnElement:
+    return cast(literal(SEARCH_CONFIG), REGCONFIG)
+
+
+def build_tsquery_text(q: str) -> str | None:
+    """검색어를 단어 단위 접두어 검색 tsquery 문자열로 바꾼다. ('태스크 정리' → '태스크:* & 정리:*')
+
+    한국어 조사가 붙은 단어도 찾을 수 있도록 접두어 검색을 사용한다. 단어가 없으면 None
+    """
+    words = _WORD_RE.findall(q)[:MAX_TERMS]
+    if not words:
+        return None
+    return " & ".join(f"{w}:*" for w in words)
+
+
+def search_query(tsquery_text: str) -> ColumnElement:
+    return func.to_tsquery(_config(), tsquery_text)
+
+
+def search_match(query: ColumnElement) -> ColumnElement[bool]:
+    return Task.search_vector.op("@@")(query)
+
+
+def search_rank(query: ColumnElement) -> ColumnElement[float]:
+    return func.ts_rank_cd(Task.search_vector, query)
+
+
+def title_headline(query: ColumnElement) -> ColumnElement[str]:
+    return func.ts_headline(
+        _config(),
+        Task.title,
+        query,
+        f"StartSel={_START}, StopSel={_STOP}, HighlightAll=true",
+    )
+
+
+def description_headline(query: ColumnElement) -> ColumnElement[str]:
+    return func.ts_headline(
+        _config(),
+        func.coalesce(Task.description, ""),
+        query,
+        f'StartSel={_START}, StopSel={_STOP}, MaxFragments=2, MaxWords=30, MinWords=10, FragmentDelimiter=" … "',
+    )
+
+
+def render_highlight(text: str | None) -> str | None:
+    """ts_headline 결과를 HTML 이스케이프하고 일치 구간을 <mark>로 감싼다."""
+    if not text:
+        return None
+    return html.escape(text).replace(_START, "<mark>").replace(_STOP, "</mark>")
@@ -0,0 +1,91 @@
+"""애플리케이션 워밍업: 커넥션 풀 예열, 자주 쓰는 쿼리의 prepared statement 준비"""
+
+import asyncio
+import logging
+import uuid
+from contextlib import AsyncExitStack
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+
+from app.config import settings
+from app.database import engine, replicas
+from app.models.user import User
+from app.utils.queries import (
+    project_access_query,
+    project_count_query,
+    project_page_query,
+    task_count_query,
+    task_list_conditions,
+    task_page_query,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def _hot_statements() -> list:
+    """요청 경로에서 가장 자주 실행되는 쿼리 (더미 파라미터로 prepare만 유도한다)"""
+    dummy = uuid.uuid4()
+    task_conditions = task_list_conditions(dummy)
+    return [
+        # get_current_user
+        select(User).where(User.id == dummy),
+        # check_project_access
+        project_access_query(dummy, dummy),
+        # list_projects
+        project_count_query(dummy),
+        project_page_query(dummy, 21).offset(0),
+        # list_tasks
+        task_count_query(task_conditions),
+        task_page_query(task_conditions, "position", False, 51).offset(0),
+    ]
+
+
+async def _prime_connection(conn: AsyncConnection) -> None:
+    for stmt in _hot_statements():
+        await conn.execute(stmt)
+    await conn.rollback()
+
+
+async def _warm_up_engine(target: AsyncEngine) -> None:
+    count = min(settings.DB_WARMUP_CONNECTIONS, settings.DB_POOL_SIZE)
+    async with AsyncExitStack() as stack:
+        conns = await asyncio.gather(
+            *(stack.enter_async_context(target.connect()) for _ in range(count))
+        )
+        await asyncio.gather(*(_prime_connection(conn) for conn in conns))
+
+
+async def warm_up_pool() -> None:
+    """primary와 각 복제본에서 DB_WARMUP_CONNECTIONS개의 커넥션을 동시에 열고 핫 쿼리를 준비한다.
+
+    primary 워밍업이 실패한 경우에만 예외를 발생시킨다. 복제본은 최선 노력으로 예열하며,
+    실패한 복제본은 로그를 남기고 제외(eject)한다. 읽기 라우팅이 다른 복제본이나 primary를 사용한다.
+    """
+    primary, *replica_results = await asyncio.gather(
+        _warm_up_engine(engine),
+        *(_warm_up_engine(e) for e in replicas.engines),
+        return_exceptions=True,
+    )
+    for index, outcome in enumerate(replica_results):
+        if isinstance(outcome, Exception):
+            logger.warning("복제본 %d 워밍업 실패, 일시 제외", index, exc_info=outcome)
+            replicas.eject(index)
+    if isinstance(primary, BaseException):
+        raise primary
+
+
+async def run_warmup(state) -> None:
+    """primary 워밍업이 성공할 때까지 재시도하고, 완료되면 state.ready를 True로 바꾼다."""
+    delay = 1.0
+    while True:
+        try:
+            await warm_up_pool()
+        except Exception:
+            logger.warning("DB 워밍업 실패, %.0f초 후 재시도", delay, exc_info=True)
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, 30.0)
+            continue
+        state.ready = True
+        logger.info("DB 워밍업 완료")
+        return
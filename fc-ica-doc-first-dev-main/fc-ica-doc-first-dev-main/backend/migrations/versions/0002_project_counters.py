@@ -0,0 +1,64 @@
+"""프로젝트 카운터 테이블 추가 및 기존 데이터로 채우기
+
+Revision ID: 0002_project_counters
+Revises: 0001_initial
+Create Date: 2026-10-18
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "0002_project_counters"
+down_revision: Union[str, None] = "0001_initial"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "project_counters",
+        sa.Column("project_id", sa.Uuid(), nullable=False),
+        sa.Column("todo_count", sa.Integer(), nullable=False),
+        sa.Column("in_progress_count", sa.Integer(), nullable=False),
+        sa.Column("done_count", sa.Integer(), nullable=False),
+        sa.Column("total_count", sa.Integer(), nullable=False),
+        sa.Column("member_count", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(["project_id"], ["projects.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("project_id"),
+    )
+    op.execute(
+        """
+        INSERT INTO project_counters
+            (project_id, todo_count, in_progress_count, done_count, total_count, member_count)
+        SELECT
+            p.id,
+            COALESCE(t.todo_count, 0),
+            COALESCE(t.in_progress_count, 0),
+            COALESCE(t.done_count, 0),
+            COALESCE(t.total_count, 0),
+            COALESCE(m.member_count, 0)
+        FROM projects p
+        LEFT JOIN (
+            SELECT project_id,
+                   count(*) FILTER (WHERE status = 'TODO') AS todo_count,
+                   count(*) FILTER (WHERE status = 'IN_PROGRESS') AS in_progress_count,
+                   count(*) FILTER (WHERE status = 'DONE') AS done_count,
+                   count(*) AS total_count
+            FROM tasks
+            WHERE is_deleted = false
+            GROUP BY project_id
+        ) t ON t.project_id = p.id
+        LEFT JOIN (
+            SELECT project_id, count(*) AS member_count
+            FROM project_members
+            GROUP BY project_id
+        ) m ON m.project_id = p.id
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("project_counters")
@@ -0,0 +1,36 @@
+"""tasks.position을 분수 랭크(double precision)로 변경
+
+Revision ID: 0003_task_position_rank
+Revises: 0002_project_counters
+Create Date: 2026-10-18
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "0003_task_position_rank"
+down_revision: Union[str, None] = "0002_project_counters"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 기존 정수 순서를 RANK_STEP(1024) 간격 랭크로 변환한다
+    op.alter_column(
+        "tasks",
+        "position",
+        type_=sa.Float(),
+        postgresql_using="(position + 1) * 1024.0",
+    )
+
+
+def downgrade() -> None:
+    op.alter_column(
+        "tasks",
+        "position",
+        type_=sa.Integer(),
+        postgresql_using="round(position)::integer",
+    )
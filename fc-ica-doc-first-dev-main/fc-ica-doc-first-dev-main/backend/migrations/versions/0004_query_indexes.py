@@ -0,0 +1,74 @@
+"""실제 조회 패턴에 맞춘 복합/부분 인덱스
+
+Revision ID: 0004_query_indexes
+Revises: 0003_task_position_rank
+Create Date: 2026-10-18
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "0004_query_indexes"
+down_revision: Union[str, None] = "0003_task_position_rank"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+NOT_DELETED = sa.text("is_deleted = false")
+
+
+def upgrade() -> None:
+    # tasks: 칸반 컬럼/목록/담당자 필터용 부분 인덱스
+    op.create_index(
+        "ix_tasks_board", "tasks",
+        ["project_id", "status", "position", "id"],
+        postgresql_where=NOT_DELETED,
+    )
+    op.create_index(
+        "ix_tasks_project_position", "tasks",
+        ["project_id", "position", "id"],
+        postgresql_where=NOT_DELETED,
+    )
+    op.create_index(
+        "ix_tasks_project_created_at", "tasks",
+        ["project_id", "created_at", "id"],
+        postgresql_where=NOT_DELETED,
+    )
+    op.create_index(
+        "ix_tasks_project_assignee", "tasks",
+        ["project_id", "assignee_id"],
+        postgresql_where=NOT_DELETED,
+    )
+    # 선택도가 낮은 단일 status 인덱스는 ix_tasks_board로 대체한다
+    op.drop_index("ix_tasks_status", table_name="tasks")
+
+    # project_members: 유니크 제약을 역할 포함 커버링 유니크 인덱스로 교체
+    op.create_index(
+        "uq_pm_project_user_role", "project_members",
+        ["project_id", "user_id"],
+        unique=True,
+        postgresql_include=["role"],
+    )
+    op.drop_constraint("uq_pm_project_user", "project_members", type_="unique")
+    op.execute("ALTER INDEX uq_pm_project_user_role RENAME TO uq_pm_project_user")
+    op.create_index("ix_pm_user_project", "project_members", ["user_id", "project_id"])
+    op.drop_index("ix_project_members_project_id", table_name="project_members")
+    op.drop_index("ix_project_members_user_id", table_name="project_members")
+
+
+def downgrade() -> None:
+    op.create_index("ix_project_members_user_id", "project_members", ["user_id"])
+    op.create_index("ix_project_members_project_id", "project_members", ["project_id"])
+    op.drop_index("ix_pm_user_project", table_name="project_members")
+    op.drop_index("uq_pm_project_user", table_name="project_members")
+    op.create_unique_constraint(
+        "uq_pm_project_user", "project_members", ["project_id", "user_id"]
+    )
+
+    op.create_index("ix_tasks_status", "tasks", ["status"])
+    op.drop_index("ix_tasks_project_assignee", table_name="tasks")
+    op.drop_index("ix_tasks_project_created_at", table_name="tasks")
+    op.drop_index("ix_tasks_project_position", table_name="tasks")
+    op.drop_index("ix_tasks_board", table_name="tasks")
@@ -0,0 +1,38 @@
+"""프로젝트 변경 표식(version, changed_at) 추가
+
+Revision ID: 0005_project_version
+Revises: 0004_query_indexes
+Create Date: 2026-10-18
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "0005_project_version"
+down_revision: Union[str, None] = "0004_query_indexes"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "project_counters",
+        sa.Column("version", sa.BigInteger(), server_default="0", nullable=False),
+    )
+    op.add_column(
+        "project_counters",
+        sa.Column(
+            "changed_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=False,
+        ),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("project_counters", "changed_at")
+    op.drop_column("project_counters", "version")
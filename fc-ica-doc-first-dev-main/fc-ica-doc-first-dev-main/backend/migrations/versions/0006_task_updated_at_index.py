@@ -0,0 +1,27 @@
+"""변경분 동기화용 tasks (project_id, updated_at, id) 인덱스
+
+Revision ID: 0006_task_updated_at_index
+Revises: 0005_project_version
+Create Date: 2026-10-18
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0006_task_updated_at_index"
+down_revision: Union[str, None] = "0005_project_version"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_tasks_project_updated_at", "tasks",
+        ["project_id", "updated_at", "id"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_tasks_project_updated_at", table_name="tasks")
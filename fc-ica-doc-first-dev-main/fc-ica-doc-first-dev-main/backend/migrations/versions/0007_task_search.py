@@ -0,0 +1,46 @@
+"""태스크 제목/설명 전문 검색: tsvector 생성 컬럼과 GIN 인덱스
+
+생성 컬럼(STORED) 추가는 tasks 테이블 전체를 다시 쓰므로 트래픽이 적은 시간에 적용한다.
+
+Revision ID: 0007_task_search
+Revises: 0006_task_updated_at_index
+Create Date: 2026-10-18
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "0007_task_search"
+down_revision: Union[str, None] = "0006_task_updated_at_index"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+SEARCH_VECTOR_EXPR = (
+    "setweight(to_tsvector('simple', coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('simple', coalesce(description, '')), 'B')"
+)
+
+
+def upgrade() -> None:
+    op.add_column(
+        "tasks",
+        sa.Column(
+            "search_vector",
+            postgresql.TSVECTOR(),
+            sa.Computed(SEARCH_VECTOR_EXPR, persisted=True),
+        ),
+    )
+    op.create_index(
+        "ix_tasks_search", "tasks", ["search_vector"],
+        postgresql_using="gin",
+        postgresql_where=sa.text("is_deleted = false"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_tasks_search", table_name="tasks")
+    op.drop_column("tasks", "search_vector")
@@ -0,0 +1,334 @@
+"""API 부하 테스트: 엔드포인트별 지연 시간(p50/p95/p99), 처리량, 요청당 쿼리 수 측정
+
+FastAPI 앱을 같은 프로세스에서 ASGI로 직접 호출해(네트워크/uvicorn 제외) 설정된 DB(DATABASE_URL)에
+요청을 보낸다. 가상 사용자마다 회원가입/로그인 후 프로젝트와 초기 태스크를 만들고(setup 단계),
+요청 비율(--mix)에 따라 목록 조회/생성/수정을 반복한다(run 단계).
+결과는 실행 간 비교할 수 있도록 JSON으로 출력한다.
+요청당 쿼리 수는 SQL 계측 미들웨어(app/instrumentation.py)의 Server-Timing 헤더에서 읽는다.
+
+벤치마크 사용자(bench-<run id>-N@example.com)와 데이터가 DB에 남으므로 로컬/전용 DB에서만 실행한다.
+응답 캐시 등 설정은 평소처럼 환경 변수로 바꾼다. (예: RESPONSE_CACHE_ENABLED=false)
+
+사용법 (backend 디렉터리에서):
+    python -m scripts.benchmark
+    python -m scripts.benchmark --concurrency 50 --duration 60 --output before.json
+    python -m scripts.benchmark --mix list_tasks=50,create_task=25,update_task=25
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import random
+import re
+import sys
+import time
+import uuid
+from collections import defaultdict
+from datetime import datetime, timezone
+
+import httpx
+
+from app.config import settings
+from app.database import engine, replicas
+from app.main import app
+
+API = "/api/v1"
+
+# run 단계에서 선택할 수 있는 작업과 기본 비율
+OPERATIONS = ("login", "list_projects", "list_tasks", "create_task", "update_task")
+DEFAULT_MIX = "list_projects=20,list_tasks=40,create_task=20,update_task=20"
+
+STATUSES = ("TODO", "IN_PROGRESS", "DONE")
+PRIORITIES = ("LOW", "MEDIUM", "HIGH")
+
+# Server-Timing 헤더의 db 항목: db;dur=<ms>;desc="<N> queries"
+_QUERIES_RE = re.compile(r'db;dur=[\d.]+;desc="(\d+) queries"')
+
+
+def _query_count(response: httpx.Response) -> int:
+    match = _QUERIES_RE.search(response.headers.get("server-timing", ""))
+    return int(match.group(1)) if match else 0
+
+
+def _parse_mix(value: str) -> dict[str, int]:
+    mix: dict[str, int] = {}
+    for part in value.split(","):
+        name, _, weight = part.partition("=")
+        name = name.strip()
+        if name not in OPERATIONS:
+            raise argparse.ArgumentTypeError(
+                f"알 수 없는 작업: {name} (가능: {', '.join(OPERATIONS)})"
+            )
+        mix[name] = int(weight)
+    if not any(mix.values()):
+        raise argparse.ArgumentTypeError("비율 합계가 0입니다")
+    return mix
+
+
+def _percentile(ordered: list[float], p: float) -> float:
+    """정렬된 값의 p 백분위수 (nearest-rank)"""
+    index = max(0, math.ceil(p / 100 * len(ordered)) - 1)
+    return ordered[min(index, len(ordered) - 1)]
+
+
+class PhaseStats:
+    """단계(setup/run)별, 라우트별 측정값"""
+
+    def __init__(self):
+        self.latencies: dict[str, list[float]] = defaultdict(list)
+        self.queries: dict[str, list[int]] = defaultdict(list)
+        self.errors: dict[str, int] = defaultdict(int)
+        self.started = time.perf_counter()
+        self.finished: float | None = None
+
+    def record(self, route: str, elapsed: float, queries: int, ok: bool) -> None:
+        self.latencies[route].append(elapsed)
+        self.queries[route].append(queries)
+        if not ok:
+            self.errors[route] += 1
+
+    def finish(self) -> None:
+        self.finished = time.perf_counter()
+
+    @staticmethod
+    def _summary(latencies: list[float], queries: list[int], errors: int, seconds: float) -> dict:
+        ordered = sorted(latencies)
+        return {
+            "count": len(ordered),
+            "errors": errors,
+            "rps": round(len(ordered) / seconds, 2) if seconds > 0 else None,
+            "latency_ms": {
+                "p50": round(_percentile(ordered, 50) * 1000, 2),
+                "p95": round(_percentile(ordered, 95) * 1000, 2),
+                "p99": round(_percentile(ordered, 99) * 1000, 2),
+                "mean": round(sum(ordered) / len(ordered) * 1000, 2),
+                "max": round(ordered[-1] * 1000, 2),
+            },
+            "queries_per_request": {
+                "mean": round(sum(queries) / len(queries), 2),
+                "max": max(queries),
+            },
+        }
+
+    def report(self) -> dict:
+        seconds = (self.finished or time.perf_counter()) - self.started
+        routes = {
+            route: self._summary(
+                self.latencies[route], self.queries[route], self.errors[route], seconds
+            )
+            for route in sorted(self.latencies)
+        }
+        all_latencies = [v for values in self.latencies.values() for v in values]
+        all_queries = [v for values in self.queries.values() for v in values]
+        return {
+            "seconds": round(seconds, 2),
+            "routes": routes,
+            "total": self._summary(
+                all_latencies, all_queries, sum(self.errors.values()), seconds
+            )
+            if all_latencies
+            else None,
+        }
+
+
+class VirtualUser:
+    """가상 사용자: 자신의 프로젝트 하나에서 작업을 반복한다."""
+
+    def __init__(self, client: httpx.AsyncClient, run_id: str, index: int, seed: int):
+        self.client = client
+        self.email = f"bench-{run_id}-{index}@example.com"
+        self.password = "bench-password"
+        self.rng = random.Random(seed * 100003 + index)
+        self.headers: dict[str, str] = {}
+        self.project_id: str | None = None
+        self.task_ids: list[str] = []
+
+    async def request(
+        self, stats: PhaseStats | None, route: str, method: str, url: str, **kwargs
+    ) -> httpx.Response:
+        """요청을 보내고 지연 시간과 실행된 SQL 문 수를 기록한다. (stats가 None이면 기록하지 않음)"""
+        start = time.perf_counter()
+        response = await self.client.request(method, url, headers=self.headers, **kwargs)
+        elapsed = time.perf_counter() - start
+        if stats is not None:
+            stats.record(route, elapsed, _query_count(response), response.status_code < 400)
+        return response
+
+    async def setup(self, stats: PhaseStats, tasks_per_project: int) -> None:
+        """회원가입, 로그인, 프로젝트 생성 후 초기 태스크를 일괄 생성한다."""
+        await self.request(
+            stats,
+            "register",
+            "POST",
+            f"{API}/auth/register",
+            json={"email": self.email, "password": self.password, "name": "Bench User"},
+        )
+        await self.login(stats)
+        response = await self.request(
+            stats,
+            "create_project",
+            "POST",
+            f"{API}/projects",
+            json={"name": f"Bench {self.email}"},
+        )
+        response.raise_for_status()
+        self.project_id = response.json()["data"]["id"]
+
+        remaining = tasks_per_project
+        while remaining > 0:
+            size = min(remaining, 500)
+            response = await self.request(
+                None,
+                "batch",
+                "POST",
+                f"{API}/projects/{self.project_id}/tasks:batch",
+                json={"create": [self._task_body() for _ in range(size)]},
+            )
+            response.raise_for_status()
+            self.task_ids.extend(
+                r["id"] for r in response.json()["data"]["created"] if r["status"] == "success"
+            )
+            remaining -= size
+
+    async def login(self, stats: PhaseStats | None) -> None:
+        self.headers = {}
+        response = await self.request(
+            stats,
+            "login",
+            "POST",
+            f"{API}/auth/login",
+            json={"email": self.email, "password": self.password},
+        )
+        response.raise_for_status()
+        self.headers = {"Authorization": f"Bearer {response.json()['data']['access_token']}"}
+
+    def _task_body(self) -> dict:
+        return {
+            "title": f"Task {self.rng.randrange(1_000_000)}",
+            "description": "benchmark task",
+            "status": self.rng.choice(STATUSES),
+            "priority": self.rng.choice(PRIORITIES),
+        }
+
+    async def step(self, stats: PhaseStats | None, operation: str) -> None:
+        """작업 하나를 실행한다."""
+        tasks_url = f"{API}/projects/{self.project_id}/tasks"
+        if operation == "login":
+            await self.login(stats)
+        elif operation == "list_projects":
+            await self.request(stats, operation, "GET", f"{API}/projects")
+        elif operation == "list_tasks":
+            params = {"size": 50}
+            if self.rng.random() < 0.5:
+                params["status"] = self.rng.choice(STATUSES)
+            await self.request(stats, operation, "GET", tasks_url, params=params)
+        elif operation == "create_task":
+            response = await self.request(
+                stats, operation, "POST", tasks_url, json=self._task_body()
+            )
+            if response.status_code < 400:
+                self.task_ids.append(response.json()["data"]["id"])
+        elif operation == "update_task" and self.task_ids:
+            task_id = self.rng.choice(self.task_ids)
+            await self.request(
+                stats,
+                operation,
+                "PATCH",
+                f"{tasks_url}/{task_id}",
+                json={
+                    "status": self.rng.choice(STATUSES),
+                    "priority": self.rng.choice(PRIORITIES),
+                },
+            )
+
+
+async def _run(args: argparse.Namespace) -> dict:
+    run_id = uuid.uuid4().hex[:8]
+    operations = list(args.mix)
+    weights = [args.mix[name] for name in operations]
+
+    transport = httpx.ASGITransport(app=app, raise_app_exceptions=False)
+    async with httpx.AsyncClient(transport=transport, base_url="http://benchmark") as client:
+        users = [
+            VirtualUser(client, run_id, i, args.seed) for i in range(args.concurrency)
+        ]
+
+        print(f"[setup] 가상 사용자 {len(users)}명 준비 중...", file=sys.stderr)
+        setup_stats = PhaseStats()
+        await asyncio.gather(*(u.setup(setup_stats, args.tasks_per_project) for u in users))
+        setup_stats.finish()
+
+        print(
+            f"[run] {args.duration:.0f}초 실행 (워밍업 {args.warmup:.0f}초 제외)",
+            file=sys.stderr,
+        )
+        run_stats = PhaseStats()
+        # 워밍업이 끝나는 시점부터 기록하고 처리량을 계산한다
+        run_stats.started = measure_from = time.perf_counter() + args.warmup
+        deadline = measure_from + args.duration
+
+        async def _loop(user: VirtualUser) -> None:
+            while (now := time.perf_counter()) < deadline:
+                operation = user.rng.choices(operations, weights)[0]
+                await user.step(run_stats if now >= measure_from else None, operation)
+
+        await asyncio.gather(*(_loop(u) for u in users))
+        run_stats.finish()
+
+    return {
+        "run_id": run_id,
+        "started_at": datetime.now(timezone.utc).isoformat(),
+        "config": {
+            "concurrency": args.concurrency,
+            "duration": args.duration,
+            "warmup": args.warmup,
+            "tasks_per_project": args.tasks_per_project,
+            "mix": args.mix,
+            "seed": args.seed,
+            "response_cache": settings.RESPONSE_CACHE_ENABLED,
+            "db_pool_size": settings.DB_POOL_SIZE,
+            "replicas": len(replicas.engines),
+        },
+        "setup": setup_stats.report(),
+        "run": run_stats.report(),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="API 부하 테스트")
+    parser.add_argument("--concurrency", type=int, default=20, help="가상 사용자 수")
+    parser.add_argument("--duration", type=float, default=30.0, help="측정 시간 (초)")
+    parser.add_argument("--warmup", type=float, default=5.0, help="측정 전 워밍업 시간 (초)")
+    parser.add_argument(
+        "--tasks-per-project", type=int, default=200, help="가상 사용자별 초기 태스크 수"
+    )
+    parser.add_argument(
+        "--mix",
+        type=_parse_mix,
+        default=_parse_mix(DEFAULT_MIX),
+        help=f"작업=비율 목록 (기본: {DEFAULT_MIX})",
+    )
+    parser.add_argument("--seed", type=int, default=1, help="작업 선택 난수 시드")
+    parser.add_argument("--output", default=None, help="결과 JSON 파일 (기본: 표준 출력)")
+    args = parser.parse_args()
+    if not settings.SQL_INSTRUMENTATION_ENABLED:
+        parser.error("요청당 쿼리 수를 측정하려면 SQL_INSTRUMENTATION_ENABLED가 켜져 있어야 합니다")
+
+    async def _main() -> dict:
+        try:
+            return await _run(args)
+        finally:
+            await engine.dispose()
+            await replicas.dispose()
+
+    result = json.dumps(asyncio.run(_main()), ensure_ascii=False, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(result + "\n")
+    else:
+        print(result)
+
+
+if __name__ == "__main__":
+    main()
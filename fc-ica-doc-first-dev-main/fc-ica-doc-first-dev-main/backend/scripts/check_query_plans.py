@@ -0,0 +1,139 @@
+"""주요 엔드포인트 쿼리의 실행 계획 검사
+
+시드 데이터가 들어 있는 DB에서 각 엔드포인트의 핵심 쿼리를 EXPLAIN하고,
+tasks / project_members 테이블을 순차 스캔(Seq Scan)하는 쿼리가 있으면 실패한다.
+쿼리는 핸들러와 같은 빌더(app/utils/queries.py)로 만들므로 핸들러의 쿼리가 바뀌면 검사 대상도 함께 바뀐다.
+
+사용법 (backend 디렉터리에서):
+    python -m scripts.check_query_plans
+"""
+
+import asyncio
+import json
+import sys
+import uuid
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import func, select, text
+from sqlalchemy.dialects import postgresql
+
+from app.database import async_session, engine
+from app.models.project import ProjectMember
+from app.models.task import Task
+from app.utils.queries import (
+    column_max_position_query,
+    member_exists_query,
+    project_access_query,
+    project_count_query,
+    project_page_query,
+    task_changes_query,
+    task_count_query,
+    task_list_conditions,
+    task_page_query,
+    task_search_query,
+    visible_project_ids_query,
+)
+from app.utils.search import build_tsquery_text
+
+# 검색 쿼리 검사에 사용할 검색어 (시드 데이터 설명에 쓰이는 단어, scripts/seed_dataset.py)
+SEARCH_TERM = "regression"
+
+# 순차 스캔이 허용되지 않는 테이블
+INDEXED_TABLES = {"tasks", "project_members"}
+
+
+def _endpoint_queries(project_id, user_id, assignee_id) -> dict:
+    """엔드포인트별 핵심 쿼리 (핸들러가 사용하는 쿼리 빌더로 만든다)"""
+    all_tasks = task_list_conditions(project_id)
+    since = (datetime.now(timezone.utc) - timedelta(hours=1), uuid.UUID(int=0))
+    tsquery_text = build_tsquery_text(SEARCH_TERM)
+    return {
+        "access_check": project_access_query(project_id, user_id),
+        "list_projects.count": project_count_query(user_id),
+        "list_projects.page": project_page_query(user_id, 21),
+        "list_tasks.count": task_count_query(all_tasks),
+        "list_tasks.by_position": task_page_query(all_tasks, "position", False, 51),
+        "list_tasks.by_status": task_page_query(
+            task_list_conditions(project_id, status="TODO"), "position", False, 51
+        ),
+        "list_tasks.by_created_at": task_page_query(all_tasks, "created_at", True, 51),
+        "list_tasks.by_assignee": task_page_query(
+            task_list_conditions(project_id, assignee_id=assignee_id), "position", False, 51
+        ),
+        "task_changes.initial": task_changes_query(project_id, None, 501),
+        "task_changes.since": task_changes_query(project_id, since, 501),
+        "search_project_tasks": task_search_query(
+            tsquery_text, [Task.project_id == project_id], 21
+        ),
+        "search_tasks": task_search_query(
+            tsquery_text, [Task.project_id.in_(visible_project_ids_query(user_id))], 21
+        ),
+        "create_task.next_position": column_max_position_query(project_id, "TODO"),
+        "assignee_membership": member_exists_query(project_id, assignee_id),
+    }
+
+
+def _seq_scans(plan: dict) -> list[str]:
+    """실행 계획 트리에서 검사 대상 테이블의 Seq Scan 노드를 찾는다."""
+    found = []
+    if plan.get("Node Type") == "Seq Scan" and plan.get("Relation Name") in INDEXED_TABLES:
+        found.append(plan["Relation Name"])
+    for child in plan.get("Plans", []):
+        found.extend(_seq_scans(child))
+    return found
+
+
+async def _run() -> int:
+    async with async_session() as session:
+        # 태스크가 가장 많은 프로젝트와 그 멤버를 검사 대상으로 사용한다
+        row = (
+            await session.execute(
+                select(Task.project_id, func.min(Task.assignee_id.cast(postgresql.TEXT)))
+                .group_by(Task.project_id)
+                .order_by(func.count().desc())
+                .limit(1)
+            )
+        ).one_or_none()
+        if row is None:
+            print("태스크 데이터가 없습니다. 시드 데이터를 먼저 생성하세요. (python -m scripts.seed_dataset)")
+            return 1
+        project_id, assignee_text = row
+        assignee_id = uuid.UUID(assignee_text) if assignee_text else None
+        user_id = (
+            await session.execute(
+                select(ProjectMember.user_id)
+                .where(ProjectMember.project_id == project_id)
+                .limit(1)
+            )
+        ).scalar_one()
+
+        failures = 0
+        for name, stmt in _endpoint_queries(project_id, user_id, assignee_id).items():
+            sql = stmt.compile(
+                dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}
+            )
+            result = await session.execute(text(f"EXPLAIN (FORMAT JSON) {sql}"))
+            plan = result.scalar_one()
+            if isinstance(plan, str):
+                plan = json.loads(plan)
+            scans = _seq_scans(plan[0]["Plan"])
+            status = "FAIL" if scans else "ok"
+            detail = f" (Seq Scan: {', '.join(scans)})" if scans else ""
+            print(f"[{status}] {name}{detail}")
+            failures += bool(scans)
+
+        return 1 if failures else 0
+
+
+def main() -> None:
+    async def _main() -> int:
+        try:
+            return await _run()
+        finally:
+            await engine.dispose()
+
+    sys.exit(asyncio.run(_main()))
+
+
+if __name__ == "__main__":
+    main()
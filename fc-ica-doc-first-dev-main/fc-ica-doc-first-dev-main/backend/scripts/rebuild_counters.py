@@ -0,0 +1,52 @@
+"""프로젝트 카운터 재계산/검증 명령
+
+사용법 (backend 디렉터리에서):
+    python -m scripts.rebuild_counters              # 전체 재계산
+    python -m scripts.rebuild_counters --project-id <uuid>
+    python -m scripts.rebuild_counters --verify     # 불일치만 확인 (수정하지 않음)
+"""
+
+import argparse
+import asyncio
+import sys
+import uuid
+
+from app.database import async_session, engine
+from app.utils.counters import rebuild_project_counters, verify_project_counters
+
+
+async def _run(args: argparse.Namespace) -> int:
+    async with async_session() as session:
+        if args.verify:
+            mismatches = await verify_project_counters(session)
+            for m in mismatches:
+                print(
+                    f"{m['project_id']} {m['column']}: "
+                    f"expected={m['expected']} actual={m['actual']}"
+                )
+            print(f"불일치 {len(mismatches)}건")
+            return 1 if mismatches else 0
+
+        count = await rebuild_project_counters(session, args.project_id)
+        await session.commit()
+        print(f"카운터 {count}건 재계산 완료 (생성되거나 값이 바뀐 행)")
+        return 0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="프로젝트 카운터 재계산/검증")
+    parser.add_argument("--project-id", type=uuid.UUID, default=None)
+    parser.add_argument("--verify", action="store_true")
+    args = parser.parse_args()
+
+    async def _main() -> int:
+        try:
+            return await _run(args)
+        finally:
+            await engine.dispose()
+
+    sys.exit(asyncio.run(_main()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,282 @@
+"""대규모 벤치마크용 데이터셋 생성
+
+사용자/프로젝트/멤버/태스크를 결정적으로(같은 시드 → 같은 데이터) 생성해 COPY로 적재한다.
+프로젝트별 멤버 수와 태스크 수, 사용자별 참여 빈도는 Zipf 분포를 따른다. 즉 소수의 프로젝트에
+태스크가 몰리고(기본 설정에서 가장 큰 프로젝트는 10만 건 이상), 소수의 사용자가 많은 프로젝트에 속한다.
+프로젝트는 0번이 가장 크고 번호가 커질수록 작아진다.
+
+비밀번호 해시는 한 번만 계산해 모든 사용자에게 같은 값을 넣는다. (bcrypt 생략)
+모든 사용자는 user<번호>@example.com / --password 값으로 로그인할 수 있다.
+카운터(project_counters)는 적재 후 원본 테이블에서 재계산하고, 마지막에 ANALYZE를 실행한다.
+
+사용법 (backend 디렉터리에서):
+    python -m scripts.seed_dataset                      # 사용자 5,000 / 프로젝트 1,000 / 태스크 1,000,000
+    python -m scripts.seed_dataset --tasks 5000000 --task-skew 1.2
+    python -m scripts.seed_dataset --reset              # 기존 데이터를 모두 지우고 생성
+"""
+
+import argparse
+import asyncio
+import bisect
+import itertools
+import random
+import sys
+import time
+import uuid
+from collections.abc import Iterable, Iterator
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import func, select, text
+
+from app.database import async_session, engine
+from app.models.project import Project, ProjectCounter, ProjectMember
+from app.models.task import Task
+from app.models.user import User
+from app.utils.auth import hash_password
+from app.utils.counters import rebuild_project_counters
+from app.utils.ranking import RANK_STEP
+
+# COPY 한 번에 보내는 행 수
+COPY_BATCH_SIZE = 50_000
+
+# 생성 데이터의 기준 시각 (결정적 결과를 위해 현재 시각을 쓰지 않는다)
+BASE_TIME = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+STATUS_WEIGHTS = {"TODO": 40, "IN_PROGRESS": 20, "DONE": 40}
+PRIORITY_WEIGHTS = {"LOW": 30, "MEDIUM": 50, "HIGH": 20}
+
+TITLE_VERBS = ["Fix", "Implement", "Review", "Refactor", "Test", "Document", "배포", "검토", "개선"]
+TITLE_NOUNS = [
+    "login flow", "billing page", "search API", "dashboard", "mobile layout",
+    "export job", "알림 설정", "권한 관리", "온보딩 화면", "결제 모듈",
+]
+DESCRIPTION_WORDS = [
+    "customer", "report", "urgent", "backend", "frontend", "release", "regression",
+    "고객", "요청", "확인", "필요", "오류", "일정", "회의",
+]
+
+USER_COLUMNS = ("id", "email", "name", "password_hash", "created_at", "updated_at")
+PROJECT_COLUMNS = (
+    "id", "name", "description", "owner_id", "is_deleted", "created_at", "updated_at",
+)
+MEMBER_COLUMNS = ("id", "project_id", "user_id", "role", "joined_at")
+# search_vector는 생성 컬럼이므로 DB가 채운다
+TASK_COLUMNS = (
+    "id", "project_id", "title", "description", "status", "priority", "position",
+    "assignee_id", "created_by", "is_deleted", "created_at", "updated_at",
+)
+
+
+def _zipf_cum_weights(n: int, skew: float) -> list[float]:
+    """순위 i(0부터)의 가중치가 1 / (i + 1)^skew인 누적 가중치"""
+    return list(itertools.accumulate(1 / (i + 1) ** skew for i in range(n)))
+
+
+def _distribute(total: int, n: int, skew: float) -> list[int]:
+    """total을 Zipf 비율로 n개에 나눈다. (최대 나머지 방식, 합계가 정확히 total)"""
+    weights = [1 / (i + 1) ** skew for i in range(n)]
+    scale = total / sum(weights)
+    counts = [int(w * scale) for w in weights]
+    remainders = sorted(range(n), key=lambda i: counts[i] - weights[i] * scale)
+    for i in remainders[: total - sum(counts)]:
+        counts[i] += 1
+    return counts
+
+
+def _batched(rows: Iterable[tuple], size: int) -> Iterator[list[tuple]]:
+    iterator = iter(rows)
+    while batch := list(itertools.islice(iterator, size)):
+        yield batch
+
+
+class DatasetGenerator:
+    """시드 기반 결정적 데이터 생성기"""
+
+    def __init__(self, args: argparse.Namespace):
+        self.args = args
+        self.rng = random.Random(args.seed)
+        self.start_time = BASE_TIME - timedelta(days=args.days)
+        self.user_ids = [self._uuid() for _ in range(args.users)]
+        self.user_cum_weights = _zipf_cum_weights(args.users, args.member_skew)
+        self.project_ids = [self._uuid() for _ in range(args.projects)]
+        # 프로젝트별 멤버 id (첫 번째가 소유자)
+        self.members: list[list[uuid.UUID]] = []
+
+    def _uuid(self) -> uuid.UUID:
+        return uuid.UUID(int=self.rng.getrandbits(128), version=4)
+
+    def _time(self, fraction: float) -> datetime:
+        """생성 기간(--days) 내의 시각. fraction은 0~1"""
+        return self.start_time + (BASE_TIME - self.start_time) * fraction
+
+    def _pick_user(self) -> int:
+        """참여 빈도(Zipf)에 따라 사용자 인덱스를 고른다."""
+        return bisect.bisect(
+            self.user_cum_weights, self.rng.random() * self.user_cum_weights[-1]
+        )
+
+    def users(self, password_hash: str) -> Iterator[tuple]:
+        for i, user_id in enumerate(self.user_ids):
+            created_at = self._time(i / len(self.user_ids) * 0.5)
+            yield (user_id, f"user{i}@example.com", f"User {i}", password_hash, created_at, created_at)
+
+    def projects_and_members(self) -> tuple[list[tuple], list[tuple]]:
+        """프로젝트와 멤버 행을 만든다. 멤버 수는 프로젝트 순위에 따라 Zipf로 줄어든다."""
+        args = self.args
+        projects: list[tuple] = []
+        members: list[tuple] = []
+        for rank, project_id in enumerate(self.project_ids):
+            size = max(args.min_members, round(args.max_members / (rank + 1) ** args.member_skew))
+            size = min(size, args.users)
+            if size * 2 > args.users:
+                # 사용자 대부분이 속하는 프로젝트는 가중치 없이 뽑는다
+                chosen = self.rng.sample(range(args.users), size)
+            else:
+                chosen = {}
+                while len(chosen) < size:
+                    chosen.setdefault(self._pick_user())
+            member_ids = [self.user_ids[i] for i in chosen]
+            self.members.append(member_ids)
+
+            created_at = self._time(0.5 + rank / len(self.project_ids) * 0.1)
+            projects.append(
+                (project_id, f"Project {rank}", f"Benchmark project #{rank}",
+                 member_ids[0], False, created_at, created_at)
+            )
+            for j, user_id in enumerate(member_ids):
+                members.append(
+                    (self._uuid(), project_id, user_id, "owner" if j == 0 else "member",
+                     created_at + timedelta(minutes=j))
+                )
+        return projects, members
+
+    def tasks(self) -> Iterator[tuple]:
+        """프로젝트별 태스크 행. 태스크 수는 프로젝트 순위에 따라 Zipf로 줄어든다."""
+        args = self.args
+        rng = self.rng
+        statuses, status_weights = list(STATUS_WEIGHTS), list(STATUS_WEIGHTS.values())
+        priorities, priority_weights = list(PRIORITY_WEIGHTS), list(PRIORITY_WEIGHTS.values())
+        counts = _distribute(args.tasks, len(self.project_ids), args.task_skew)
+
+        for project_id, member_ids, count in zip(self.project_ids, self.members, counts):
+            positions = dict.fromkeys(statuses, 0.0)
+            task_statuses = rng.choices(statuses, status_weights, k=count)
+            task_priorities = rng.choices(priorities, priority_weights, k=count)
+            for i in range(count):
+                status = task_statuses[i]
+                positions[status] += RANK_STEP
+                created_at = self._time(0.6 + (i + rng.random()) / count * 0.4)
+                updated_at = (
+                    created_at
+                    if status == "TODO"
+                    else created_at + (BASE_TIME - created_at) * rng.random()
+                )
+                description = (
+                    " ".join(rng.choices(DESCRIPTION_WORDS, k=rng.randint(5, 30)))
+                    if rng.random() < 0.7
+                    else None
+                )
+                yield (
+                    self._uuid(),
+                    project_id,
+                    f"{rng.choice(TITLE_VERBS)} {rng.choice(TITLE_NOUNS)} #{i}",
+                    description,
+                    status,
+                    task_priorities[i],
+                    positions[status],
+                    rng.choice(member_ids) if rng.random() < args.assigned_ratio else None,
+                    rng.choice(member_ids),
+                    rng.random() < args.deleted_ratio,
+                    created_at,
+                    updated_at,
+                )
+
+
+async def _copy(driver, table: str, columns: tuple[str, ...], rows: Iterable[tuple]) -> int:
+    """행을 COPY_BATCH_SIZE씩 나눠 COPY로 적재하고 진행 상황을 출력한다."""
+    total = 0
+    started = time.perf_counter()
+    for batch in _batched(rows, COPY_BATCH_SIZE):
+        await driver.copy_records_to_table(table, records=batch, columns=columns)
+        total += len(batch)
+        print(f"\r{table}: {total:,}행", end="", flush=True)
+    print(f"\r{table}: {total:,}행 ({time.perf_counter() - started:.1f}초)")
+    return total
+
+
+async def _run(args: argparse.Namespace) -> int:
+    generator = DatasetGenerator(args)
+    # 모든 사용자가 같은 비밀번호를 쓰므로 bcrypt는 한 번만 실행한다
+    password_hash = hash_password(args.password)
+
+    async with async_session() as session:
+        # 대량 적재 중 WAL flush를 기다리지 않는다 (이 트랜잭션에만 적용, 트랜잭션 시작)
+        await session.execute(text("SET LOCAL synchronous_commit = off"))
+        if args.reset:
+            await session.execute(
+                text(
+                    f"TRUNCATE {Task.__tablename__}, {ProjectCounter.__tablename__}, "
+                    f"{ProjectMember.__tablename__}, {Project.__tablename__}, "
+                    f"{User.__tablename__} CASCADE"
+                )
+            )
+        elif await session.scalar(select(func.count()).select_from(User)):
+            print("이미 사용자 데이터가 있습니다. 빈 DB를 사용하거나 --reset을 지정하세요.")
+            return 1
+
+        # 세션과 같은 커넥션(같은 트랜잭션)에서 COPY를 실행한다
+        connection = await session.connection()
+        driver = (await connection.get_raw_connection()).driver_connection
+
+        started = time.perf_counter()
+        await _copy(driver, User.__tablename__, USER_COLUMNS, generator.users(password_hash))
+        projects, members = generator.projects_and_members()
+        await _copy(driver, Project.__tablename__, PROJECT_COLUMNS, projects)
+        await _copy(driver, ProjectMember.__tablename__, MEMBER_COLUMNS, members)
+        await _copy(driver, Task.__tablename__, TASK_COLUMNS, generator.tasks())
+
+        count = await rebuild_project_counters(session)
+        print(f"카운터 {count}건 재계산")
+        await session.commit()
+
+    # 새 데이터로 통계를 갱신해야 실행 계획이 실제 분포를 반영한다
+    async with engine.connect() as conn:
+        await conn.execute(text("ANALYZE"))
+        await conn.commit()
+
+    print(f"완료 ({time.perf_counter() - started:.1f}초)")
+    return 0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="대규모 벤치마크용 데이터셋 생성")
+    parser.add_argument("--users", type=int, default=5000)
+    parser.add_argument("--projects", type=int, default=1000)
+    parser.add_argument("--tasks", type=int, default=1_000_000, help="전체 태스크 수")
+    parser.add_argument("--max-members", type=int, default=200, help="가장 큰 프로젝트의 멤버 수")
+    parser.add_argument("--min-members", type=int, default=2, help="프로젝트당 최소 멤버 수")
+    parser.add_argument(
+        "--member-skew", type=float, default=1.0, help="멤버 수/사용자 참여 빈도 Zipf 지수"
+    )
+    parser.add_argument("--task-skew", type=float, default=1.0, help="프로젝트별 태스크 수 Zipf 지수")
+    parser.add_argument("--assigned-ratio", type=float, default=0.8, help="담당자가 있는 태스크 비율")
+    parser.add_argument("--deleted-ratio", type=float, default=0.02, help="삭제된 태스크 비율")
+    parser.add_argument("--days", type=int, default=365, help="생성 시각 분포 기간 (일)")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--password", default="password123", help="모든 사용자의 비밀번호")
+    parser.add_argument("--reset", action="store_true", help="기존 데이터를 모두 삭제하고 생성")
+    args = parser.parse_args()
+    if args.users < 1 or args.projects < 1:
+        parser.error("--users와 --projects는 1 이상이어야 합니다")
+
+    async def _main() -> int:
+        try:
+            return await _run(args)
+        finally:
+            await engine.dispose()
+
+    sys.exit(asyncio.run(_main()))
+
+
+if __name__ == "__main__":
+    main()
@@ -21,6 +21,9 @@ function getToken(): string | null {
   return localStorage.getItem("access_token");
 }
 
+// 쓰기 응답의 read-your-writes 표식. 다음 요청에 돌려보내면 만료 전까지 읽기가 primary로 간다
+let readAfter: string | null = null;
+
 async function request<T>(
   path: string,
   options: RequestInit = {}
@@ -33,12 +36,20 @@ async function request<T>(
   if (token) {
     headers["Authorization"] = `Bearer ${token}`;
   }
+  if (readAfter) {
+    headers["X-Read-After"] = readAfter;
+  }
 
   const res = await fetch(`${API_BASE}${path}`, {
     ...options,
     headers,
   });
 
+  const marker = res.headers.get("X-Read-After");
+  if (marker) {
+    readAfter = marker;
+  }
+
   if (res.status === 204) {
     return undefined as T;
   }
@@ -85,9 +85,10 @@ export interface ApiError {
 
 export interface PaginatedData<T> {
   items: T[];
-  total: number;
-  page: number;
+  total: number | null;
+  page: number | null;
   size: number;
+  next_cursor: string | null;
 }
 
 export type PaginatedResponse<T> = ApiResponse<PaginatedData<T>>;